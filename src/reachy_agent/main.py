@@ -211,6 +211,7 @@ async def run_voice_mode(agent: ReachyAgentLoop, config: dict | None = None) ->
             voice_config.audio = AudioConfig(
                 sample_rate=audio_cfg.get("sample_rate", 16000),
                 channels=audio_cfg.get("channels", 1),
+                capture_channels=audio_cfg.get("capture_channels", 1),
                 chunk_size=audio_cfg.get("chunk_size", 512),
                 format_bits=audio_cfg.get("format_bits", 16),
                 input_device_index=audio_cfg.get("input_device_index"),
@@ -219,6 +220,8 @@ async def run_voice_mode(agent: ReachyAgentLoop, config: dict | None = None) ->
                 retry_delay_seconds=audio_cfg.get("retry_delay_seconds", 1.0),
                 output_lead_in_ms=audio_cfg.get("output_lead_in_ms", 200),
                 input_warmup_chunks=audio_cfg.get("input_warmup_chunks", 5),
+                buffer_latency_ms=audio_cfg.get("buffer_latency_ms", 1000),
+                audio_cpu=audio_cfg.get("audio_cpu"),
             )
             log.info(
                 "Voice audio config loaded",
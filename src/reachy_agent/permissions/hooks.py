@@ -7,11 +7,13 @@ tier system defined in TECH_REQ.md.
 from __future__ import annotations
 
 import asyncio
+import itertools
+import os
+import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
-from uuid import uuid4
 
 from reachy_agent.permissions.tiers import (
     PermissionEvaluator,
@@ -24,6 +26,30 @@ if TYPE_CHECKING:
 
 log = get_logger(__name__)
 
+_execution_counter = itertools.count()
+_pid = os.getpid()
+
+
+def _reset_pid_after_fork() -> None:
+    global _pid
+    _pid = os.getpid()
+
+
+os.register_at_fork(after_in_child=_reset_pid_after_fork)
+
+
+def next_execution_id() -> str:
+    """Generate a unique, time-sortable ID for an audit record.
+
+    Audit IDs only need to be unique, not unpredictable, so this avoids
+    the CSPRNG read behind ``uuid4()``. IDs sort by creation time, which
+    keeps inserts into the audit table's primary key index sequential.
+
+    Returns:
+        ID of the form ``<time_ns hex>-<pid hex>-<counter hex>``.
+    """
+    return f"{time.time_ns():016x}-{_pid:x}-{next(_execution_counter):x}"
+
 
 @dataclass
 class ToolExecution:
@@ -32,13 +58,13 @@ class ToolExecution:
     Matches the ToolExecution schema in TECH_REQ.md.
     """
 
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=next_execution_id)
     timestamp: datetime = field(default_factory=datetime.now)
     tool_name: str = ""
     tool_input: dict[str, Any] = field(default_factory=dict)
     permission_tier: int = 0
     decision: str = ""  # allowed, notified, confirmed, denied
-    result: str = ""  # success, error, timeout
+    result: str = ""  # success, error, timeout, incomplete
     duration_ms: int = 0
 
 
@@ -66,6 +92,10 @@ class PermissionHooks:
 
     Provides PreToolUse and PostToolUse hook implementations that
     enforce the permission tier system.
+
+    The owner must shut the hooks down so interrupted tool calls reach
+    the audit log, either with ``async with PermissionHooks(...)`` or by
+    awaiting ``close()`` in a ``finally``.
     """
 
     def __init__(
@@ -124,13 +154,14 @@ class PermissionHooks:
             reason=decision.reason,
         )
 
-        # Create audit record
+        # Create audit record. It is only written once the execution is
+        # complete (denied here, or finished in post_tool_use), so each
+        # tool call produces a single audit insert.
         execution = ToolExecution(
             tool_name=tool_name,
             tool_input=tool_input,
             permission_tier=decision.tier.value,
         )
-        self._pending_executions[execution.id] = execution
 
         # Handle based on tier
         if decision.tier == PermissionTier.FORBIDDEN:
@@ -181,6 +212,7 @@ class PermissionHooks:
             execution.decision = "allowed"
 
         # Store execution ID for post-hook correlation
+        self._pending_executions[execution.id] = execution
         return {"_execution_id": execution.id}
 
     async def post_tool_use(
@@ -236,6 +268,42 @@ class PermissionHooks:
             duration_ms=execution.duration_ms,
         )
 
+    async def flush_pending(self) -> int:
+        """Log executions that never reached post_tool_use.
+
+        Called by ``close()`` and on ``async with`` exit, so tool calls
+        interrupted mid-execution still appear in the audit log.
+
+        Returns:
+            Number of pending executions flushed.
+        """
+        pending = list(self._pending_executions.values())
+        self._pending_executions.clear()
+
+        for execution in pending:
+            execution.result = "incomplete"
+            execution.duration_ms = int(
+                (datetime.now() - execution.timestamp).total_seconds() * 1000
+            )
+            await self._log_execution(execution)
+
+        if pending:
+            log.info("Flushed pending tool executions", count=len(pending))
+
+        return len(pending)
+
+    async def close(self) -> None:
+        """Shut down the hooks, flushing unfinished executions to the audit log."""
+        await self.flush_pending()
+
+    async def __aenter__(self) -> PermissionHooks:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Async context manager exit - flushes pending executions."""
+        await self.close()
+
     async def _request_confirmation(
         self,
         tool_name: str,
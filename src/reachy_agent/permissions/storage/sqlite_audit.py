@@ -9,16 +9,23 @@ from __future__ import annotations
 import asyncio
 import json
 import sqlite3
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
-from uuid import uuid4
 
 from reachy_agent.utils.logging import get_logger
 
 log = get_logger(__name__)
 
+_INSERT_SQL = """
+    INSERT INTO tool_executions
+    (id, timestamp, tool_name, tool_input, permission_tier,
+     decision, result, duration_ms, error_code)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 @dataclass
 class AuditRecord:
@@ -76,6 +83,21 @@ class AuditRecord:
         )
 
 
+def _row_tuple(record: AuditRecord) -> tuple[Any, ...]:
+    """Convert an AuditRecord to an INSERT parameter tuple."""
+    return (
+        record.id,
+        record.timestamp.isoformat(),
+        record.tool_name,
+        json.dumps(record.tool_input),
+        record.permission_tier,
+        record.decision,
+        record.result,
+        record.duration_ms,
+        record.error_code,
+    )
+
+
 class SQLiteAuditStorage:
     """SQLite-based audit log storage.
 
@@ -87,11 +109,13 @@ class SQLiteAuditStorage:
 
     Example:
         ```python
+        from reachy_agent.permissions.hooks import next_execution_id
+
         storage = SQLiteAuditStorage()
 
         # Store a record
         await storage.store(AuditRecord(
-            id=str(uuid4()),
+            id=next_execution_id(),
             timestamp=datetime.now(),
             tool_name="mcp__reachy__move_head",
             tool_input={"direction": "left"},
@@ -126,13 +150,13 @@ class SQLiteAuditStorage:
             retention_days: Number of days to retain records.
         """
         self.db_path = Path(db_path).expanduser()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.retention_days = retention_days
         self._initialized = False
         self._lock = asyncio.Lock()
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection (creates DB if needed)."""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row
         return conn
@@ -193,25 +217,7 @@ class SQLiteAuditStorage:
         self._init_db()
 
         with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO tool_executions
-                (id, timestamp, tool_name, tool_input, permission_tier,
-                 decision, result, duration_ms, error_code)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    record.id,
-                    record.timestamp.isoformat(),
-                    record.tool_name,
-                    json.dumps(record.tool_input),
-                    record.permission_tier,
-                    record.decision,
-                    record.result,
-                    record.duration_ms,
-                    record.error_code,
-                ),
-            )
+            conn.execute(_INSERT_SQL, _row_tuple(record))
             conn.commit()
 
         log.debug(
@@ -221,6 +227,33 @@ class SQLiteAuditStorage:
             decision=record.decision,
         )
 
+    async def store_many(self, records: Iterable[AuditRecord]) -> None:
+        """Store multiple audit records in a single transaction.
+
+        Rows are encoded lazily as ``executemany`` consumes them, so the
+        batch is never materialized as a second list of tuples.
+
+        Args:
+            records: The audit records to store.
+        """
+        async with self._lock:
+            await asyncio.get_event_loop().run_in_executor(
+                None, self._store_many_sync, records
+            )
+
+    def _store_many_sync(self, records: Iterable[AuditRecord]) -> None:
+        """Synchronous store_many operation."""
+        self._init_db()
+
+        with self._get_connection() as conn:
+            cursor = conn.executemany(
+                _INSERT_SQL, (_row_tuple(record) for record in records)
+            )
+            count = cursor.rowcount
+            conn.commit()
+
+        log.debug("Stored audit records", count=count)
+
     async def update(
         self,
         record_id: str,
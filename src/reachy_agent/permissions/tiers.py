@@ -10,12 +10,15 @@ Implements a 4-tier permission system as defined in TECH_REQ.md:
 from __future__ import annotations
 
 import fnmatch
-from dataclasses import dataclass
+import functools
+import re
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from enum import IntEnum
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import BaseModel, Field
 
 
@@ -31,7 +34,7 @@ class PermissionTier(IntEnum):
     FORBIDDEN = 4  # Never execute, explain why
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TierBehavior:
     """Behavior configuration for a permission tier."""
 
@@ -67,17 +70,52 @@ TIER_BEHAVIORS: dict[PermissionTier, TierBehavior] = {
 }
 
 
-class PermissionRule(BaseModel):
-    """A single permission rule matching tools to tiers."""
+_INT_TO_TIER: dict[int, PermissionTier] = {tier.value: tier for tier in PermissionTier}
+
+
+def _validate_tier(tier: int) -> None:
+    """Raise ValueError if a config tier number is out of range."""
+    if tier not in _INT_TO_TIER:
+        raise ValueError(f"tier must be between 1 and 4, got {tier!r}")
+
 
-    pattern: str = Field(description="Tool name pattern with wildcards")
-    tier: int = Field(ge=1, le=4, description="Permission tier (1-4)")
-    reason: str = Field(description="Human-readable reason for this tier")
+@dataclass(frozen=True, slots=True)
+class PermissionRule:
+    """A single permission rule matching tools to tiers.
+
+    Rules are loaded once and read on every evaluation, so they are
+    plain slotted dataclasses rather than Pydantic models. Pydantic
+    still validates them when they are nested in a PermissionConfig.
+
+    Attributes:
+        pattern: Tool name pattern with wildcards.
+        tier: Permission tier (1-4).
+        reason: Human-readable reason for this tier.
+        permission_tier: The tier as an enum, resolved at construction.
+        behavior: The tier's behavior, resolved at construction.
+    """
+
+    pattern: str
+    tier: int
+    reason: str
+    permission_tier: PermissionTier = field(init=False, repr=False, compare=False)
+    behavior: TierBehavior = field(init=False, repr=False, compare=False)
+    _regex: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        _validate_tier(self.tier)
+        # Resolve once so evaluate() never converts int -> enum -> behavior
+        tier = _INT_TO_TIER[self.tier]
+        object.__setattr__(self, "permission_tier", tier)
+        object.__setattr__(self, "behavior", TIER_BEHAVIORS[tier])
+        object.__setattr__(self, "_regex", re.compile(fnmatch.translate(self.pattern)))
 
     def matches(self, tool_name: str) -> bool:
         """Check if this rule matches a tool name.
 
         Supports glob-style wildcards (* matches any characters).
+        Matching is case-sensitive and uses the pattern's regex compiled
+        at construction.
 
         Args:
             tool_name: The tool name to check.
@@ -85,21 +123,20 @@ class PermissionRule(BaseModel):
         Returns:
             True if the pattern matches the tool name.
         """
-        return fnmatch.fnmatch(tool_name, self.pattern)
-
-    @property
-    def permission_tier(self) -> PermissionTier:
-        """Get the permission tier as an enum."""
-        return PermissionTier(self.tier)
+        return self._regex.match(tool_name) is not None
 
 
-class TierDefinition(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TierDefinition:
     """Definition of a permission tier from config."""
 
-    tier: int = Field(ge=1, le=4)
+    tier: int
     name: str
     description: str
-    behavior: dict[str, Any] = Field(default_factory=dict)
+    behavior: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        _validate_tier(self.tier)
 
 
 class PermissionConfig(BaseModel):
@@ -118,6 +155,8 @@ class PermissionConfig(BaseModel):
         Returns:
             Validated PermissionConfig instance.
         """
+        import yaml
+
         with open(path) as f:
             data = yaml.safe_load(f) or {}
         return cls.model_validate(data)
@@ -321,9 +360,25 @@ def _default_rules() -> list[PermissionRule]:
     ]
 
 
-@dataclass
+@functools.cache
+def _default_config() -> PermissionConfig:
+    """Get the shared default configuration for evaluators.
+
+    Building PermissionConfig.default() validates every tier and rule
+    model, so evaluators created without a config share one instance.
+    Evaluators copy the rule list, so add_rule/remove_rule never touch
+    this shared config.
+    """
+    return PermissionConfig.default()
+
+
+@dataclass(frozen=True, slots=True)
 class PermissionDecision:
-    """Result of a permission check."""
+    """Result of a permission check.
+
+    Decisions are immutable because the evaluator caches and shares
+    them across calls.
+    """
 
     tool_name: str
     tier: PermissionTier
@@ -347,6 +402,82 @@ class PermissionDecision:
         return self.behavior.notify_user
 
 
+_SEGMENT_SEPARATOR = "__"
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+def _compile_union(rules: list[tuple[int, PermissionRule]]) -> re.Pattern[str] | None:
+    """Compile indexed rules into a single alternation regex.
+
+    Each rule becomes a named group ``rN`` (N = its index in the
+    evaluator's rule list). The regex engine tries alternatives left to
+    right, so the first group that matches the whole name is the first
+    matching rule, found in one C-level scan instead of one ``fnmatch``
+    call per rule.
+    """
+    if not rules:
+        return None
+    return re.compile("|".join(f"(?P<r{i}>{rule._regex.pattern})" for i, rule in rules))
+
+
+@dataclass
+class _RuleTrieNode:
+    """Node in the ``__``-segmented rule index.
+
+    Attributes:
+        children: Child nodes keyed by the next literal segment.
+        rules: Rules whose literal segment prefix ends at this node.
+        union: Compiled regex over the rules on the path from the root
+            to this node, in rule-priority order.
+    """
+
+    children: dict[str, _RuleTrieNode] = field(default_factory=dict)
+    rules: list[tuple[int, PermissionRule]] = field(default_factory=list)
+    union: re.Pattern[str] | None = None
+
+
+def _literal_prefix(pattern: str) -> list[str]:
+    """Get the leading literal ``__`` segments of a rule pattern.
+
+    Only segments followed by a separator count, so any tool name the
+    pattern matches is guaranteed to split into the same leading
+    segments.
+    """
+    prefix = []
+    for segment in pattern.split(_SEGMENT_SEPARATOR)[:-1]:
+        if _WILDCARD_CHARS.intersection(segment):
+            break
+        prefix.append(segment)
+    return prefix
+
+
+def _build_rule_trie(rules: list[tuple[int, PermissionRule]]) -> _RuleTrieNode:
+    """Index rules in a trie keyed on their literal ``__`` segments.
+
+    Tool names follow ``mcp__<service>__<tool>``, so walking the trie
+    with a tool name's segments narrows the candidates to the rules
+    that share its literal prefix (e.g. only ``mcp__github__*`` rules
+    for a GitHub tool) before any pattern matching runs.
+    """
+    root = _RuleTrieNode()
+    for i, rule in rules:
+        node = root
+        for segment in _literal_prefix(rule.pattern):
+            node = node.children.setdefault(segment, _RuleTrieNode())
+        node.rules.append((i, rule))
+
+    def compile_node(
+        node: _RuleTrieNode, inherited: list[tuple[int, PermissionRule]]
+    ) -> None:
+        path_rules = sorted(inherited + node.rules, key=lambda item: item[0])
+        node.union = _compile_union(path_rules)
+        for child in node.children.values():
+            compile_node(child, path_rules)
+
+    compile_node(root, [])
+    return root
+
+
 class PermissionEvaluator:
     """Evaluates tool permissions against configured rules."""
 
@@ -361,30 +492,122 @@ class PermissionEvaluator:
             config: Permission configuration. Uses defaults if None.
             default_tier: Default tier for unmatched tools.
         """
-        self.config = config or PermissionConfig.default()
+        self.config = config or _default_config()
         self.default_tier = default_tier
-        self._rules = self.config.rules
+        self._rules = list(self.config.rules)
+        # Agents call the same few tools repeatedly, so decisions are
+        # memoized per tool name until the rule list changes.
+        self._cache = functools.lru_cache(maxsize=1024)(self._evaluate_uncached)
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild every structure derived from the rule list.
+
+        This is the single invalidation point for the pattern index,
+        literal dict, trie, and decision cache; call it after any change
+        to ``_rules``.
+
+        Literal patterns (no wildcards) can only match the identical tool
+        name, so they are resolved up front into a dict. Only wildcard
+        patterns go into the trie. A literal still loses to an earlier
+        wildcard rule that matches it, so first-match priority holds.
+        """
+        self._pattern_index: dict[str, list[int]] = defaultdict(list)
+        literals: dict[str, tuple[int, PermissionRule]] = {}
+        wildcards: list[tuple[int, PermissionRule]] = []
+        for i, rule in enumerate(self._rules):
+            self._pattern_index[rule.pattern].append(i)
+            if _WILDCARD_CHARS.isdisjoint(rule.pattern):
+                literals.setdefault(rule.pattern, (i, rule))
+            else:
+                wildcards.append((i, rule))
+
+        self._trie = _build_rule_trie(wildcards)
+        self._literal: dict[str, PermissionRule] = {}
+        for name, (i, rule) in literals.items():
+            j = self._match_wildcard(name)
+            self._literal[name] = self._rules[j] if j is not None and j < i else rule
+
+        self._cache.cache_clear()
+
+    def _match_wildcard(self, tool_name: str) -> int | None:
+        """Find the index of the first wildcard rule matching a tool name."""
+        union = self._candidates(tool_name)
+        match = union.match(tool_name) if union else None
+        if match and match.lastgroup:
+            return int(match.lastgroup[1:])
+        return None
+
+    def _candidates(self, tool_name: str) -> re.Pattern[str] | None:
+        """Find the compiled rule union for a tool name's literal prefix.
+
+        Segments are peeled off one at a time and the walk stops at the
+        first miss or leaf, so names outside every indexed prefix (e.g.
+        anything not starting with ``mcp__``) cost a single dict lookup
+        and never split the rest of the name.
+        """
+        node = self._trie
+        rest = tool_name
+        sep = _SEGMENT_SEPARATOR
+        while children := node.children:
+            segment, separator, rest = rest.partition(sep)
+            if not separator:
+                break
+            child = children.get(segment)
+            if child is None:
+                break
+            node = child
+        return node.union
 
     def evaluate(self, tool_name: str) -> PermissionDecision:
         """Evaluate permissions for a tool.
 
+        Repeat calls for the same tool name return the same cached
+        decision instance.
+
         Args:
             tool_name: Name of the tool to check.
 
         Returns:
             PermissionDecision with tier, behavior, and reason.
         """
-        # Find first matching rule
-        for rule in self._rules:
-            if rule.matches(tool_name):
-                tier = rule.permission_tier
-                return PermissionDecision(
-                    tool_name=tool_name,
-                    tier=tier,
-                    behavior=TIER_BEHAVIORS[tier],
-                    reason=rule.reason,
-                    matched_rule=rule,
-                )
+        return self._cache(tool_name)
+
+    def evaluate_many(self, tool_names: Sequence[str]) -> list[PermissionDecision]:
+        """Evaluate permissions for a batch of tools.
+
+        Duplicate names are evaluated once and share the compiled rule
+        index and decision cache with ``evaluate``. Evaluation stays on
+        the calling thread: ``re`` matching holds the GIL, so a thread
+        pool adds dispatch overhead without any parallel speedup.
+
+        Args:
+            tool_names: Names of the tools to check.
+
+        Returns:
+            One PermissionDecision per input name, in input order.
+        """
+        cache = self._cache
+        decisions = {name: cache(name) for name in dict.fromkeys(tool_names)}
+        return [decisions[name] for name in tool_names]
+
+    def _evaluate_uncached(self, tool_name: str) -> PermissionDecision:
+        """Evaluate permissions for a tool without the decision cache."""
+        # Find first matching rule: exact names first, then wildcards
+        rule = self._literal.get(tool_name)
+        if rule is None:
+            index = self._match_wildcard(tool_name)
+            if index is not None:
+                rule = self._rules[index]
+
+        if rule is not None:
+            return PermissionDecision(
+                tool_name=tool_name,
+                tier=rule.permission_tier,
+                behavior=rule.behavior,
+                reason=rule.reason,
+                matched_rule=rule,
+            )
 
         # No matching rule - use default tier
         return PermissionDecision(
@@ -403,6 +626,7 @@ class PermissionEvaluator:
             priority: Position in rule list (0 = highest priority).
         """
         self._rules.insert(priority, rule)
+        self._rebuild_indexes()
 
     def remove_rule(self, pattern: str) -> bool:
         """Remove rules matching a pattern.
@@ -413,6 +637,11 @@ class PermissionEvaluator:
         Returns:
             True if any rules were removed.
         """
-        original_count = len(self._rules)
-        self._rules = [r for r in self._rules if r.pattern != pattern]
-        return len(self._rules) < original_count
+        indices = self._pattern_index.get(pattern)
+        if not indices:
+            return False
+
+        for i in reversed(indices):
+            del self._rules[i]
+        self._rebuild_indexes()
+        return True
@@ -1,11 +1,29 @@
 """Simulation module for Reachy Agent.
 
 Provides MuJoCo-based simulation for testing without physical hardware.
+
+Exports are resolved lazily so importing e.g. ``SimulationConfig`` does
+not pull in httpx through the client and adapter modules.
 """
 
-from .adapter import SimulationAdapter, create_simulation_adapter
-from .daemon_launcher import SimulationConfig, SimulationDaemon, SimulationScene
-from .reachy_client import ReachyMiniClient
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .adapter import SimulationAdapter, create_simulation_adapter
+    from .daemon_launcher import SimulationConfig, SimulationDaemon, SimulationScene
+    from .reachy_client import ReachyMiniClient
+
+_EXPORTS = {
+    "SimulationAdapter": ".adapter",
+    "create_simulation_adapter": ".adapter",
+    "SimulationConfig": ".daemon_launcher",
+    "SimulationDaemon": ".daemon_launcher",
+    "SimulationScene": ".daemon_launcher",
+    "ReachyMiniClient": ".reachy_client",
+}
 
 __all__ = [
     "SimulationAdapter",
@@ -15,3 +33,13 @@ __all__ = [
     "ReachyMiniClient",
     "create_simulation_adapter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
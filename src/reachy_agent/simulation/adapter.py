@@ -9,10 +9,12 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+import httpx
+
 from reachy_agent.utils.logging import get_logger
 
 from .daemon_launcher import SimulationConfig, SimulationDaemon, SimulationScene
-from .reachy_client import ReachyMiniClient
+from .reachy_client import DEFAULT_HEADERS, ReachyMiniClient
 
 if TYPE_CHECKING:
     pass
@@ -38,11 +40,16 @@ class SimulationAdapter:
     1. Starts the Reachy Mini daemon in MuJoCo simulation mode
     2. Provides a ReachyMiniClient connected to the simulation
     3. Cleans up on exit
+
+    The daemon's health checks and the client share one pooled
+    ``httpx.AsyncClient``, so there is a single set of keep-alive
+    connections to the daemon.
     """
 
     config: SimulationConfig = field(default_factory=SimulationConfig)
     _daemon: SimulationDaemon = field(init=False, repr=False)
     _client: ReachyMiniClient | None = field(default=None, init=False, repr=False)
+    _http: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize the daemon wrapper."""
@@ -80,8 +87,22 @@ class SimulationAdapter:
         This launches the MuJoCo simulation daemon and creates a client.
         """
         log.info("Starting simulation adapter")
-        await self._daemon.start()
-        self._client = ReachyMiniClient(base_url=self._daemon.base_url)
+        self._http = httpx.AsyncClient(
+            base_url=self._daemon.base_url,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            headers=DEFAULT_HEADERS,
+        )
+        self._daemon.http_client = self._http
+        try:
+            await self._daemon.start()
+        except BaseException:
+            await self._close_http()
+            raise
+        self._client = ReachyMiniClient(
+            base_url=self._daemon.base_url,
+            http_client=self._http,
+        )
         log.info("Simulation adapter ready", url=self.base_url)
 
     async def stop(self) -> None:
@@ -93,8 +114,16 @@ class SimulationAdapter:
             self._client = None
 
         await self._daemon.stop()
+        await self._close_http()
         log.info("Simulation adapter stopped")
 
+    async def _close_http(self) -> None:
+        """Close the shared HTTP client."""
+        self._daemon.http_client = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     async def restart(self) -> None:
         """Restart the simulation."""
         await self.stop()
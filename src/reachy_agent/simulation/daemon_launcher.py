@@ -7,22 +7,25 @@ This provides a physics-accurate simulation for testing without hardware.
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
+import random
 import shutil
 import subprocess
 import sys
-import time
+import tempfile
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING
-
-import httpx
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
 
 from reachy_agent.utils.logging import get_logger
 
 if TYPE_CHECKING:
     from asyncio import Task
 
+    import httpx
+
 log = get_logger(__name__)
 
 
@@ -42,7 +45,54 @@ class SimulationConfig:
     host: str = "127.0.0.1"
     port: int = 8000
     startup_timeout: float = 30.0  # seconds to wait for daemon startup
-    health_check_interval: float = 0.5  # seconds between health checks
+    health_check_interval: float = 0.5  # max seconds between health checks
+    health_check_initial_interval: float = 0.025  # first backoff delay
+    health_check_backoff: float = 1.5  # delay multiplier per failed check
+
+
+# Early startup probes use a short timeout so a slow first response
+# does not stall polling; later probes fall back to the client default.
+_FAST_PROBE_COUNT = 3
+_FAST_PROBE_TIMEOUT = 0.5
+_HEALTH_CHECK_TIMEOUT = 2.0
+
+
+@functools.cache
+def _find_mjpython() -> str | None:
+    """Locate the mjpython launcher (cached for the process lifetime).
+
+    Returns:
+        Path to mjpython, or None if it is not installed.
+    """
+    # PATH first, then common Homebrew locations
+    candidates = (
+        shutil.which("mjpython"),
+        "/opt/homebrew/bin/mjpython",
+        "/usr/local/bin/mjpython",
+    )
+    return next((p for p in candidates if p and os.access(p, os.X_OK)), None)
+
+
+@functools.lru_cache(maxsize=8)
+def _mjpython_pythonpath(current_pythonpath: str) -> str:
+    """Build the PYTHONPATH that lets mjpython import venv packages.
+
+    Prepends the current interpreter's site-packages so mjpython can find
+    installed packages like reachy_mini. Cached per input PYTHONPATH
+    since site-packages never change within a process.
+
+    Args:
+        current_pythonpath: The PYTHONPATH inherited from the environment.
+
+    Returns:
+        PYTHONPATH value for the mjpython subprocess.
+    """
+    import site
+
+    new_pythonpath = os.pathsep.join(site.getsitepackages())
+    if current_pythonpath:
+        new_pythonpath = f"{new_pythonpath}{os.pathsep}{current_pythonpath}"
+    return new_pythonpath
 
 
 @dataclass
@@ -64,10 +114,23 @@ class SimulationDaemon:
             # ... use daemon ...
         finally:
             await daemon.stop()
+
+    The daemon's combined stdout/stderr is written to ``log_path``
+    (a fresh ``<tmpdir>/reachy-sim-daemon-<port>-*.log`` per start,
+    created exclusively so it cannot be redirected through a planted
+    symlink) rather than to pipes, so a chatty daemon can never block
+    on a full pipe buffer.
+
+    Pass ``http_client`` to share a connection pool with other clients
+    of the same daemon; a shared client is never closed by the daemon.
     """
 
     config: SimulationConfig = field(default_factory=SimulationConfig)
+    http_client: httpx.AsyncClient | None = field(default=None, repr=False)
     _process: subprocess.Popen | None = field(default=None, init=False, repr=False)
+    _log_file: IO[bytes] | None = field(default=None, init=False, repr=False)
+    _log_path: Path | None = field(default=None, init=False, repr=False)
+    _http: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
     _health_task: Task | None = field(default=None, init=False, repr=False)
 
     @property
@@ -75,11 +138,34 @@ class SimulationDaemon:
         """Get the base URL for the daemon API."""
         return f"http://{self.config.host}:{self.config.port}"
 
+    @property
+    def log_path(self) -> Path | None:
+        """Get the path of the daemon's output log file, if started."""
+        return self._log_path
+
     @property
     def is_running(self) -> bool:
         """Check if the daemon process is running."""
         return self._process is not None and self._process.poll() is None
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client shared by all health checks."""
+        import httpx
+
+        if self.http_client is not None:
+            return self.http_client
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url, timeout=_HEALTH_CHECK_TIMEOUT
+            )
+        return self._http
+
+    async def _close_http_client(self) -> None:
+        """Close the shared HTTP client if open."""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+
     async def start(self) -> None:
         """Start the simulation daemon.
 
@@ -104,15 +190,7 @@ class SimulationDaemon:
         env = os.environ.copy()
 
         if sys.platform == "darwin" and not self.config.headless:
-            # Find mjpython - check common locations
-            mjpython_path = shutil.which("mjpython")
-            if mjpython_path is None:
-                # Try common Homebrew locations
-                for path in ["/opt/homebrew/bin/mjpython", "/usr/local/bin/mjpython"]:
-                    if os.path.exists(path):
-                        mjpython_path = path
-                        break
-
+            mjpython_path = _find_mjpython()
             if mjpython_path is None:
                 raise RuntimeError(
                     "mjpython not found. Install with: brew install mujoco\n"
@@ -130,14 +208,7 @@ class SimulationDaemon:
                 str(self.config.port),
             ]
 
-            # Set PYTHONPATH to include current venv's site-packages
-            # so mjpython can find installed packages like reachy_mini
-            import site
-            venv_site_packages = site.getsitepackages()
-            current_pythonpath = env.get("PYTHONPATH", "")
-            new_pythonpath = os.pathsep.join(venv_site_packages)
-            if current_pythonpath:
-                new_pythonpath = f"{new_pythonpath}{os.pathsep}{current_pythonpath}"
+            new_pythonpath = _mjpython_pythonpath(env.get("PYTHONPATH", ""))
             env["PYTHONPATH"] = new_pythonpath
 
             log.debug(
@@ -160,15 +231,16 @@ class SimulationDaemon:
         if self.config.headless:
             cmd.append("--headless")
 
+        self._open_log_file()
         try:
             self._process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+                stdout=self._log_file,
+                stderr=subprocess.STDOUT,
                 env=env,
             )
         except FileNotFoundError as e:
+            self._close_log_file()
             raise RuntimeError(
                 f"Failed to start simulation daemon. Command not found: {cmd[0]}. "
                 "Ensure reachy-mini[mujoco] is installed."
@@ -186,38 +258,54 @@ class SimulationDaemon:
     async def _wait_for_healthy(self) -> None:
         """Wait for the daemon to become healthy.
 
+        Polls with jittered exponential backoff, starting at
+        ``health_check_initial_interval`` and capped at
+        ``health_check_interval``, so fast starts are noticed within
+        tens of milliseconds.
+
         Raises:
             RuntimeError: If daemon doesn't become healthy within timeout.
         """
-        start_time = time.time()
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.startup_timeout
         last_error = None
 
-        async with httpx.AsyncClient() as client:
-            while time.time() - start_time < self.config.startup_timeout:
-                # Check if process died
-                if self._process is not None and self._process.poll() is not None:
-                    stdout, stderr = self._process.communicate()
-                    raise RuntimeError(
-                        f"Simulation daemon exited unexpectedly.\n"
-                        f"Exit code: {self._process.returncode}\n"
-                        f"Stdout: {stdout}\n"
-                        f"Stderr: {stderr}"
-                    )
-
-                try:
-                    response = await client.get(
-                        f"{self.base_url}/api/daemon/status",
-                        timeout=2.0,
-                    )
-                    if response.status_code == 200:
-                        status = response.json()
-                        # Reachy daemon uses "READY" or just a valid status object
-                        if status.get("state") in ("READY", "RUNNING") or "robot_name" in status:
-                            return
-                except (httpx.ConnectError, httpx.TimeoutException) as e:
-                    last_error = e
-
-                await asyncio.sleep(self.config.health_check_interval)
+        client = self._get_http_client()
+        delay = self.config.health_check_initial_interval
+        attempt = 0
+        while loop.time() < deadline:
+            # Check if process died
+            if self._process is not None and self._process.poll() is not None:
+                self._close_log_file()
+                raise RuntimeError(
+                    f"Simulation daemon exited unexpectedly.\n"
+                    f"Exit code: {self._process.returncode}\n"
+                    f"Output ({self.log_path}):\n{self._read_log_tail()}"
+                )
+
+            try:
+                timeout = (
+                    _FAST_PROBE_TIMEOUT
+                    if attempt < _FAST_PROBE_COUNT
+                    else _HEALTH_CHECK_TIMEOUT
+                )
+                response = await client.get("/api/daemon/status", timeout=timeout)
+                if response.status_code == 200:
+                    status = response.json()
+                    # Reachy daemon uses "READY" or just a valid status object
+                    if status.get("state") in ("READY", "RUNNING") or "robot_name" in status:
+                        return
+            except (httpx.ConnectError, httpx.TimeoutException) as e:
+                last_error = e
+
+            attempt += 1
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(
+                delay * self.config.health_check_backoff,
+                self.config.health_check_interval,
+            )
 
         raise RuntimeError(
             f"Simulation daemon did not become healthy within "
@@ -226,6 +314,8 @@ class SimulationDaemon:
 
     async def stop(self) -> None:
         """Stop the simulation daemon gracefully."""
+        await self._close_http_client()
+
         if not self.is_running:
             log.debug("Simulation daemon not running, nothing to stop")
             return
@@ -244,8 +334,49 @@ class SimulationDaemon:
 
             self._process = None
 
+        self._close_log_file()
         log.info("Simulation daemon stopped")
 
+    def _close_log_file(self) -> None:
+        """Close the daemon output log file if open."""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+    def _open_log_file(self) -> None:
+        """Create a new private log file for this run of the daemon.
+
+        ``mkstemp`` creates the file with ``O_EXCL`` and mode 0600 under a
+        random name, so other local users can neither pre-create nor read
+        it. The previous run's log is removed, as truncating it used to.
+        """
+        if self._log_path is not None:
+            self._log_path.unlink(missing_ok=True)
+        fd, path = tempfile.mkstemp(
+            prefix=f"reachy-sim-daemon-{self.config.port}-", suffix=".log"
+        )
+        self._log_path = Path(path)
+        self._log_file = os.fdopen(fd, "wb")
+
+    def _read_log_tail(self, max_bytes: int = 4096) -> str:
+        """Read the end of the daemon output log.
+
+        Args:
+            max_bytes: Maximum number of bytes to read from the end.
+
+        Returns:
+            Decoded log tail, or an empty string if the log is unreadable.
+        """
+        if self._log_path is None:
+            return ""
+        try:
+            with open(self._log_path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - max_bytes))
+                return f.read().decode(errors="replace")
+        except OSError:
+            return ""
+
     async def restart(self) -> None:
         """Restart the simulation daemon."""
         await self.stop()
@@ -257,15 +388,15 @@ class SimulationDaemon:
         Returns:
             Status dictionary from daemon.
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/api/daemon/status",
-                    timeout=2.0,
-                )
-                return response.json()
-            except (httpx.ConnectError, httpx.TimeoutException) as e:
-                return {"status": "error", "error": str(e)}
+        import httpx
+
+        try:
+            response = await self._get_http_client().get(
+                "/api/daemon/status", timeout=_HEALTH_CHECK_TIMEOUT
+            )
+            return response.json()
+        except (httpx.ConnectError, httpx.TimeoutException) as e:
+            return {"status": "error", "error": str(e)}
 
     async def __aenter__(self) -> SimulationDaemon:
         """Async context manager entry."""
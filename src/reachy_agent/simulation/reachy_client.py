@@ -5,47 +5,229 @@ which differ from our mock daemon API used for unit testing.
 
 The Reachy Mini daemon uses:
 - /api/move/goto - for head/antenna/body positioning
+- /api/move/goto_sequence - for multi-keyframe gestures (optional)
 - /api/move/play/wake_up - for waking up
 - /api/move/play/goto_sleep - for sleeping
 - /api/state/* - for reading robot state
+- /api/state/ws/full - WebSocket stream of the full state (optional)
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import json
 import math
-from dataclasses import dataclass
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
 
+from reachy_agent import __version__
 from reachy_agent.utils.logging import get_logger
 
 log = get_logger(__name__)
 
-
-@dataclass
+# Degree-to-radian factor and the default angles used by the helpers below.
+_DEG2RAD = math.pi / 180.0
+_RAD_30 = 30.0 * _DEG2RAD
+_RAD_45 = 45.0 * _DEG2RAD
+
+# Keep-alive pool sized for gesture bursts against a single local daemon.
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=8,
+    max_connections=16,
+    keepalive_expiry=60.0,
+)
+
+# Neutral head pose; copy before modifying.
+_NEUTRAL_HEAD: dict[str, float] = {
+    "x": 0.0,
+    "y": 0.0,
+    "z": 0.0,
+    "roll": 0.0,
+    "pitch": 0.0,
+    "yaw": 0.0,
+}
+
+# move_head direction -> (head pose axis, sign); "front" and unknown
+# directions leave the neutral pose untouched.
+_HEAD_AXES: dict[str, tuple[str, float]] = {
+    "left": ("yaw", 1.0),
+    "right": ("yaw", -1.0),
+    "up": ("pitch", -1.0),
+    "down": ("pitch", 1.0),
+}
+_HEAD_DURATIONS: dict[str, float] = {"slow": 2.0, "normal": 1.0, "fast": 0.5}
+
+# rotate direction -> body yaw sign; unknown directions turn left.
+_ROTATE_SIGNS: dict[str, float] = {"left": 1.0, "right": -1.0}
+_ROTATE_DURATIONS: dict[str, float] = {"slow": 3.0, "normal": 2.0, "fast": 1.0}
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Set once on clients that talk to the daemon, so requests don't have to
+# merge per-call headers. Every request body is JSON.
+DEFAULT_HEADERS = {
+    "accept": "application/json",
+    "user-agent": f"reachy-agent/{__version__}",
+    **_JSON_HEADERS,
+}
+
+_STATE_STREAM_PATH = "/api/state/ws/full"
+
+
+def _goto_payload(
+    head_pose: dict[str, float] | None = None,
+    antennas: tuple[float, float] | None = None,
+    body_yaw: float | None = None,
+    duration: float = 1.0,
+    interpolation: str = "minjerk",
+) -> dict[str, Any]:
+    """Build the JSON body for a goto move (or one goto_sequence keyframe)."""
+    data: dict[str, Any] = {
+        "duration": duration,
+        "interpolation": interpolation,
+    }
+
+    if head_pose is not None:
+        data["head_pose"] = head_pose
+    if antennas is not None:
+        data["antennas"] = list(antennas)
+    if body_yaw is not None:
+        data["body_yaw"] = body_yaw
+
+    return data
+
+
+def _encode(data: dict[str, Any]) -> bytes:
+    """Serialize a request body to compact JSON bytes."""
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+# rest() always sends the same move, so its body is encoded once.
+_REST_BODY = _encode(
+    _goto_payload(
+        head_pose=_NEUTRAL_HEAD,
+        antennas=(_RAD_45, _RAD_45),
+        body_yaw=0.0,
+        duration=1.0,
+    )
+)
+
+
+def _body_headers(
+    client: httpx.AsyncClient, content: bytes | None
+) -> dict[str, str] | None:
+    """Per-request headers, needed only if the client lacks DEFAULT_HEADERS."""
+    if content is None or "content-type" in client.headers:
+        return None
+    return _JSON_HEADERS
+
+
+def _failure(response: httpx.Response, path: str) -> dict[str, Any]:
+    """Log a non-2xx daemon response and convert it to an error result."""
+    status = response.status_code
+    log.error("Request failed", path=path, status=status)
+    return {
+        "error": f"{status} {response.reason_phrase} for {response.request.method} {path}",
+        "status_code": status,
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _oscillation_frames(
+    axis: str,
+    first: float,
+    second: float,
+    times: int,
+    segment: float,
+) -> tuple[tuple[bytes, float], ...]:
+    """Encoded (keyframe, duration) pairs for a nod/shake; cached per gesture."""
+    swing = (
+        _encode(_goto_payload(head_pose={**_NEUTRAL_HEAD, axis: first}, duration=segment)),
+        _encode(_goto_payload(head_pose={**_NEUTRAL_HEAD, axis: second}, duration=segment)),
+    )
+    neutral = _encode(_goto_payload(head_pose=dict(_NEUTRAL_HEAD), duration=segment))
+    return tuple((frame, segment) for frame in swing * times + (neutral,))
+
+
+@dataclass(slots=True)
 class ReachyMiniClient:
     """HTTP client for the real Reachy Mini daemon API.
 
     This client uses the actual Reachy Mini SDK daemon endpoints,
     not our mock daemon endpoints used for unit testing.
+
+    Pass ``http_client`` to share a connection pool (e.g. with the
+    simulation daemon's health checks); a shared client is left open
+    by ``close()`` and must be closed by its owner.
+
+    ``get_full_state`` results are reused for ``state_ttl`` seconds, and
+    concurrent callers share one in-flight request. Any command sent to
+    the daemon drops the cached state. Set ``state_ttl`` to 0 to disable.
+
+    With ``stream_state=True`` the first state read subscribes to the
+    daemon's WebSocket state stream (requires ``websockets``) and later
+    reads return the latest frame from memory. Reads fall back to HTTP
+    until the first frame arrives, or for good if the stream is
+    unavailable.
     """
 
     base_url: str = "http://localhost:8000"
     timeout: float = 10.0
-    _client: httpx.AsyncClient | None = None
+    state_ttl: float = 0.05
+    stream_state: bool = False
+    http_client: httpx.AsyncClient | None = field(default=None, repr=False)
+    _client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+    # None until the first goto_sequence call tells us whether the daemon
+    # accepts batched keyframes.
+    _sequence_supported: bool | None = field(default=None, init=False, repr=False)
+    # (monotonic timestamp, state) of the last successful full-state read.
+    _state_cache: tuple[float, dict[str, Any]] | None = field(
+        default=None, init=False, repr=False
+    )
+    _state_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+    _latest_state: dict[str, Any] | None = field(default=None, init=False, repr=False)
+    _stream_task: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
+    # Absolute URL per endpoint path, parsed once.
+    _urls: dict[str, httpx.URL] = field(default_factory=dict, init=False, repr=False)
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
+        if self.http_client is not None:
+            return self.http_client
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 timeout=self.timeout,
+                headers=DEFAULT_HEADERS,
+                # retries=1 only re-attempts failed connects, never a sent move.
+                transport=httpx.AsyncHTTPTransport(limits=_POOL_LIMITS, retries=1),
             )
         return self._client
 
+    def _url(self, path: str) -> httpx.URL:
+        """Absolute URL for an endpoint path.
+
+        httpx re-parses a relative path against ``base_url`` on every
+        request; handing it a pre-parsed absolute URL skips that work.
+        """
+        url = self._urls.get(path)
+        if url is None:
+            url = self._urls[path] = httpx.URL(self.base_url.rstrip("/") + path)
+        return url
+
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the state stream and HTTP client (shared clients are left open)."""
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._stream_task
+            self._stream_task = None
         if self._client is not None and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
@@ -54,22 +236,34 @@ class ReachyMiniClient:
         self,
         method: str,
         path: str,
-        json_data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
+        content: bytes | None = None,
     ) -> dict[str, Any]:
-        """Make an HTTP request."""
+        """Make an HTTP request.
+
+        ``content`` is an already-encoded JSON body (see ``_encode``).
+        """
+        if method != "GET":
+            self._state_cache = None
         client = await self._get_client()
         try:
-            response = await client.request(method, path, json=json_data, params=params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            log.error("Request failed", path=path, status=e.response.status_code)
-            return {"error": str(e), "status_code": e.response.status_code}
+            response = await client.request(
+                method,
+                self._url(path),
+                content=content,
+                headers=_body_headers(client, content),
+                params=params,
+            )
         except httpx.RequestError as e:
             log.error("Request error", path=path, error=str(e))
             return {"error": str(e)}
 
+        if not response.is_success:
+            return _failure(response, path)
+        # Some command endpoints reply with an empty body.
+        body = response.content
+        return json.loads(body) if body else {}
+
     # ========== Status ==========
 
     async def get_status(self) -> dict[str, Any]:
@@ -77,8 +271,59 @@ class ReachyMiniClient:
         return await self._request("GET", "/api/daemon/status")
 
     async def get_full_state(self) -> dict[str, Any]:
-        """Get full robot state."""
-        return await self._request("GET", "/api/state/full")
+        """Get full robot state.
+
+        Returns the cached state if it is younger than ``state_ttl``; the
+        returned dict is shared between callers and must not be mutated.
+        """
+        if self.stream_state:
+            if self._stream_task is None:
+                self._stream_task = asyncio.create_task(self._state_stream())
+            if self._latest_state is not None:
+                return self._latest_state
+
+        cached = self._state_cache
+        if cached is not None and time.monotonic() - cached[0] < self.state_ttl:
+            return cached[1]
+
+        async with self._state_lock:
+            # Another caller may have refreshed the state while we waited.
+            cached = self._state_cache
+            if cached is not None and time.monotonic() - cached[0] < self.state_ttl:
+                return cached[1]
+
+            state = await self._request("GET", "/api/state/full")
+            if "error" not in state:
+                self._state_cache = (time.monotonic(), state)
+            return state
+
+    async def _state_stream(self) -> None:
+        """Keep ``_latest_state`` updated from the daemon's WebSocket stream."""
+        try:
+            import websockets
+        except ImportError:
+            log.warning("websockets not installed, polling state over HTTP")
+            self.stream_state = False
+            self._stream_task = None
+            return
+
+        url = "ws" + self.base_url.removeprefix("http") + _STATE_STREAM_PATH
+        received = False
+        try:
+            async with websockets.connect(url) as ws:
+                async for message in ws:
+                    self._latest_state = json.loads(message)
+                    received = True
+        except (OSError, ValueError, websockets.WebSocketException) as e:
+            log.warning("State stream closed", url=url, error=str(e))
+        finally:
+            self._latest_state = None
+            self._stream_task = None
+
+        if not received:
+            # The daemon never delivered a frame; don't retry on every read.
+            log.info("State stream unavailable, polling state over HTTP")
+            self.stream_state = False
 
     # ========== Lifecycle ==========
 
@@ -112,19 +357,74 @@ class ReachyMiniClient:
         Returns:
             Response with move UUID.
         """
-        data: dict[str, Any] = {
-            "duration": duration,
-            "interpolation": interpolation,
-        }
+        data = _goto_payload(head_pose, antennas, body_yaw, duration, interpolation)
+        return await self._request("POST", "/api/move/goto", content=_encode(data))
+
+    async def goto_sequence(
+        self,
+        keyframes: Sequence[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Play a list of goto keyframes in order.
+
+        Sends all keyframes in a single ``/api/move/goto_sequence`` request
+        so a gesture costs one round-trip instead of one per segment. Daemons
+        without that endpoint (404/405) are remembered and served by posting
+        each keyframe to ``/api/move/goto`` in turn, each one sent just
+        before the previous move is due to finish (one round-trip early) so
+        request latency overlaps with movement time.
+
+        Args:
+            keyframes: Goto payloads (head_pose, antennas, body_yaw,
+                duration, interpolation), as built by ``_goto_payload``.
 
-        if head_pose is not None:
-            data["head_pose"] = head_pose
-        if antennas is not None:
-            data["antennas"] = list(antennas)
-        if body_yaw is not None:
-            data["body_yaw"] = body_yaw
+        Returns:
+            Response with ``status`` and the number of ``moves`` submitted.
+        """
+        return await self._play_frames(
+            [(_encode(keyframe), float(keyframe.get("duration", 1.0))) for keyframe in keyframes]
+        )
 
-        return await self._request("POST", "/api/move/goto", json_data=data)
+    async def _play_frames(self, frames: Sequence[tuple[bytes, float]]) -> dict[str, Any]:
+        """Send JSON-encoded (keyframe, duration) pairs (see ``goto_sequence``)."""
+        self._state_cache = None
+        if self._sequence_supported is not False:
+            client = await self._get_client()
+            body = b'{"moves":[' + b",".join(frame for frame, _ in frames) + b"]}"
+            try:
+                response = await client.post(
+                    self._url("/api/move/goto_sequence"),
+                    content=body,
+                    headers=_body_headers(client, body),
+                )
+            except httpx.RequestError as e:
+                log.error("Request error", path="/api/move/goto_sequence", error=str(e))
+                return {"error": str(e)}
+
+            if response.status_code not in (404, 405):
+                self._sequence_supported = True
+                if not response.is_success:
+                    return _failure(response, "/api/move/goto_sequence")
+                return {"status": "ok", "moves": len(frames)}
+
+            log.debug("Daemon has no goto_sequence endpoint, posting keyframes individually")
+            self._sequence_supported = False
+
+        # Keyframes must stay ordered: the daemon retargets to the latest goto,
+        # so they are paced by duration rather than fired concurrently.
+        loop = asyncio.get_running_loop()
+        move_end = loop.time()
+        rtt = 0.0
+        for frame, duration in frames:
+            delay = move_end - loop.time() - rtt
+            if delay > 0:
+                await asyncio.sleep(delay)
+            sent = loop.time()
+            result = await self._request("POST", "/api/move/goto", content=frame)
+            if "error" in result:
+                return result
+            rtt = loop.time() - sent
+            move_end = max(move_end, sent) + duration
+        return {"status": "ok", "moves": len(frames)}
 
     # ========== Convenience methods matching our MCP tools ==========
 
@@ -141,23 +441,14 @@ class ReachyMiniClient:
             speed: slow, normal, or fast.
             degrees: Optional angle override.
         """
-        # Map speed to duration
-        duration_map = {"slow": 2.0, "normal": 1.0, "fast": 0.5}
-        duration = duration_map.get(speed, 1.0)
-
-        # Map direction to head pose (angles in radians)
-        angle = math.radians(degrees if degrees is not None else 30)
-
-        pose_map: dict[str, dict[str, float]] = {
-            "left": {"yaw": angle},
-            "right": {"yaw": -angle},
-            "up": {"pitch": -angle},
-            "down": {"pitch": angle},
-            "front": {"yaw": 0.0, "pitch": 0.0, "roll": 0.0},
-        }
+        duration = _HEAD_DURATIONS.get(speed, 1.0)
+        angle = degrees * _DEG2RAD if degrees is not None else _RAD_30
 
-        head_pose: dict[str, float] = {"x": 0.0, "y": 0.0, "z": 0.0, "roll": 0.0, "pitch": 0.0, "yaw": 0.0}
-        head_pose.update(pose_map.get(direction, {}))
+        head_pose = _NEUTRAL_HEAD.copy()
+        axis = _HEAD_AXES.get(direction)
+        if axis is not None:
+            key, sign = axis
+            head_pose[key] = sign * angle
 
         return await self.goto(head_pose=head_pose, duration=duration)
 
@@ -182,9 +473,9 @@ class ReachyMiniClient:
             "x": 0,
             "y": 0,
             "z": 0,
-            "roll": math.radians(roll),
-            "pitch": math.radians(pitch),
-            "yaw": math.radians(yaw),
+            "roll": roll * _DEG2RAD,
+            "pitch": pitch * _DEG2RAD,
+            "yaw": yaw * _DEG2RAD,
         }
         return await self.goto(head_pose=head_pose, duration=duration)
 
@@ -202,8 +493,8 @@ class ReachyMiniClient:
             duration_ms: Duration in milliseconds.
         """
         # Convert degrees to radians and clamp
-        left_rad = math.radians(left_angle if left_angle is not None else 45)
-        right_rad = math.radians(right_angle if right_angle is not None else 45)
+        left_rad = left_angle * _DEG2RAD if left_angle is not None else _RAD_45
+        right_rad = right_angle * _DEG2RAD if right_angle is not None else _RAD_45
 
         return await self.goto(
             antennas=(left_rad, right_rad),
@@ -223,12 +514,8 @@ class ReachyMiniClient:
             degrees: Rotation amount.
             speed: slow, normal, or fast.
         """
-        duration_map = {"slow": 3.0, "normal": 2.0, "fast": 1.0}
-        duration = duration_map.get(speed, 2.0)
-
-        angle_rad = math.radians(degrees)
-        if direction == "right":
-            angle_rad = -angle_rad
+        angle_rad = _ROTATE_SIGNS.get(direction, 1.0) * degrees * _DEG2RAD
+        duration = _ROTATE_DURATIONS.get(speed, 2.0)
 
         return await self.goto(body_yaw=angle_rad, duration=duration)
 
@@ -239,33 +526,9 @@ class ReachyMiniClient:
     ) -> dict[str, Any]:
         """Perform nodding gesture.
 
-        This is a simplified implementation using goto.
+        This is a simplified implementation using goto_sequence.
         """
-        duration = 0.3 if speed == "fast" else 0.5 if speed == "normal" else 0.7
-        results = []
-
-        for _ in range(times):
-            # Nod down
-            result = await self.goto(
-                head_pose={"x": 0, "y": 0, "z": 0, "roll": 0, "pitch": 0.3, "yaw": 0},
-                duration=duration / 2,
-            )
-            results.append(result)
-
-            # Nod up
-            result = await self.goto(
-                head_pose={"x": 0, "y": 0, "z": 0, "roll": 0, "pitch": -0.1, "yaw": 0},
-                duration=duration / 2,
-            )
-            results.append(result)
-
-        # Return to neutral
-        await self.goto(
-            head_pose={"x": 0, "y": 0, "z": 0, "roll": 0, "pitch": 0, "yaw": 0},
-            duration=duration / 2,
-        )
-
-        return {"status": "ok", "moves": len(results)}
+        return await self._oscillate("pitch", 0.3, -0.1, times, speed)
 
     async def shake(
         self,
@@ -273,40 +536,37 @@ class ReachyMiniClient:
         speed: str = "normal",
     ) -> dict[str, Any]:
         """Perform head shake gesture."""
-        duration = 0.3 if speed == "fast" else 0.5 if speed == "normal" else 0.7
-        results = []
+        return await self._oscillate("yaw", 0.3, -0.3, times, speed)
 
-        for _ in range(times):
-            # Shake left
-            result = await self.goto(
-                head_pose={"x": 0, "y": 0, "z": 0, "roll": 0, "pitch": 0, "yaw": 0.3},
-                duration=duration / 2,
-            )
-            results.append(result)
-
-            # Shake right
-            result = await self.goto(
-                head_pose={"x": 0, "y": 0, "z": 0, "roll": 0, "pitch": 0, "yaw": -0.3},
-                duration=duration / 2,
-            )
-            results.append(result)
+    async def _oscillate(
+        self,
+        axis: str,
+        first: float,
+        second: float,
+        times: int,
+        speed: str,
+    ) -> dict[str, Any]:
+        """Swing one head axis between two angles, then return to neutral.
 
-        # Return to neutral
-        await self.goto(
-            head_pose={"x": 0, "y": 0, "z": 0, "roll": 0, "pitch": 0, "yaw": 0},
-            duration=duration / 2,
-        )
+        Args:
+            axis: Head pose key to animate (pitch or yaw).
+            first: First angle of each cycle in radians.
+            second: Second angle of each cycle in radians.
+            times: Number of cycles.
+            speed: slow, normal, or fast.
+        """
+        duration = 0.3 if speed == "fast" else 0.5 if speed == "normal" else 0.7
+        frames = _oscillation_frames(axis, first, second, times, duration / 2)
 
-        return {"status": "ok", "moves": len(results)}
+        result = await self._play_frames(frames)
+        if "error" in result:
+            return result
+        # The trailing return-to-neutral is not counted as a gesture move.
+        return {"status": "ok", "moves": 2 * times}
 
     async def rest(self) -> dict[str, Any]:
         """Return to neutral resting pose."""
-        return await self.goto(
-            head_pose={"x": 0, "y": 0, "z": 0, "roll": 0, "pitch": 0, "yaw": 0},
-            antennas=(math.radians(45), math.radians(45)),
-            body_yaw=0,
-            duration=1.0,
-        )
+        return await self._request("POST", "/api/move/goto", content=_REST_BODY)
 
     async def get_sensor_data(
         self,
@@ -6,13 +6,24 @@ Follows the schema defined in TECH_REQ.md.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 from enum import Enum
 from pathlib import Path
+from typing import TypeVar
 
 import yaml
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    # libyaml-backed loader/dumper; PyYAML wheels normally ship them.
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 class WakeWordEngine(str, Enum):
     """Supported wake word detection engines."""
@@ -197,6 +208,10 @@ class ReachyConfig(BaseModel):
     def from_yaml(cls, path: Path) -> ReachyConfig:
         """Load configuration from a YAML file.
 
+        Parsed configs are cached by path, modification time and size, so
+        reloading an unchanged file skips YAML parsing and validation.
+        Each call returns an independent copy.
+
         Args:
             path: Path to the YAML configuration file.
 
@@ -208,9 +223,10 @@ class ReachyConfig(BaseModel):
             yaml.YAMLError: If the YAML is malformed.
             pydantic.ValidationError: If validation fails.
         """
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
-        return cls.model_validate(data)
+        path = Path(path)
+        stat = path.stat()
+        config = _load_yaml_config(cls, path.resolve(), stat.st_mtime_ns, stat.st_size)
+        return config.model_copy(deep=True)
 
     def to_yaml(self, path: Path) -> None:
         """Save configuration to a YAML file.
@@ -223,10 +239,38 @@ class ReachyConfig(BaseModel):
             yaml.dump(
                 self.model_dump(mode="json"),
                 f,
+                Dumper=_SafeDumper,
                 default_flow_style=False,
                 sort_keys=False,
             )
 
+    async def to_yaml_async(self, path: Path) -> None:
+        """Save configuration to a YAML file without blocking the event loop.
+
+        Serialization and file I/O run in a worker thread; don't modify the
+        config until the call returns.
+
+        Args:
+            path: Path to write the YAML configuration file.
+        """
+        await asyncio.to_thread(self.to_yaml, path)
+
+
+_ConfigT = TypeVar("_ConfigT", bound=ReachyConfig)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_config(
+    cls: type[_ConfigT],
+    path: Path,
+    mtime_ns: int,  # noqa: ARG001 - cache key
+    size: int,  # noqa: ARG001 - cache key
+) -> _ConfigT:
+    """Parse and validate a config file; callers must copy the result."""
+    with open(path) as f:
+        data = yaml.load(f, Loader=_SafeLoader) or {}  # nosec B506 - safe loader
+    return cls.model_validate(data)
+
 
 class EnvSettings(BaseSettings):
     """Environment variable settings.
@@ -14,6 +14,31 @@ from typing import Any
 import structlog
 from structlog.types import Processor
 
+# One logger proxy per name, shared by every get_logger() caller.
+_LOGGER_CACHE: dict[str | None, structlog.stdlib.BoundLogger] = {}
+
+
+# Processors shared by console, JSON and file output.
+_SHARED_PROCESSORS: list[Processor] = [
+    structlog.contextvars.merge_contextvars,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.UnicodeDecoder(),
+]
+
+# File logs always use JSON format.
+_FILE_FORMATTER = structlog.stdlib.ProcessorFormatter(
+    processor=structlog.processors.JSONRenderer(),
+    foreign_pre_chain=_SHARED_PROCESSORS,
+)
+
+# Arguments of the last configure_logging() call and the file handler it
+# installed, so repeated calls don't rebuild processors or stack handlers.
+_configured_with: tuple[int, bool, Path | None] | None = None
+_file_handler: logging.FileHandler | None = None
+
 
 def configure_logging(
     level: str = "INFO",
@@ -22,39 +47,45 @@ def configure_logging(
 ) -> None:
     """Configure structured logging for the application.
 
+    Calling again with the same arguments is a no-op; calling with a
+    different ``log_file`` replaces the previously added file handler.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
         json_format: Use JSON format (for production) or console format (for dev).
         log_file: Optional path to write logs to file.
+
+    Raises:
+        ValueError: If ``level`` is not a known log level name.
     """
+    global _configured_with, _file_handler
+
+    numeric_level = logging.getLevelName(level.upper())
+    if not isinstance(numeric_level, int):
+        raise ValueError(f"Unknown log level: {level!r}")
+
+    settings = (numeric_level, json_format, log_file)
+    if settings == _configured_with:
+        return
+
     # Configure standard logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, level.upper()),
+        level=numeric_level,
     )
 
-    # Shared processors for all outputs
-    shared_processors: list[Processor] = [
-        structlog.contextvars.merge_contextvars,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.UnicodeDecoder(),
-    ]
-
     if json_format:
         # Production: JSON output
         processors: list[Processor] = [
-            *shared_processors,
+            *_SHARED_PROCESSORS,
             structlog.processors.format_exc_info,
             structlog.processors.JSONRenderer(),
         ]
     else:
         # Development: colored console output
         processors = [
-            *shared_processors,
+            *_SHARED_PROCESSORS,
             structlog.dev.ConsoleRenderer(colors=True),
         ]
 
@@ -66,21 +97,23 @@ def configure_logging(
         cache_logger_on_first_use=True,
     )
 
+    root = logging.getLogger()
+    if _file_handler is not None:
+        root.removeHandler(_file_handler)
+        _file_handler.close()
+        _file_handler = None
+
     # Add file handler if specified
     if log_file is not None:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, level.upper()))
-
-        # File logs always use JSON format
-        file_formatter = structlog.stdlib.ProcessorFormatter(
-            processor=structlog.processors.JSONRenderer(),
-            foreign_pre_chain=shared_processors,
-        )
-        file_handler.setFormatter(file_formatter)
+        _file_handler = logging.FileHandler(log_file)
+        _file_handler.setLevel(numeric_level)
+        _file_handler.setFormatter(_FILE_FORMATTER)
 
         # Add to root logger
-        logging.getLogger().addHandler(file_handler)
+        root.addHandler(_file_handler)
+
+    _configured_with = settings
 
 
 def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
@@ -96,7 +129,10 @@ def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
         >>> log = get_logger(__name__)
         >>> log.info("Starting agent", version="0.1.0")
     """
-    return structlog.get_logger(name)
+    logger = _LOGGER_CACHE.get(name)
+    if logger is None:
+        logger = _LOGGER_CACHE[name] = structlog.get_logger(name)
+    return logger
 
 
 def bind_context(**kwargs: Any) -> None:
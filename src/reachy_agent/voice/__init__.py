@@ -15,13 +15,49 @@ Usage:
 
     pipeline = VoicePipeline(agent=reachy_agent)
     await pipeline.start()  # Begins listening for "Hey Reachy"
+
+Exports are resolved lazily (PEP 562) so importing a lightweight
+submodule such as ``reachy_agent.voice.persona`` does not load numpy,
+the OpenAI SDK or the VAD/wake-word backends.
 """
 
-from reachy_agent.voice.audio import AudioConfig, AudioManager
-from reachy_agent.voice.openai_realtime import OpenAIRealtimeClient, RealtimeConfig
-from reachy_agent.voice.pipeline import VoicePipeline, VoicePipelineConfig, VoicePipelineState
-from reachy_agent.voice.vad import VADConfig, VoiceActivityDetector
-from reachy_agent.voice.wake_word import WakeWordConfig, WakeWordDetector
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from reachy_agent.voice.audio import AudioConfig, AudioManager
+    from reachy_agent.voice.openai_realtime import OpenAIRealtimeClient, RealtimeConfig
+    from reachy_agent.voice.pipeline import (
+        VoicePipeline,
+        VoicePipelineConfig,
+        VoicePipelineState,
+    )
+    from reachy_agent.voice.test_harness import (
+        DEFAULT_TEST_SCENARIOS,
+        SyntheticHuman,
+        VoiceTestHarness,
+    )
+    from reachy_agent.voice.vad import VADConfig, VoiceActivityDetector
+    from reachy_agent.voice.wake_word import WakeWordConfig, WakeWordDetector
+
+_EXPORTS = {
+    "AudioConfig": ".audio",
+    "AudioManager": ".audio",
+    "WakeWordConfig": ".wake_word",
+    "WakeWordDetector": ".wake_word",
+    "VADConfig": ".vad",
+    "VoiceActivityDetector": ".vad",
+    "RealtimeConfig": ".openai_realtime",
+    "OpenAIRealtimeClient": ".openai_realtime",
+    "VoicePipelineConfig": ".pipeline",
+    "VoicePipeline": ".pipeline",
+    "VoicePipelineState": ".pipeline",
+    "DEFAULT_TEST_SCENARIOS": ".test_harness",
+    "SyntheticHuman": ".test_harness",
+    "VoiceTestHarness": ".test_harness",
+}
 
 __all__ = [
     "AudioConfig",
@@ -35,4 +71,17 @@ __all__ = [
     "VoicePipelineConfig",
     "VoicePipeline",
     "VoicePipelineState",
+    "DEFAULT_TEST_SCENARIOS",
+    "SyntheticHuman",
+    "VoiceTestHarness",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -10,15 +10,21 @@ Manages hardware audio streams using PyAudio:
 
 from __future__ import annotations
 
+import array
 import asyncio
+import contextlib
+import itertools
+import math
+import os
 import queue
+import struct
+import sys
 import threading
 import time
-from collections.abc import AsyncIterator, Callable
+from collections.abc import AsyncIterator, Callable, Sequence
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-import numpy as np
 import structlog
 
 from .errors import (
@@ -31,10 +37,266 @@ from .errors import (
 if TYPE_CHECKING:
     import pyaudio
 
+# Optional accelerators for the playback amplitude kernel
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
+# Input chunks coalesced into one speaker write by play_audio_stream.
+_OUTPUT_BLOCK_CHUNKS = 8
+# Blocks queued ahead of the playback thread before play_audio_stream waits.
+_OUTPUT_QUEUE_BLOCKS = 4
+# Full-scale sample value per supported bit depth; RMS / max is scaled up
+# x3 for visibility when reported as 0-1 amplitude.
+_PCM_MAX = {8: 127, 16: 32767, 24: 8388607, 32: 2147483647}
+_AMP_GAIN = 3.0
+# Minimum spacing between on_amplitude updates (~30 Hz, display rate).
+_AMPLITUDE_INTERVAL = 0.033
+# Samples per chunk the amplitude kernel looks at; larger chunks are
+# read with a stride. At the display rate above, a ~128-sample subsample
+# per chunk is indistinguishable on a level meter.
+_AMP_SAMPLES = 128
 
-@dataclass
+
+_PCM16 = struct.Struct("<h")
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True)
+    def _sumsq_i16(samples: np.ndarray) -> int:
+        """Sum of squares of int16 samples, accumulated in int64 (JIT)."""
+        acc = 0
+        for s in samples:
+            acc += np.int64(s) * np.int64(s)
+        return acc
+
+    def _sumsq_pcm16(data: bytes, stride: int = 1) -> int:
+        """Sum of squares of every ``stride``-th int16 PCM sample."""
+        return int(_sumsq_i16(np.frombuffer(data, dtype=np.int16)[::stride]))
+
+elif NUMPY_AVAILABLE:
+
+    def _sumsq_pcm16(data: bytes, stride: int = 1) -> int:
+        """Sum of squares of every ``stride``-th int16 PCM sample.
+
+        Accumulates in int64; np.vdot/np.dot would accumulate in int16 and
+        overflow.
+        """
+        samples = np.frombuffer(data, dtype=np.int16)[::stride]
+        return int(np.einsum("i,i->", samples, samples, dtype=np.int64))
+
+else:
+
+    def _sumsq_pcm16(data: bytes, stride: int = 1) -> int:
+        """Sum of squares of int16 PCM samples (pure Python fallback)."""
+        acc = 0
+        for (s,) in itertools.islice(_PCM16.iter_unpack(data), 0, None, stride):
+            acc += s * s
+        return acc
+
+
+if NUMPY_AVAILABLE:
+
+    def _sumsq_pcm8(data: bytes, stride: int = 1) -> int:
+        """Sum of squares of every ``stride``-th int8 PCM sample."""
+        samples = np.frombuffer(data, dtype=np.int8)[::stride]
+        return int(np.einsum("i,i->", samples, samples, dtype=np.int64))
+
+    def _sumsq_pcm24(data: bytes, stride: int = 1) -> int:
+        """Sum of squares of every ``stride``-th packed little-endian int24 sample.
+
+        Each 3-byte sample is copied into the top of an int32 and shifted
+        back down, which sign-extends it without a per-sample loop.
+        """
+        packed = np.frombuffer(data, dtype=np.uint8)[: len(data) // 3 * 3]
+        triples = packed.reshape(-1, 3)[::stride]
+        words = np.zeros((len(triples), 4), dtype=np.uint8)
+        words[:, 1:] = triples
+        samples = words.view("<i4").ravel() >> 8
+        return int(np.einsum("i,i->", samples, samples, dtype=np.int64))
+
+    def _sumsq_pcm32(data: bytes, stride: int = 1) -> int:
+        """Sum of squares of every ``stride``-th int32 PCM sample.
+
+        Accumulates in float64: squares of full-scale int32 samples
+        overflow an int64 sum after a couple of samples.
+        """
+        samples = np.frombuffer(data, dtype=np.int32)[::stride]
+        return int(np.einsum("i,i->", samples, samples, dtype=np.float64))
+
+else:
+
+    def _sumsq_pcm8(data: bytes, stride: int = 1) -> int:
+        """Sum of squares of int8 PCM samples (pure Python fallback)."""
+        samples = itertools.islice(struct.iter_unpack("<b", data), 0, None, stride)
+        return sum(s * s for (s,) in samples)
+
+    def _sumsq_pcm24(data: bytes, stride: int = 1) -> int:
+        """Sum of squares of packed int24 PCM samples (pure Python fallback)."""
+        acc = 0
+        for i in range(0, len(data) - 2, 3 * stride):
+            s = int.from_bytes(data[i : i + 3], "little", signed=True)
+            acc += s * s
+        return acc
+
+    def _sumsq_pcm32(data: bytes, stride: int = 1) -> int:
+        """Sum of squares of int32 PCM samples (pure Python fallback)."""
+        samples = itertools.islice(struct.iter_unpack("<i", data), 0, None, stride)
+        return sum(s * s for (s,) in samples)
+
+
+_SUMSQ_KERNELS: dict[int, Callable[[bytes, int], int]] = {
+    8: _sumsq_pcm8,
+    16: _sumsq_pcm16,
+    24: _sumsq_pcm24,
+    32: _sumsq_pcm32,
+}
+
+
+if NUMPY_AVAILABLE:
+
+    def _downmix_int16(data: bytes, in_channels: int) -> bytes:
+        """Average interleaved int16 PCM down to mono.
+
+        Sums in int32 so a full-scale sum across channels cannot wrap.
+        """
+        frames = np.frombuffer(data, dtype=np.int16).reshape(-1, in_channels)
+        mono = frames.sum(axis=1, dtype=np.int32) // in_channels
+        return mono.astype(np.int16).tobytes()
+
+else:
+
+    def _downmix_int16(data: bytes, in_channels: int) -> bytes:
+        """Average interleaved int16 PCM down to mono (pure Python fallback)."""
+        samples = array.array("h", data)
+        if sys.byteorder != "little":
+            samples.byteswap()
+        mono = array.array(
+            "h",
+            (
+                sum(samples[i : i + in_channels]) // in_channels
+                for i in range(0, len(samples), in_channels)
+            ),
+        )
+        if sys.byteorder != "little":
+            mono.byteswap()
+        return mono.tobytes()
+
+
+# macOS QoS class for latency-critical work (pthread/qos.h)
+_QOS_CLASS_USER_INTERACTIVE = 0x21
+# Windows THREAD_PRIORITY_TIME_CRITICAL (processthreadsapi.h)
+_THREAD_PRIORITY_TIME_CRITICAL = 15
+
+
+def _set_rt_priority() -> bool:
+    """Raise the calling thread to the platform's real-time audio priority.
+
+    Linux requests SCHED_FIFO (needs root or CAP_SYS_NICE), macOS sets the
+    user-interactive QoS class and Windows sets time-critical priority.
+    Failures are logged and ignored; audio works the same, just with more
+    jitter.
+
+    Returns:
+        True if the priority was raised
+    """
+    try:
+        if sys.platform == "darwin":
+            import ctypes
+
+            libc = ctypes.CDLL("libc.dylib", use_errno=True)
+            if libc.pthread_set_qos_class_self_np(_QOS_CLASS_USER_INTERACTIVE, 0):
+                raise OSError(ctypes.get_errno(), "pthread_set_qos_class_self_np")
+        elif sys.platform == "win32":
+            import ctypes
+
+            kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+            if not kernel32.SetThreadPriority(
+                kernel32.GetCurrentThread(), _THREAD_PRIORITY_TIME_CRITICAL
+            ):
+                raise ctypes.WinError()  # type: ignore[attr-defined]
+        elif hasattr(os, "sched_setscheduler"):
+            # pid 0 targets the calling thread on Linux
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+        else:
+            return False
+    except (OSError, AttributeError) as e:
+        logger.debug(
+            "audio_realtime_priority_unavailable",
+            thread=threading.current_thread().name,
+            error=str(e),
+        )
+        return False
+    return True
+
+
+class FrameRing:
+    """Single-producer/single-consumer ring of audio frames.
+
+    The record thread pushes and the event loop pops. Each side only
+    writes its own index, and slot/index stores are atomic under the GIL,
+    so neither side takes a lock. Frames are stored by reference; PyAudio
+    returns a fresh ``bytes`` object per read, so no copy is needed. When
+    full, new frames are dropped.
+    """
+
+    __slots__ = ("_slots", "_mask", "_head", "_tail")
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1 or capacity & (capacity - 1):
+            raise ValueError(f"capacity must be a power of two, got {capacity}")
+        self._slots: list[bytes | None] = [None] * capacity
+        self._mask = capacity - 1
+        self._head = 0  # next slot to read; written by the consumer only
+        self._tail = 0  # next slot to write; written by the producer only
+
+    def __len__(self) -> int:
+        """Number of frames waiting to be read."""
+        return self._tail - self._head
+
+    def push(self, frame: bytes) -> bool:
+        """Append a frame (producer side). Returns False if the ring is full."""
+        tail = self._tail
+        if tail - self._head > self._mask:
+            return False
+        self._slots[tail & self._mask] = frame
+        self._tail = tail + 1
+        return True
+
+    def pop(self) -> bytes | None:
+        """Remove and return the oldest frame (consumer side), or None."""
+        head = self._head
+        if head == self._tail:
+            return None
+        slot = head & self._mask
+        frame = self._slots[slot]
+        self._slots[slot] = None
+        self._head = head + 1
+        return frame
+
+    def clear(self) -> None:
+        """Discard all buffered frames (consumer side).
+
+        O(1): the read index jumps to the write index. Stale slot references
+        are overwritten by later pushes.
+        """
+        self._head = self._tail
+
+
+@dataclass(frozen=True, slots=True)
 class AudioConfig:
     """Audio configuration settings.
 
@@ -47,6 +309,9 @@ class AudioConfig:
     # Core audio settings
     sample_rate: int = 16000
     channels: int = 1
+    # Interleaved channels opened on the mic (e.g. 4 for the mic array);
+    # averaged down to mono on the record thread. Needs channels=1, 16-bit.
+    capture_channels: int = 1
     chunk_size: int = 512  # Silero VAD requires exactly 512 samples at 16kHz
     format_bits: int = 16
     input_device_index: int | None = None
@@ -60,11 +325,22 @@ class AudioConfig:
     # Buffer settings
     output_lead_in_ms: int = 200  # Silence before TTS playback (prevents click)
     input_warmup_chunks: int = 5  # Discard first N chunks (mic warmup)
+    buffer_latency_ms: int = 1000  # Mic backlog kept before frames are dropped
+
+    @property
+    def ring_capacity(self) -> int:
+        """Mic ring slots covering ``buffer_latency_ms``, rounded up to a power of two."""
+        chunk_ms = self.chunk_size * 1000 / self.sample_rate
+        slots = max(1, math.ceil(self.buffer_latency_ms / chunk_ms))
+        return 1 << (slots - 1).bit_length()
 
     # Health monitoring
     health_check_interval_seconds: float = 5.0
     max_consecutive_errors: int = 3
 
+    # Realtime scheduling (Linux only)
+    audio_cpu: int | None = None  # Pin the capture thread to this core
+
 
 @dataclass
 class AudioDeviceManager:
@@ -76,9 +352,16 @@ class AudioDeviceManager:
     """
 
     _pyaudio: pyaudio.PyAudio | None = field(default=None, repr=False)
+    # Seconds an enumeration stays valid before PortAudio is asked again
+    cache_ttl_seconds: float = 30.0
+    _device_cache: tuple[dict, ...] | None = field(default=None, repr=False)
+    _default_cache: dict[bool, int | None] = field(default_factory=dict, repr=False)
+    _cache_time: float = field(default=0.0, repr=False)
 
     def __post_init__(self) -> None:
-        """Initialize PyAudio for device enumeration."""
+        """Initialize PyAudio for device enumeration, unless one was passed in."""
+        if self._pyaudio is not None:
+            return
         try:
             import pyaudio
 
@@ -92,10 +375,33 @@ class AudioDeviceManager:
         """Check if audio system is available."""
         return self._pyaudio is not None
 
-    def list_devices(self) -> list[dict]:
-        """List all available audio devices with capabilities."""
+    def invalidate_devices(self) -> None:
+        """Forget cached devices so the next lookup re-enumerates.
+
+        Call after a stream error, since the device list may have changed.
+        """
+        self._device_cache = None
+        self._default_cache.clear()
+
+    def _cache_is_fresh(self) -> bool:
+        """Check whether cached lookups are within the TTL."""
+        if time.monotonic() - self._cache_time < self.cache_ttl_seconds:
+            return True
+        self.invalidate_devices()
+        self._cache_time = time.monotonic()
+        return False
+
+    @property
+    def devices(self) -> tuple[dict, ...]:
+        """All available audio devices with capabilities.
+
+        Cached for ``cache_ttl_seconds``; on PulseAudio/PipeWire hosts each
+        device lookup is a round trip to the sound server.
+        """
         if not self._pyaudio:
-            return []
+            return ()
+        if self._device_cache is not None and self._cache_is_fresh():
+            return self._device_cache
 
         devices = []
         for i in range(self._pyaudio.get_device_count()):
@@ -113,7 +419,13 @@ class AudioDeviceManager:
                 )
             except Exception as e:
                 logger.warning("device_enumeration_error", index=i, error=str(e))
-        return devices
+        self._device_cache = tuple(devices)
+        self._cache_time = time.monotonic()
+        return self._device_cache
+
+    def list_devices(self) -> list[dict]:
+        """List all available audio devices with capabilities."""
+        return list(self.devices)
 
     def validate_device(
         self,
@@ -138,33 +450,31 @@ class AudioDeviceManager:
         if device_index is None:
             return True
 
-        try:
-            info = self._pyaudio.get_device_info_by_index(device_index)
-
-            # Check channel count
-            channels_key = "maxInputChannels" if for_input else "maxOutputChannels"
-            if info.get(channels_key, 0) < 1:
-                logger.warning(
-                    "device_insufficient_channels",
-                    device_index=device_index,
-                    for_input=for_input,
-                    channels=info.get(channels_key, 0),
-                )
-                return False
-
-            # Check sample rate support (PyAudio doesn't expose this directly,
-            # but we can catch it during stream creation)
-            return True
-
-        except Exception as e:
+        info = next((d for d in self.devices if d["index"] == device_index), None)
+        if info is None:
             logger.warning(
                 "device_validation_failed",
                 device_index=device_index,
                 for_input=for_input,
-                error=str(e),
+                error="device not found",
             )
             return False
 
+        # Check channel count
+        channels_key = "input_channels" if for_input else "output_channels"
+        if info[channels_key] < 1:
+            logger.warning(
+                "device_insufficient_channels",
+                device_index=device_index,
+                for_input=for_input,
+                channels=info[channels_key],
+            )
+            return False
+
+        # Check sample rate support (PyAudio doesn't expose this directly,
+        # but we can catch it during stream creation)
+        return True
+
     def get_fallback_device(self, for_input: bool = True) -> int | None:
         """Get the default device index as fallback.
 
@@ -177,12 +487,14 @@ class AudioDeviceManager:
         if not self._pyaudio:
             return None
 
+        if for_input in self._default_cache and self._cache_is_fresh():
+            return self._default_cache[for_input]
+
         try:
             if for_input:
                 info = self._pyaudio.get_default_input_device_info()
             else:
                 info = self._pyaudio.get_default_output_device_info()
-            return info.get("index")
         except Exception as e:
             logger.warning(
                 "fallback_device_unavailable",
@@ -190,6 +502,9 @@ class AudioDeviceManager:
                 error=str(e),
             )
             return None
+        index = info.get("index")
+        self._default_cache[for_input] = index
+        return index
 
     def is_device_available(self, device_index: int | None) -> bool:
         """Quick check if a device is currently available.
@@ -221,12 +536,13 @@ class AudioDeviceManager:
 
     def close(self) -> None:
         """Clean up PyAudio resources."""
+        self.invalidate_devices()
         if self._pyaudio:
             self._pyaudio.terminate()
             self._pyaudio = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioManager:
     """Manages audio input/output streams with resilience.
 
@@ -251,71 +567,173 @@ class AudioManager:
     _device_manager: AudioDeviceManager | None = field(default=None, repr=False)
     _input_stream: pyaudio.Stream | None = field(default=None, repr=False)
     _output_stream: pyaudio.Stream | None = field(default=None, repr=False)
-    _audio_queue: queue.Queue[bytes] = field(
-        default_factory=lambda: queue.Queue(maxsize=100), repr=False
+    _output_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _audio_ring: FrameRing = field(init=False, repr=False)
+    # Set from the record thread when a frame lands in the ring
+    _data_event: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    # Playback amplitude hand-off to UI consumers (see amplitudes())
+    _amp_queue: asyncio.Queue[float] = field(
+        default_factory=lambda: asyncio.Queue(maxsize=4), repr=False
     )
+    _amp_readers: int = field(default=0, repr=False)
+    _loop: asyncio.AbstractEventLoop | None = field(default=None, repr=False)
+    _waiting_readers: int = field(default=0, repr=False)
     _is_recording: bool = field(default=False, repr=False)
     _is_playing: bool = field(default=False, repr=False)
     _record_thread: threading.Thread | None = field(default=None, repr=False)
+    # Streamed playback blocks for the playback thread, tagged with the
+    # generation they belong to; None stops the thread
+    _write_queue: queue.Queue[tuple[int, pyaudio.Stream, bytes] | None] = field(
+        default_factory=lambda: queue.Queue(maxsize=_OUTPUT_QUEUE_BLOCKS), repr=False
+    )
+    _write_generation: int = field(default=0, repr=False)
+    _write_error: Exception | None = field(default=None, repr=False)
+    _writer_thread: threading.Thread | None = field(default=None, repr=False)
+    # PyAudio sample format resolved once at init (paInt16)
+    _pa_format: int = field(default=8, repr=False)
+    # Validated pyaudio.open() arguments, resolved once per device
+    _open_input_kwargs: dict[str, Any] | None = field(default=None, repr=False)
+    _open_output_kwargs: dict[str, Any] | None = field(default=None, repr=False)
+    # Amplitude reduction for the configured sample format
+    _amp_kernel: Callable[[bytes, int], int] = field(init=False, repr=False)
+    _amp_width: int = field(init=False, repr=False)
+    _amp_scale: float = field(init=False, repr=False)
+    # Bytes per multi-channel sample frame, for buffer size math
+    _frame_bytes: int = field(init=False, repr=False)
+    # Lead-in silence keyed by the config it was built for
+    _silence_cache: tuple[AudioConfig, bytes] | None = field(default=None, repr=False)
 
     # Health monitoring state
     _consecutive_errors: int = field(default=0, repr=False)
-    _last_successful_read: float = field(default=0.0, repr=False)
+    _last_successful_read: float = field(default=0.0, repr=False)  # monotonic
     _health_check_task: asyncio.Task | None = field(default=None, repr=False)
+    # Last PyAudio init failure while retries are still pending
+    _init_error: Exception | None = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
-        """Initialize PyAudio with retry logic."""
-        self._init_with_retry()
+        """Initialize PyAudio with retry logic.
+
+        Outside an event loop the full retry loop runs here. Inside one,
+        only the first attempt does; retries with backoff are left to
+        ``await initialize()`` so they never block the loop.
+        """
+        self._audio_ring = FrameRing(self.config.ring_capacity)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._init_with_retry()
+        else:
+            if not self._init_attempt(0):
+                logger.info("audio_init_deferred", error=str(self._init_error))
+        if self._pyaudio:
+            self._preflight_streams()
+        # Amplitude kernel for the configured bit depth (PyAudio falls back
+        # to int16 for anything else, so the kernel does too)
+        bits = self.config.format_bits if self.config.format_bits in _PCM_MAX else 16
+        self._amp_kernel = _SUMSQ_KERNELS[bits]
+        self._amp_width = bits // 8
+        self._amp_scale = _AMP_GAIN / _PCM_MAX[bits]
+        self._frame_bytes = self._amp_width * self.config.channels
+        # Compile (or load the cached) kernel before playback needs it, for
+        # both contiguous and strided input
+        self._amp_kernel(bytes(self._amp_width), 1)
+        self._amp_kernel(bytes(2 * self._amp_width), 2)
+
+    def _init_attempt(self, attempt: int) -> bool:
+        """Make one PyAudio initialization attempt.
+
+        A missing PyAudio install counts as done: audio is simply
+        unavailable and retrying would not help.
+
+        Args:
+            attempt: Zero-based attempt number, for logging
+
+        Returns:
+            True if no retry is needed, False if the attempt failed
+        """
+        try:
+            import pyaudio
+
+            self._pyaudio = pyaudio.PyAudio()
+            self._pa_format = {
+                8: pyaudio.paInt8,
+                16: pyaudio.paInt16,
+                24: pyaudio.paInt24,
+                32: pyaudio.paInt32,
+            }.get(self.config.format_bits, pyaudio.paInt16)
+            self._device_manager = AudioDeviceManager(_pyaudio=self._pyaudio)
+
+            logger.info(
+                "audio_manager_initialized",
+                sample_rate=self.config.sample_rate,
+                channels=self.config.channels,
+                attempt=attempt + 1,
+            )
+
+        except ImportError:
+            logger.warning("pyaudio_not_installed", msg="Audio features unavailable")
+            self._pyaudio = None
+            self._device_manager = None
+
+        except Exception as e:
+            self._init_error = e
+            logger.warning(
+                "audio_init_retry",
+                attempt=attempt + 1,
+                max_attempts=self.config.max_init_retries,
+                error=str(e),
+            )
+            return False
+
+        self._init_error = None
+        return True
+
+    def _init_exhausted(self) -> AudioInitializationError:
+        """Build the error raised once every init attempt has failed."""
+        return AudioInitializationError(
+            f"Failed to initialize audio after {self.config.max_init_retries} attempts",
+            original_error=self._init_error,
+        )
 
     def _init_with_retry(self) -> None:
-        """Initialize PyAudio with exponential backoff retry.
+        """Initialize PyAudio with exponential backoff retry (blocking).
 
         Raises:
             AudioInitializationError: If all retries exhausted
         """
         delay = self.config.retry_delay_seconds
-        last_error: Exception | None = None
-
         for attempt in range(self.config.max_init_retries):
-            try:
-                import pyaudio
+            if attempt:
+                time.sleep(delay)
+                delay *= self.config.retry_backoff_factor
+            if self._init_attempt(attempt):
+                return
 
-                self._pyaudio = pyaudio.PyAudio()
-                self._device_manager = AudioDeviceManager()
-                self._device_manager._pyaudio = self._pyaudio
+        raise self._init_exhausted()
 
-                logger.info(
-                    "audio_manager_initialized",
-                    sample_rate=self.config.sample_rate,
-                    channels=self.config.channels,
-                    attempt=attempt + 1,
-                )
-                return
+    async def initialize(self) -> None:
+        """Finish PyAudio initialization without blocking the event loop.
 
-            except ImportError:
-                logger.warning("pyaudio_not_installed", msg="Audio features unavailable")
-                self._pyaudio = None
-                self._device_manager = None
-                return
+        Retries a first attempt that failed in ``__post_init__``, sleeping
+        between attempts with ``asyncio.sleep``. Does nothing if PyAudio
+        is already initialized (or not installed).
 
-            except Exception as e:
-                last_error = e
-                logger.warning(
-                    "audio_init_retry",
-                    attempt=attempt + 1,
-                    max_attempts=self.config.max_init_retries,
-                    delay=delay,
-                    error=str(e),
-                )
-                if attempt < self.config.max_init_retries - 1:
-                    time.sleep(delay)
-                    delay *= self.config.retry_backoff_factor
+        Raises:
+            AudioInitializationError: If all retries exhausted
+        """
+        if self._init_error is None:
+            return
 
-        # All retries exhausted
-        raise AudioInitializationError(
-            f"Failed to initialize audio after {self.config.max_init_retries} attempts",
-            original_error=last_error,
-        )
+        delay = self.config.retry_delay_seconds
+        for attempt in range(1, self.config.max_init_retries):
+            await asyncio.sleep(delay)
+            delay *= self.config.retry_backoff_factor
+            if self._init_attempt(attempt):
+                if self._pyaudio:
+                    self._preflight_streams()
+                return
+
+        raise self._init_exhausted()
 
     @property
     def is_available(self) -> bool:
@@ -325,15 +743,7 @@ class AudioManager:
     @property
     def pyaudio_format(self) -> int:
         """Get PyAudio format constant for configured bit depth."""
-        import pyaudio
-
-        format_map = {
-            8: pyaudio.paInt8,
-            16: pyaudio.paInt16,
-            24: pyaudio.paInt24,
-            32: pyaudio.paInt32,
-        }
-        return format_map.get(self.config.format_bits, pyaudio.paInt16)
+        return self._pa_format
 
     def list_devices(self) -> list[dict[str, str | int]]:
         """List available audio devices."""
@@ -383,48 +793,237 @@ class AudioManager:
 
         raise AudioDeviceNotFoundError(configured_index, for_input)
 
-    def _audio_callback(
-        self,
-        in_data: bytes | None,
-        _frame_count: int,
-        _time_info: dict,
-        status: int,
-    ) -> tuple[None, int]:
-        """Callback for audio stream - runs in separate thread."""
-        import pyaudio
-
-        # Check for stream errors
-        if status:
-            self._consecutive_errors += 1
-            logger.warning(
-                "audio_callback_status",
-                status=status,
-                consecutive_errors=self._consecutive_errors,
-            )
+    def _stream_kwargs(self, for_input: bool) -> dict[str, Any]:
+        """Return validated ``pyaudio.open()`` arguments for one direction.
 
-            if self._consecutive_errors >= self.config.max_consecutive_errors:
-                # Trigger error callback in main thread
-                if self.on_device_error:
-                    error = AudioStreamDisconnectedError(
-                        self.config.input_device_index, "input"
-                    )
-                    # Can't call async from callback, so just log
+        Device selection (with fallback) and the PortAudio format check run
+        the first time only; later opens reuse the cached arguments until
+        an open or write fails.
+
+        Raises:
+            AudioDeviceNotFoundError: If no valid device available
+            AudioInitializationError: If the device rejects the format
+        """
+        cached = self._open_input_kwargs if for_input else self._open_output_kwargs
+        if cached is not None:
+            return cached
+
+        channels = self.config.channels
+        if for_input and self.config.capture_channels > 1:
+            if channels != 1 or self.config.format_bits != 16:
+                raise AudioInitializationError(
+                    "capture_channels > 1 downmixes to mono int16; "
+                    f"got channels={channels}, format_bits={self.config.format_bits}"
+                )
+            channels = self.config.capture_channels
+
+        device_index = self._validate_and_get_device(for_input=for_input)
+        check_index = device_index
+        if check_index is None and self._device_manager:
+            check_index = self._device_manager.get_fallback_device(for_input)
+
+        if self._pyaudio and check_index is not None:
+            direction = "input" if for_input else "output"
+            try:
+                self._pyaudio.is_format_supported(
+                    self.config.sample_rate,
+                    **{
+                        f"{direction}_device": check_index,
+                        f"{direction}_channels": channels,
+                        f"{direction}_format": self._pa_format,
+                    },
+                )
+            except ValueError as e:
+                raise AudioInitializationError(
+                    f"Audio {direction} device does not support "
+                    f"{self.config.sample_rate} Hz / {channels} ch / "
+                    f"{self.config.format_bits}-bit: {e}",
+                    device_index=check_index,
+                    original_error=e,
+                ) from e
+
+        kwargs: dict[str, Any] = {
+            "format": self._pa_format,
+            "channels": channels,
+            "rate": self.config.sample_rate,
+            "frames_per_buffer": self._low_latency_frames(check_index, for_input),
+        }
+        if for_input:
+            kwargs.update(input=True, input_device_index=device_index)
+            self._open_input_kwargs = kwargs
+        else:
+            kwargs.update(output=True, output_device_index=device_index)
+            self._open_output_kwargs = kwargs
+        return kwargs
+
+    def _low_latency_frames(self, device_index: int | None, for_input: bool) -> int:
+        """Pick a host buffer size matching the device's low-latency hint.
+
+        PyAudio already opens streams with the device's
+        ``defaultLow{Input,Output}Latency`` as PortAudio's suggested latency
+        but offers no way to pass ``PaStreamParameters`` directly; the
+        buffer size is the knob left. It is the smallest power of two that
+        covers the hint, capped at ``chunk_size`` (reads and writes still
+        move whole chunks).
+        """
+        chunk_size = self.config.chunk_size
+        if not self._pyaudio:
+            return chunk_size
+        direction = "Input" if for_input else "Output"
+        try:
+            if device_index is None:
+                info = getattr(
+                    self._pyaudio, f"get_default_{direction.lower()}_device_info"
+                )()
+            else:
+                info = self._pyaudio.get_device_info_by_index(device_index)
+            latency = float(info[f"defaultLow{direction}Latency"])
+        except (OSError, KeyError, TypeError, ValueError):
+            return chunk_size
+        frames = math.ceil(latency * self.config.sample_rate)
+        if frames <= 0:
+            return chunk_size
+        return min(chunk_size, 1 << (frames - 1).bit_length())
+
+    def _forget_device(self, for_input: bool) -> None:
+        """Drop cached open arguments and device info after a stream failure.
+
+        The next open re-resolves the device, since it may have been
+        unplugged or renumbered.
+        """
+        if for_input:
+            self._open_input_kwargs = None
+        else:
+            self._open_output_kwargs = None
+        if self._device_manager:
+            self._device_manager.invalidate_devices()
+
+    def _preflight_streams(self) -> None:
+        """Validate input and output stream parameters once at startup.
+
+        A missing device is only logged, since it may appear before the
+        first open; an unsupported format raises immediately.
+
+        Raises:
+            AudioInitializationError: If a device rejects the format
+        """
+        for for_input in (True, False):
+            try:
+                self._stream_kwargs(for_input)
+            except AudioDeviceNotFoundError as e:
+                logger.warning(
+                    "audio_preflight_device_unavailable",
+                    for_input=for_input,
+                    error=str(e),
+                )
+
+    def _reader_loop(self, stream: pyaudio.Stream) -> None:
+        """Blocking capture loop - runs on the dedicated record thread.
+
+        The first ``input_warmup_chunks`` chunks (mic settling) are
+        discarded with a single read before anything reaches the ring.
+        After that it reads one chunk at a time, downmixes it to mono when
+        ``capture_channels`` > 1 and pushes it into the ring. Read errors
+        are counted; after ``max_consecutive_errors`` in a row the stream is
+        reported as disconnected through ``on_device_error`` on the event
+        loop and the loop exits.
+        """
+        self._boost_capture_thread()
+        chunk_size = self.config.chunk_size
+        capture_channels = self.config.capture_channels
+
+        if self.config.input_warmup_chunks > 0:
+            try:
+                stream.read(
+                    chunk_size * self.config.input_warmup_chunks,
+                    exception_on_overflow=False,
+                )
+            except Exception as e:
+                logger.debug("audio_warmup_read_failed", error=str(e))
+
+        while self._is_recording:
+            try:
+                data = stream.read(chunk_size, exception_on_overflow=False)
+            except Exception as e:
+                if not self._is_recording:
+                    break  # Stream stopped underneath a pending read
+                self._consecutive_errors += 1
+                logger.warning(
+                    "audio_read_error",
+                    error=str(e),
+                    consecutive_errors=self._consecutive_errors,
+                )
+                if self._consecutive_errors >= self.config.max_consecutive_errors:
                     logger.error(
                         "stream_disconnected",
                         device=self.config.input_device_index,
                         consecutive_errors=self._consecutive_errors,
                     )
-        else:
-            self._consecutive_errors = 0
-            self._last_successful_read = time.time()
+                    self._report_device_error(
+                        AudioStreamDisconnectedError(
+                            self.config.input_device_index, "input"
+                        )
+                    )
+                    break
+                continue
 
-        if in_data and self._is_recording:
-            try:
-                self._audio_queue.put_nowait(in_data)
-            except queue.Full:
+            if capture_channels > 1:
+                data = _downmix_int16(data, capture_channels)
+            self._consecutive_errors = 0
+            self._last_successful_read = time.monotonic()
+            if not self._push_frame(data):
                 logger.warning("audio_queue_full", msg="Dropping audio frame")
 
-        return (None, pyaudio.paContinue)
+    def _report_device_error(self, error: AudioDeviceError) -> None:
+        """Deliver a device error to ``on_device_error`` on the event loop."""
+        loop = self._loop
+        if self.on_device_error is None or loop is None:
+            return
+        # RuntimeError: loop closed during shutdown
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(self.on_device_error, error)
+
+    def _boost_capture_thread(self) -> None:
+        """Raise the calling (record) thread's scheduling priority.
+
+        Applies ``_set_rt_priority`` and pins the thread to
+        ``config.audio_cpu`` when set. Failures are logged and ignored;
+        capture works the same, just with more jitter.
+        """
+        tid = threading.get_native_id()
+        _set_rt_priority()
+
+        cpu = self.config.audio_cpu
+        if cpu is None:
+            return
+        if not hasattr(os, "sched_setaffinity"):
+            logger.warning("audio_cpu_pinning_unsupported", cpu=cpu)
+            return
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except OSError as e:
+            logger.warning("audio_cpu_pinning_failed", cpu=cpu, tid=tid, error=str(e))
+            return
+        logger.info("audio_capture_thread_pinned", cpu=cpu, tid=tid)
+
+    def _push_frame(self, frame: bytes) -> bool:
+        """Add a captured frame to the ring and wake a waiting reader.
+
+        Safe to call from the record thread.
+
+        Returns:
+            False if the ring is full and the frame was dropped
+        """
+        if not self._audio_ring.push(frame):
+            return False
+        loop = self._loop
+        # Only cross threads when a reader is parked on the event; readers
+        # register before their final empty check, so none is missed.
+        if loop is not None and self._waiting_readers:
+            # RuntimeError: loop closed during shutdown
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(self._data_event.set)
+        return True
 
     async def start_recording(self) -> None:
         """Start recording audio from microphone.
@@ -441,39 +1040,35 @@ class AudioManager:
             return
 
         # Validate device before opening stream
-        device_index = self._validate_and_get_device(for_input=True)
+        open_kwargs = self._stream_kwargs(for_input=True)
+        device_index = open_kwargs["input_device_index"]
 
         # Clear any stale audio
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        self._audio_ring.clear()
+        self._loop = asyncio.get_running_loop()
 
         # Reset health monitoring
         self._consecutive_errors = 0
-        self._last_successful_read = time.time()
+        self._last_successful_read = time.monotonic()
 
         try:
-            self._input_stream = self._pyaudio.open(
-                format=self.pyaudio_format,
-                channels=self.config.channels,
-                rate=self.config.sample_rate,
-                input=True,
-                input_device_index=device_index,
-                frames_per_buffer=self.config.chunk_size,
-                stream_callback=self._audio_callback,
-            )
+            # Blocking-read stream, drained by a dedicated record thread
+            self._input_stream = self._pyaudio.open(**open_kwargs, start=False)
 
             self._is_recording = True
             self._input_stream.start_stream()
-
-            # Discard warmup chunks (mic settling)
-            for _ in range(self.config.input_warmup_chunks):
-                try:
-                    self._audio_queue.get(timeout=0.1)
-                except queue.Empty:
-                    break
+            self._record_thread = threading.Thread(
+                target=self._reader_loop,
+                args=(self._input_stream,),
+                name="reachy-audio-capture",
+                daemon=True,
+            )
+            self._record_thread.start()
+            logger.debug(
+                "input_stream_latency",
+                latency_ms=round(self._input_stream.get_input_latency() * 1000, 2),
+                frames_per_buffer=open_kwargs["frames_per_buffer"],
+            )
 
             logger.info(
                 "recording_started",
@@ -482,6 +1077,8 @@ class AudioManager:
             )
 
         except Exception as e:
+            await self.stop_recording()
+            self._forget_device(for_input=True)
             raise AudioInitializationError(
                 f"Failed to open input stream: {e}",
                 device_index=device_index,
@@ -491,6 +1088,14 @@ class AudioManager:
     async def stop_recording(self) -> None:
         """Stop recording audio."""
         self._is_recording = False
+        # Wake read_audio_stream so it sees the stop without waiting for data
+        self._data_event.set()
+        thread, self._record_thread = self._record_thread, None
+        if thread is not None:
+            # The pending blocking read returns within one chunk
+            await asyncio.to_thread(thread.join, 1.0)
+            if thread.is_alive():
+                logger.warning("record_thread_join_timeout")
         if self._input_stream:
             try:
                 self._input_stream.stop_stream()
@@ -503,25 +1108,118 @@ class AudioManager:
     async def read_audio(self, timeout: float = 0.1) -> bytes | None:
         """Read a chunk of audio from the recording buffer.
 
+        The chunk is the ``bytes`` object returned by PyAudio's read,
+        passed through the ring without a copy. Callers may keep it (the
+        pipeline buffers utterances), so no reusable slot view is returned.
+
         Args:
             timeout: Maximum time to wait for audio data
 
         Returns:
             Audio bytes or None if timeout
         """
+        ring = self._audio_ring
+        frame = ring.pop()
+        if frame is not None:
+            return frame
+
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        event = self._data_event
+        deadline = loop.time() + timeout
+        self._waiting_readers += 1
         try:
-            return await asyncio.get_event_loop().run_in_executor(
-                None, lambda: self._audio_queue.get(timeout=timeout)
-            )
-        except queue.Empty:
-            return None
+            while True:
+                # Clear before re-checking so a push in between is not missed
+                event.clear()
+                frame = ring.pop()
+                if frame is not None:
+                    return frame
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return None
+                try:
+                    await asyncio.wait_for(event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    return ring.pop()
+        finally:
+            self._waiting_readers -= 1
+
+    def queue_depth(self) -> int:
+        """Number of captured chunks waiting to be read."""
+        return len(self._audio_ring)
 
-    async def read_audio_stream(self) -> AsyncIterator[bytes]:
-        """Async generator yielding audio chunks while recording."""
+    async def read_audio_stream(self, coalesce: int = 1) -> AsyncIterator[bytes]:
+        """Async generator yielding audio chunks while recording.
+
+        Sleeps on the data event between chunks and ends as soon as
+        ``stop_recording`` is called, with no polling timeout.
+
+        Args:
+            coalesce: Maximum number of chunks joined into one yield. Only
+                chunks already buffered are joined, so a consumer that keeps
+                up still gets single chunks with no added latency, while one
+                that falls behind catches up in larger batches. Keep the
+                default of 1 for consumers that need exact chunk boundaries
+                (e.g. Silero VAD).
+        """
+        ring = self._audio_ring
+        event = self._data_event
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        while self._is_recording:
+            chunk = ring.pop()
+            if chunk is None:
+                self._waiting_readers += 1
+                try:
+                    # Clear before re-checking so a push in between is not missed
+                    event.clear()
+                    if (chunk := ring.pop()) is None:
+                        if self._is_recording:
+                            await event.wait()
+                        continue
+                finally:
+                    self._waiting_readers -= 1
+            if coalesce > 1:
+                parts = [chunk]
+                while len(parts) < coalesce and (extra := ring.pop()) is not None:
+                    parts.append(extra)
+                if len(parts) > 1:
+                    chunk = b"".join(parts)
+            yield chunk
+
+    async def read_audio_batched(
+        self, frames: int = 4, max_wait: float = 0.05
+    ) -> AsyncIterator[bytes]:
+        """Async generator yielding fixed-size batches of audio while recording.
+
+        Unlike ``read_audio_stream(coalesce=...)``, which only joins chunks
+        that are already buffered, this waits for ``frames`` chunks so
+        throughput-oriented consumers (e.g. STT) get contiguous buffers of
+        a predictable size. A partial batch is yielded once ``max_wait``
+        has passed since its first chunk, so latency stays bounded.
+
+        Args:
+            frames: Number of chunks joined into each batch
+            max_wait: Maximum seconds to hold a partial batch
+        """
+        loop = asyncio.get_running_loop()
         while self._is_recording:
-            chunk = await self.read_audio(timeout=0.1)
-            if chunk:
-                yield chunk
+            first = await self.read_audio(timeout=max_wait)
+            if first is None:
+                continue
+            parts = [first]
+            deadline = loop.time() + max_wait
+            while len(parts) < frames:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                chunk = await self.read_audio(timeout=remaining)
+                if chunk is None:
+                    break
+                parts.append(chunk)
+            yield first if len(parts) == 1 else b"".join(parts)
 
     def _generate_silence(self, duration_ms: int) -> bytes:
         """Generate silence audio for lead-in.
@@ -533,45 +1231,172 @@ class AudioManager:
             Silent PCM audio bytes
         """
         num_samples = int(self.config.sample_rate * duration_ms / 1000)
-        silence = np.zeros(num_samples, dtype=np.int16)
-        return silence.tobytes()
+        return bytes(num_samples * self._frame_bytes)
+
+    def _lead_in_silence(self) -> bytes:
+        """Return the lead-in silence for the current config, built once."""
+        cached = self._silence_cache
+        if cached is None or cached[0] is not self.config:
+            cached = (
+                self.config,
+                self._generate_silence(self.config.output_lead_in_ms),
+            )
+            self._silence_cache = cached
+        return cached[1]
 
-    async def play_audio(self, audio_data: bytes) -> None:
-        """Play audio through the speaker.
+    def _ensure_output_stream(self) -> pyaudio.Stream:
+        """Return the shared output stream, opening it on first use.
 
-        Args:
-            audio_data: Raw PCM audio bytes to play
+        The stream stays open across utterances so playback does not pay
+        for a device open/close each time. Writes are serialized with
+        ``_output_lock``.
 
         Raises:
+            AudioInitializationError: If PyAudio is not available
             AudioDeviceNotFoundError: If output device unavailable
         """
         if not self._pyaudio:
             raise AudioInitializationError("PyAudio not available")
 
-        # Validate device before playing
-        device_index = self._validate_and_get_device(for_input=False)
+        if self._output_stream is None:
+            open_kwargs = self._stream_kwargs(for_input=False)
+            try:
+                self._output_stream = self._pyaudio.open(**open_kwargs)
+            except Exception:
+                self._forget_device(for_input=False)
+                raise
+            logger.debug(
+                "output_stream_latency",
+                latency_ms=round(self._output_stream.get_output_latency() * 1000, 2),
+                frames_per_buffer=open_kwargs["frames_per_buffer"],
+            )
+        return self._output_stream
 
-        def _play() -> None:
-            stream = self._pyaudio.open(
-                format=self.pyaudio_format,
-                channels=self.config.channels,
-                rate=self.config.sample_rate,
-                output=True,
-                output_device_index=device_index,
+    def _close_output_stream(self) -> None:
+        """Close the shared output stream if it is open."""
+        stream, self._output_stream = self._output_stream, None
+        if stream is None:
+            return
+        try:
+            with self._output_lock:
+                stream.stop_stream()
+                stream.close()
+        except Exception as e:
+            logger.warning("stream_close_error", error=str(e))
+
+    async def _run_output(self, func: Callable[..., None], *args: bytes) -> None:
+        """Run a blocking output write in the executor.
+
+        A failed write drops the shared stream so the next playback reopens
+        the device instead of reusing a broken stream.
+        """
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, func, *args)
+        except Exception:
+            self._close_output_stream()
+            self._forget_device(for_input=False)
+            raise
+
+    def _ensure_writer_thread(self) -> None:
+        """Start the playback thread if it is not running."""
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop,
+                name="reachy-audio-playback",
+                daemon=True,
             )
+            self._writer_thread.start()
+
+    def _writer_loop(self) -> None:
+        """Blocking playback loop - runs on the dedicated playback thread.
+
+        Writes queued blocks in order. Blocks from an older generation
+        (an interrupted or failed stream) are skipped. A write error is
+        stored for ``play_audio_stream`` to raise and retires the current
+        generation, so the rest of that stream is dropped.
+        """
+        _set_rt_priority()
+        write_queue = self._write_queue
+        while True:
+            item = write_queue.get()
             try:
-                # Add lead-in silence to prevent click/pop
-                if self.config.output_lead_in_ms > 0:
-                    silence = self._generate_silence(self.config.output_lead_in_ms)
-                    stream.write(silence)
-                stream.write(audio_data)
+                if item is None:
+                    return
+                generation, stream, data = item
+                if generation != self._write_generation:
+                    continue
+                with self._output_lock:
+                    stream.write(data)
+            except Exception as e:
+                self._write_generation += 1
+                self._write_error = e
             finally:
-                stream.stop_stream()
-                stream.close()
+                write_queue.task_done()
+
+    async def _queue_output(self, item: tuple[int, pyaudio.Stream, bytes]) -> None:
+        """Hand a block to the playback thread, waiting only if it is behind."""
+        try:
+            self._write_queue.put_nowait(item)
+        except queue.Full:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write_queue.put, item
+            )
+        self._raise_write_error()
+
+    async def _drain_output(self) -> None:
+        """Wait until the playback thread has written every queued block."""
+        if self._write_queue.unfinished_tasks:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write_queue.join
+            )
+        self._raise_write_error()
+
+    def _raise_write_error(self) -> None:
+        """Re-raise a playback thread write error, dropping the broken stream."""
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            self._close_output_stream()
+            self._forget_device(for_input=False)
+            raise error
+
+    async def _stop_writer_thread(self) -> None:
+        """Stop the playback thread after it finishes queued blocks."""
+        thread, self._writer_thread = self._writer_thread, None
+        if thread is None or not thread.is_alive():
+            return
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write_queue.put, None
+        )
+        await asyncio.to_thread(thread.join, 1.0)
+        if thread.is_alive():
+            logger.warning("writer_thread_join_timeout")
+
+    async def play_audio(self, audio_data: bytes) -> None:
+        """Play audio through the speaker.
+
+        Args:
+            audio_data: Raw PCM audio bytes to play
+
+        Raises:
+            AudioDeviceNotFoundError: If output device unavailable
+        """
+        stream = self._ensure_output_stream()
+        # Add lead-in silence to prevent click/pop. Joining it onto the
+        # audio costs one copy but lets PortAudio take the whole utterance
+        # in a single write, with no underrun gap between the two.
+        if self.config.output_lead_in_ms > 0:
+            audio_data = b"".join((self._lead_in_silence(), audio_data))
+
+        def _play() -> None:
+            with self._output_lock:
+                stream.write(audio_data)
 
         self._is_playing = True
         try:
-            await asyncio.get_event_loop().run_in_executor(None, _play)
+            await self._run_output(_play)
         finally:
             self._is_playing = False
 
@@ -582,6 +1407,17 @@ class AudioManager:
     ) -> None:
         """Stream audio chunks to the speaker.
 
+        Blocks are written by a dedicated playback thread fed through a
+        small bounded queue, so the event loop only waits on it when
+        PortAudio falls behind, plus once at the end for the final write.
+        If the stream is interrupted (e.g. cancelled on barge-in), blocks
+        not yet written are dropped.
+
+        Amplitude updates are handed to a separate task through a small
+        queue, so a slow ``on_amplitude`` never delays the next speaker
+        write; updates are dropped while that queue is full. Consumers
+        without a callback can read the same updates from ``amplitudes()``.
+
         Args:
             audio_chunks: Async iterator of audio bytes
             on_amplitude: Optional callback with audio amplitude (0.0-1.0)
@@ -589,54 +1425,116 @@ class AudioManager:
         Raises:
             AudioDeviceNotFoundError: If output device unavailable
         """
-        if not self._pyaudio:
-            raise AudioInitializationError("PyAudio not available")
-
-        # Validate device before streaming
-        device_index = self._validate_and_get_device(for_input=False)
-
-        stream = self._pyaudio.open(
-            format=self.pyaudio_format,
-            channels=self.config.channels,
-            rate=self.config.sample_rate,
-            output=True,
-            output_device_index=device_index,
+        stream = self._ensure_output_stream()
+        self._ensure_writer_thread()
+        generation = self._write_generation
+        forwarder = (
+            asyncio.create_task(self._forward_amplitudes(on_amplitude))
+            if on_amplitude
+            else None
         )
 
         self._is_playing = True
         try:
             # Add lead-in silence to prevent click/pop
             if self.config.output_lead_in_ms > 0:
-                silence = self._generate_silence(self.config.output_lead_in_ms)
-                await asyncio.get_event_loop().run_in_executor(
-                    None, stream.write, silence
-                )
+                await self._queue_output((generation, stream, self._lead_in_silence()))
 
+            # Coalesce small TTS chunks into ~8-chunk blocks so each
+            # PortAudio write gets a large block instead of one per chunk.
+            block_bytes = (
+                self.config.chunk_size * _OUTPUT_BLOCK_CHUNKS * self._frame_bytes
+            )
+            staging = bytearray()
+            loop = asyncio.get_running_loop()
+            last_emit = 0.0
+            # Chunks since the last amplitude update, reported as one RMS window
+            window: list[bytes] = []
             async for chunk in audio_chunks:
-                if on_amplitude:
-                    amplitude = self._calculate_amplitude(chunk)
-                    on_amplitude(amplitude)
-
-                await asyncio.get_event_loop().run_in_executor(
-                    None, stream.write, chunk
-                )
+                if forwarder or self._amp_readers:
+                    window.append(chunk)
+                    if loop.time() - last_emit > _AMPLITUDE_INTERVAL:
+                        self._publish_amplitude(
+                            self._calculate_amplitude_batched(window)
+                        )
+                        window.clear()
+                        last_emit = loop.time()
+
+                staging += chunk
+                if len(staging) >= block_bytes:
+                    block = bytes(staging)
+                    staging.clear()
+                    await self._queue_output((generation, stream, block))
+
+            if staging:
+                await self._queue_output((generation, stream, bytes(staging)))
+            await self._drain_output()
+        except BaseException:
+            if self._write_generation == generation:
+                self._write_generation += 1  # Drop blocks not yet written
+            raise
         finally:
-            if on_amplitude:
+            if on_amplitude and forwarder:
+                forwarder.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await forwarder
+                # Flush what the forwarder had not reached yet
+                while not self._amp_queue.empty():
+                    on_amplitude(self._amp_queue.get_nowait())
                 on_amplitude(0.0)  # Reset amplitude when done
-            stream.stop_stream()
-            stream.close()
+            elif self._amp_readers:
+                self._publish_amplitude(0.0)
             self._is_playing = False
 
+    def _publish_amplitude(self, amplitude: float) -> None:
+        """Queue an amplitude update, dropping it if consumers are behind."""
+        with contextlib.suppress(asyncio.QueueFull):
+            self._amp_queue.put_nowait(amplitude)
+
+    async def _forward_amplitudes(self, on_amplitude: Callable[[float], None]) -> None:
+        """Deliver queued amplitude updates to a callback."""
+        async for amplitude in self.amplitudes():
+            on_amplitude(amplitude)
+
+    async def amplitudes(self) -> AsyncIterator[float]:
+        """Async generator of playback amplitudes (0.0-1.0).
+
+        While at least one reader is active, ``play_audio_stream`` publishes
+        throttled amplitude updates and a final 0.0 when playback ends.
+        """
+        self._amp_readers += 1
+        try:
+            while True:
+                yield await self._amp_queue.get()
+        finally:
+            self._amp_readers -= 1
+
     def _calculate_amplitude(self, audio_data: bytes) -> float:
         """Calculate RMS amplitude of audio chunk (0.0-1.0)."""
-        samples = np.frombuffer(audio_data, dtype=np.int16)
-        if len(samples) == 0:
-            return 0.0
+        return self._calculate_amplitude_batched((audio_data,))
+
+    def _calculate_amplitude_batched(self, chunks: Sequence[bytes]) -> float:
+        """Calculate RMS amplitude over several chunks as one window (0.0-1.0).
 
-        rms = np.sqrt(np.mean(samples.astype(np.float32) ** 2))
-        # Normalize to 0-1 range (int16 max is 32767)
-        amplitude = min(1.0, rms / 32767.0 * 3.0)  # Scale up for visibility
-        return amplitude
+        Chunks longer than ``_AMP_SAMPLES`` samples are subsampled with a
+        stride, so large TTS chunks cost about the same as small ones. Each
+        chunk's subsample is scaled back up to the chunk's length, so
+        chunks still count in proportion to their duration.
+        """
+        sumsq = 0.0
+        count = 0
+        kernel = self._amp_kernel
+        for chunk in chunks:
+            samples = len(chunk) // self._amp_width
+            if samples == 0:
+                continue
+            stride = max(1, samples // _AMP_SAMPLES)
+            visited = -(-samples // stride)
+            sumsq += kernel(chunk, stride) * (samples / visited)
+            count += samples
+        if count == 0:
+            return 0.0
+        return min(1.0, math.sqrt(sumsq / count) * self._amp_scale)
 
     def stop_playback(self) -> None:
         """Stop any ongoing audio playback."""
@@ -653,7 +1551,7 @@ class AudioManager:
 
         # Check for stale reads (no audio for too long)
         if self._last_successful_read > 0:
-            elapsed = time.time() - self._last_successful_read
+            elapsed = time.monotonic() - self._last_successful_read
             if elapsed > self.config.health_check_interval_seconds:
                 logger.warning(
                     "audio_health_check_failed",
@@ -676,6 +1574,8 @@ class AudioManager:
     async def close(self) -> None:
         """Clean up audio resources."""
         await self.stop_recording()
+        await self._stop_writer_thread()
+        self._close_output_stream()
         if self._device_manager:
             self._device_manager.close()
             self._device_manager = None
@@ -686,6 +1586,7 @@ class AudioManager:
 
     async def __aenter__(self) -> AudioManager:
         """Async context manager entry."""
+        await self.initialize()
         return self
 
     async def __aexit__(self, *args: object) -> None:
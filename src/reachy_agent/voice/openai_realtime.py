@@ -7,7 +7,7 @@ with the gpt-realtime-mini model for low-latency voice interactions.
 from __future__ import annotations
 
 import asyncio
-import base64
+import math
 import os
 import time
 from collections.abc import AsyncIterator, Callable
@@ -18,6 +18,17 @@ from typing import TYPE_CHECKING
 import numpy as np
 import structlog
 
+# Optional SIMD base64 codec (AVX2/AVX-512 VBMI where the CPU has it);
+# the stdlib functions have the same signatures
+try:
+    import pybase64 as _b64
+
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    import base64 as _b64  # type: ignore[no-redef]
+
+    PYBASE64_AVAILABLE = False
+
 if TYPE_CHECKING:
     from openai import AsyncOpenAI
     from openai.resources.beta.realtime import AsyncRealtimeConnection
@@ -28,6 +39,69 @@ logger = structlog.get_logger(__name__)
 # We use a conservative threshold to proactively reconnect before timeout.
 CONNECTION_IDLE_TIMEOUT_SECONDS = 25.0
 
+# HeadWobble drives a servo that cannot follow more than ~30 updates a
+# second, so response amplitude is computed at most this often.
+AMPLITUDE_UPDATE_INTERVAL_SECONDS = 0.033
+
+
+class _PolyphaseResampler:
+    """Streaming rational-ratio resampler for int16 PCM.
+
+    Upsamples by ``up``, low-pass filters with a Kaiser-windowed sinc and
+    downsamples by ``down`` in one polyphase step, so only the taps that
+    land on an output sample are ever computed. The last few input
+    samples are carried between calls so consecutive chunks join without
+    edge artifacts; call ``reset()`` between unrelated streams.
+    """
+
+    __slots__ = ("rates", "_up", "_down", "_phases", "_taps", "_history", "_next_t")
+
+    def __init__(
+        self,
+        from_rate: int,
+        to_rate: int,
+        taps_per_phase: int = 16,
+        beta: float = 8.0,
+    ) -> None:
+        self.rates = (from_rate, to_rate)
+        g = math.gcd(from_rate, to_rate)
+        self._up = to_rate // g
+        self._down = from_rate // g
+        self._taps = taps_per_phase
+        length = taps_per_phase * self._up
+        cutoff = 1.0 / max(self._up, self._down)  # Of the upsampled Nyquist
+        n = np.arange(length) - (length - 1) / 2
+        h = cutoff * np.sinc(cutoff * n) * np.kaiser(length, beta)
+        h *= self._up / h.sum()  # Unity DC gain once zero-stuffing is undone
+        # Column p holds phase p's taps, oldest input first, so a window of
+        # inputs times the matrix gives every phase's output at once
+        self._phases = np.ascontiguousarray(
+            h.reshape(taps_per_phase, self._up)[::-1], dtype=np.float32
+        )
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget carried-over samples before starting an unrelated stream."""
+        self._history = np.zeros(self._taps - 1, dtype=np.float32)
+        self._next_t = 0  # Upsampled position of the next output sample
+
+    def process(self, audio_data: bytes) -> bytes:
+        """Resample one chunk of int16 PCM, continuing the previous chunk."""
+        x = np.frombuffer(audio_data, dtype=np.int16)
+        end = len(x) * self._up
+        t = np.arange(self._next_t, end, self._down)
+        buf = np.concatenate((self._history, x.astype(np.float32)))
+        if len(t):
+            # Row i: the filter output of every phase ending at input i
+            windows = np.lib.stride_tricks.sliding_window_view(buf, self._taps)
+            y = (windows @ self._phases)[t // self._up, t % self._up]
+            self._next_t = int(t[-1]) + self._down - end
+        else:
+            y = np.empty(0, dtype=np.float32)
+            self._next_t -= end
+        self._history = buf[len(buf) - (self._taps - 1) :]
+        return np.clip(np.rint(y), -32768, 32767).astype(np.int16).tobytes()
+
 
 class RealtimeEvent(Enum):
     """Realtime API event types we care about."""
@@ -57,6 +131,8 @@ class RealtimeConfig:
     input_sample_rate: int = 16000  # Our microphone sample rate
     temperature: float = 0.8
     max_response_tokens: int = 4096
+    # Mic audio is coalesced into appends of about this length (0 = per chunk)
+    send_batch_ms: int = 100
     # Note: We use local VAD (not server VAD), so no turn_detection config here
 
 
@@ -85,15 +161,32 @@ class OpenAIRealtimeClient:
     _connection: AsyncRealtimeConnection | None = field(default=None, repr=False)
     _is_connected: bool = field(default=False, repr=False)
     _last_activity_time: float = field(default=0.0, repr=False)
-    _audio_buffer: list[bytes] = field(default_factory=list, repr=False)
-    _response_audio_chunks: list[bytes] = field(default_factory=list, repr=False)
-    _current_transcript: str = field(default="", repr=False)
+    # Decoded audio of the current response, extended in place per delta
+    _response_audio_buffer: bytearray = field(default_factory=bytearray, repr=False)
+    # Transcript deltas of the current response, joined on demand
+    _transcript_parts: list[str] = field(default_factory=list, repr=False)
+    # Mic-rate -> API-rate resampler, carrying filter state across chunks;
+    # None when the rates already match
+    _resampler: _PolyphaseResampler | None = field(default=None, repr=False)
+    _send_count: int = field(default=0, repr=False)
+    # Resampled mic audio not yet appended to the server-side buffer
+    _pending_audio: bytearray = field(default_factory=bytearray, repr=False)
+    _send_batch_bytes: int = field(default=0, repr=False)
+    _last_amplitude_time: float = field(default=0.0, repr=False)
     # Lock to prevent concurrent connection state modifications (voice updates, reconnects)
     _connection_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
 
     def __post_init__(self) -> None:
-        """Initialize the OpenAI client."""
+        """Initialize the OpenAI client and the input resampler."""
         self._init_client()
+        if self.config.input_sample_rate != self.config.sample_rate:
+            self._resampler = _PolyphaseResampler(
+                self.config.input_sample_rate, self.config.sample_rate
+            )
+        # int16 mono at the API rate
+        self._send_batch_bytes = (
+            self.config.sample_rate * self.config.send_batch_ms // 1000 * 2
+        )
 
     def _init_client(self) -> None:
         """Initialize the AsyncOpenAI client."""
@@ -129,6 +222,11 @@ class OpenAIRealtimeClient:
         """Check if connected to Realtime API."""
         return self._is_connected and self._connection is not None
 
+    @property
+    def current_transcript(self) -> str:
+        """Transcript of the response received so far."""
+        return "".join(self._transcript_parts)
+
     async def update_voice(self, new_voice: str) -> bool:
         """Update the TTS voice, reconnecting if necessary.
 
@@ -273,6 +371,11 @@ class OpenAIRealtimeClient:
 
             self._is_connected = True
             self._last_activity_time = time.monotonic()
+            # Audio batched for a previous connection is not in this session,
+            # and a replay must not start from the interrupted filter state
+            self._pending_audio.clear()
+            if self._resampler:
+                self._resampler.reset()
             logger.info("realtime_connected", model=self.config.model)
             return True
 
@@ -296,44 +399,58 @@ class OpenAIRealtimeClient:
     async def send_audio(self, audio_data: bytes) -> bool:
         """Send audio chunk to the Realtime API.
 
+        Chunks are resampled immediately but appended to the server buffer
+        in batches of ``config.send_batch_ms``, so short mic reads do not
+        each cost a WebSocket frame. Call ``flush_audio`` to send a partial
+        batch; ``commit_audio`` does this itself.
+
         Args:
             audio_data: Raw PCM audio bytes (int16, mono)
 
         Returns:
-            True if audio was sent successfully, False if connection is dead
+            True if audio was sent or queued, False if connection is dead
         """
         if not self._connection:
             logger.debug("send_audio_no_connection")
             return False
 
-        original_size = len(audio_data)
-
         # Resample from 16kHz to 24kHz if needed
-        if self.config.input_sample_rate != self.config.sample_rate:
-            audio_data = self._resample_audio(
-                audio_data,
-                self.config.input_sample_rate,
-                self.config.sample_rate,
-            )
+        if self._resampler is not None:
+            audio_data = self._resampler.process(audio_data)
+
+        self._pending_audio += audio_data
+        if len(self._pending_audio) < self._send_batch_bytes:
+            return True
+        return await self.flush_audio()
+
+    async def flush_audio(self) -> bool:
+        """Append any batched audio to the server-side input buffer.
 
-        resampled_size = len(audio_data)
+        Returns:
+            True if nothing was pending or the append succeeded, False if
+            the connection is dead or the send failed
+        """
+        if not self._pending_audio:
+            return True
+        if not self._connection:
+            logger.debug("send_audio_no_connection")
+            return False
 
         # Encode as base64 for the API
-        audio_b64 = base64.b64encode(audio_data).decode("utf-8")
+        audio_b64 = _b64.b64encode(self._pending_audio).decode("ascii")
+        pending_bytes = len(self._pending_audio)
+        self._pending_audio.clear()
 
         try:
             await self._connection.input_audio_buffer.append(audio=audio_b64)
             self._last_activity_time = time.monotonic()
-            # Log every 50th chunk to avoid log spam but still provide visibility
-            if not hasattr(self, "_send_count"):
-                self._send_count = 0
+            # Log every 50th batch to avoid log spam but still provide visibility
             self._send_count += 1
             if self._send_count % 50 == 1:
                 logger.debug(
                     "send_audio_chunk",
                     chunk_num=self._send_count,
-                    original_bytes=original_size,
-                    resampled_bytes=resampled_size,
+                    resampled_bytes=pending_bytes,
                     b64_len=len(audio_b64),
                 )
             return True
@@ -367,6 +484,9 @@ class OpenAIRealtimeClient:
             if not success:
                 logger.warning("send_audio_batch_failed", at_chunk=i, total=len(chunks))
                 return False
+        if not await self.flush_audio():
+            logger.warning("send_audio_batch_flush_failed", total=len(chunks))
+            return False
 
         logger.info("send_audio_batch_complete", chunk_count=len(chunks))
         return True
@@ -381,6 +501,10 @@ class OpenAIRealtimeClient:
         Returns:
             True if commit succeeded, False otherwise
         """
+        # Send the tail of the recording that has not filled a batch yet
+        if not await self.flush_audio():
+            logger.warning("commit_audio_flush_failed")
+            return False
         if not self._connection:
             logger.warning("commit_audio_no_connection")
             return False
@@ -409,13 +533,18 @@ class OpenAIRealtimeClient:
         In manual VAD mode, this should be called before starting a new
         recording session to ensure no stale audio from previous interactions.
         """
+        # Reset the send counter and resampler for the new recording session,
+        # even if the server-side clear below fails
+        self._pending_audio.clear()
+        self._send_count = 0
+        if self._resampler:
+            self._resampler.reset()
+
         if not self._connection:
             return
 
         try:
             await self._connection.input_audio_buffer.clear()
-            # Reset the send counter for the new recording session
-            self._send_count = 0
             logger.debug("audio_buffer_cleared")
         except Exception as e:
             logger.warning("clear_audio_failed", error=str(e))
@@ -482,8 +611,8 @@ class OpenAIRealtimeClient:
         if not self._connection:
             return
 
-        self._response_audio_chunks.clear()
-        self._current_transcript = ""
+        self._response_audio_buffer.clear()
+        self._transcript_parts.clear()
 
         try:
             async for event in self._connection:
@@ -494,14 +623,12 @@ class OpenAIRealtimeClient:
                 if event_type == "response.audio.delta":
                     # Decode audio chunk
                     audio_b64 = event.delta
-                    audio_bytes = base64.b64decode(audio_b64)
+                    audio_bytes = _b64.b64decode(audio_b64)
 
                     # Calculate amplitude for HeadWobble
-                    if self.on_audio_amplitude:
-                        amplitude = self._calculate_amplitude(audio_bytes)
-                        self.on_audio_amplitude(amplitude)
+                    self._report_amplitude(audio_bytes)
 
-                    self._response_audio_chunks.append(audio_bytes)
+                    self._response_audio_buffer += audio_bytes
                     yield ("audio_delta", audio_bytes)
 
                 elif event_type == "response.audio.done":
@@ -510,11 +637,11 @@ class OpenAIRealtimeClient:
                     yield ("audio_done", None)
 
                 elif event_type == "response.audio_transcript.delta":
-                    self._current_transcript += event.delta
+                    self._transcript_parts.append(event.delta)
                     yield ("transcript_delta", event.delta)
 
                 elif event_type == "response.audio_transcript.done":
-                    yield ("transcript_done", self._current_transcript)
+                    yield ("transcript_done", self.current_transcript)
 
                 elif event_type == "response.output_text.delta":
                     yield ("text_delta", event.delta)
@@ -701,9 +828,7 @@ class OpenAIRealtimeClient:
                 async for chunk in response.iter_bytes(chunk_size=4096):
                     if chunk:
                         # Calculate amplitude for HeadWobble if callback registered
-                        if self.on_audio_amplitude:
-                            amplitude = self._calculate_amplitude(chunk)
-                            self.on_audio_amplitude(amplitude)
+                        self._report_amplitude(chunk)
                         yield chunk
 
             # Reset amplitude when done
@@ -779,37 +904,21 @@ class OpenAIRealtimeClient:
 
     def get_response_audio(self) -> bytes:
         """Get all collected response audio as a single buffer."""
-        return b"".join(self._response_audio_chunks)
-
-    def _resample_audio(
-        self,
-        audio_data: bytes,
-        from_rate: int,
-        to_rate: int,
-    ) -> bytes:
-        """Resample audio to a different sample rate.
+        return bytes(self._response_audio_buffer)
 
-        Args:
-            audio_data: Input audio bytes (int16)
-            from_rate: Original sample rate
-            to_rate: Target sample rate
+    def _report_amplitude(self, audio_data: bytes) -> None:
+        """Pass a chunk's amplitude to the callback, rate-limited.
 
-        Returns:
-            Resampled audio bytes
+        Chunks arriving within ``AMPLITUDE_UPDATE_INTERVAL_SECONDS`` of the
+        last update are skipped without computing their RMS.
         """
-        if from_rate == to_rate:
-            return audio_data
-
-        samples = np.frombuffer(audio_data, dtype=np.int16)
-
-        # Simple linear interpolation resampling
-        ratio = to_rate / from_rate
-        new_length = int(len(samples) * ratio)
-
-        indices = np.linspace(0, len(samples) - 1, new_length)
-        resampled = np.interp(indices, np.arange(len(samples)), samples)
-
-        return resampled.astype(np.int16).tobytes()
+        if not self.on_audio_amplitude:
+            return
+        now = time.monotonic()
+        if now - self._last_amplitude_time < AMPLITUDE_UPDATE_INTERVAL_SECONDS:
+            return
+        self._last_amplitude_time = now
+        self.on_audio_amplitude(self._calculate_amplitude(audio_data))
 
     def _calculate_amplitude(self, audio_data: bytes) -> float:
         """Calculate RMS amplitude of audio chunk (0.0-1.0)."""
@@ -817,7 +926,9 @@ class OpenAIRealtimeClient:
         if len(samples) == 0:
             return 0.0
 
-        rms = np.sqrt(np.mean(samples.astype(np.float32) ** 2))
+        # Exact integer sum of squares straight off the int16 buffer
+        sum_sq = int(np.einsum("i,i->", samples, samples, dtype=np.int64))
+        rms = math.sqrt(sum_sq / len(samples))
         # Normalize to 0-1 range, scaled for visibility
         amplitude = min(1.0, rms / 32767.0 * 3.0)
         return amplitude
@@ -22,7 +22,7 @@ VALID_VOICES = frozenset({"alloy", "echo", "fable", "onyx", "nova", "shimmer"})
 OpenAIVoice = Literal["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PersonaConfig:
     """Configuration for a persona tied to a wake word.
 
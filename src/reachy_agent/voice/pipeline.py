@@ -401,6 +401,7 @@ class VoicePipeline:
 
         # Initialize audio manager (required - cannot degrade)
         self._audio = AudioManager(config=self.config.audio)
+        await self._audio.initialize()
         if not self._audio.is_available:
             logger.error("audio_not_available")
             if self.on_error_message:
@@ -747,6 +748,16 @@ class VoicePipeline:
         finally:
             await self._audio.stop_recording()
 
+        # send_audio only queues the last partial batch; push it now so a
+        # dead socket still takes the replay path below
+        if not connection_died and not await self._realtime.flush_audio():
+            connection_died = True
+            logger.warning(
+                "connection_died_flushing_recording",
+                chunks_buffered=len(speech_chunks),
+                chunks_sent=chunks_sent,
+            )
+
         logger.info(
             "speech_recording_complete",
             total_chunks=len(speech_chunks),
@@ -1068,7 +1079,7 @@ class VoicePipeline:
                 stream.stop_stream()
                 stream.close()
 
-        await asyncio.get_event_loop().run_in_executor(None, _resample_and_play)
+        await asyncio.get_running_loop().run_in_executor(None, _resample_and_play)
 
     async def _handle_error(self) -> None:
         """Handle error state."""
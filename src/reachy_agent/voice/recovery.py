@@ -89,7 +89,7 @@ class RecoveryStrategy:
         return self.fallback_action
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DegradedModeConfig:
     """Configuration for graceful degradation when components fail."""
 
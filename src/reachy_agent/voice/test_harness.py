@@ -296,12 +296,10 @@ class VoiceTestHarness:
             chunks=len(chunks),
         )
 
-        # Inject chunks into the audio queue
+        # Inject chunks into the audio ring
         for chunk in chunks:
-            try:
-                self.pipeline._audio._audio_queue.put_nowait(chunk)
-            except Exception as e:
-                logger.warning("test_harness_inject_queue_full", error=str(e))
+            if not self.pipeline._audio._push_frame(chunk):
+                logger.warning("test_harness_inject_queue_full")
                 break
 
     async def run_scenario(
@@ -29,7 +29,7 @@ class SpeechState(Enum):
     END_OF_SPEECH = "end_of_speech"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VADConfig:
     """VAD configuration settings.
 
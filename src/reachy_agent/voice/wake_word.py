@@ -33,7 +33,7 @@ WAKE_WORD_MODELS = [
 ]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WakeWordConfig:
     """Wake word detection configuration.
 
@@ -22,6 +22,7 @@ from reachy_agent.permissions.handlers import (
 from reachy_agent.permissions.hooks import (
     PermissionHooks,
     ToolExecution,
+    next_execution_id,
 )
 from reachy_agent.permissions.storage.sqlite_audit import (
     AuditRecord,
@@ -438,6 +439,79 @@ class TestTier4Forbidden:
         assert audit_records[0].decision == "denied"
         assert audit_records[0].result == "error"
         assert audit_records[0].permission_tier == PermissionTier.FORBIDDEN.value
+        assert hooks._pending_executions == {}
+
+
+class TestPendingExecutions:
+    """Tests for deferred audit logging of in-flight executions."""
+
+    @pytest.mark.asyncio
+    async def test_single_audit_record_per_call(self) -> None:
+        """Test that pre + post hooks produce exactly one audit record."""
+        audit_records: list[ToolExecution] = []
+
+        async def audit_cb(execution: ToolExecution) -> None:
+            audit_records.append(execution)
+
+        hooks = PermissionHooks(
+            evaluator=PermissionEvaluator(default_tier=PermissionTier.AUTONOMOUS),
+            audit_callback=audit_cb,
+        )
+
+        result = await hooks.pre_tool_use("mcp__reachy__nod", {})
+        assert audit_records == []
+
+        await hooks.post_tool_use(
+            "mcp__reachy__nod", {}, None, execution_id=result["_execution_id"]
+        )
+
+        assert len(audit_records) == 1
+        assert audit_records[0].decision == "allowed"
+        assert audit_records[0].result == "success"
+
+    @pytest.mark.asyncio
+    async def test_flush_pending(self) -> None:
+        """Test that unfinished executions are logged as incomplete on flush."""
+        audit_records: list[ToolExecution] = []
+
+        async def audit_cb(execution: ToolExecution) -> None:
+            audit_records.append(execution)
+
+        hooks = PermissionHooks(
+            evaluator=PermissionEvaluator(default_tier=PermissionTier.AUTONOMOUS),
+            audit_callback=audit_cb,
+        )
+
+        await hooks.pre_tool_use("mcp__reachy__nod", {})
+        await hooks.pre_tool_use("mcp__reachy__shake", {})
+
+        flushed = await hooks.flush_pending()
+
+        assert flushed == 2
+        assert {r.tool_name for r in audit_records} == {
+            "mcp__reachy__nod",
+            "mcp__reachy__shake",
+        }
+        assert all(r.result == "incomplete" for r in audit_records)
+        assert await hooks.flush_pending() == 0
+
+    @pytest.mark.asyncio
+    async def test_context_exit_flushes_pending(self) -> None:
+        """Test that leaving the hooks' context on error still audits calls."""
+        audit_records: list[ToolExecution] = []
+
+        async def audit_cb(execution: ToolExecution) -> None:
+            audit_records.append(execution)
+
+        with pytest.raises(RuntimeError):
+            async with PermissionHooks(
+                evaluator=PermissionEvaluator(default_tier=PermissionTier.AUTONOMOUS),
+                audit_callback=audit_cb,
+            ) as hooks:
+                await hooks.pre_tool_use("mcp__reachy__nod", {})
+                raise RuntimeError("agent crashed mid-tool")
+
+        assert [r.result for r in audit_records] == ["incomplete"]
 
 
 class TestHandlerIntegration:
@@ -586,6 +660,41 @@ class TestSQLiteAuditIntegration:
         finally:
             await storage.close()
 
+    @pytest.mark.asyncio
+    async def test_store_many(self, tmp_path) -> None:
+        """Test storing a batch of records from a generator."""
+        storage = SQLiteAuditStorage(db_path=tmp_path / "test_audit.db")
+
+        try:
+            await storage.store_many(
+                AuditRecord(
+                    id=f"batch-{i}",
+                    timestamp=datetime.now(),
+                    tool_name="mcp__reachy__nod",
+                    tool_input={"times": i},
+                    permission_tier=1,
+                    decision="allowed",
+                )
+                for i in range(5)
+            )
+
+            records = await storage.get_recent(limit=10)
+            assert len(records) == 5
+            assert {r.id for r in records} == {f"batch-{i}" for i in range(5)}
+            assert (await storage.get_by_id("batch-3")).tool_input == {"times": 3}
+
+        finally:
+            await storage.close()
+
+    def test_execution_ids_unique_and_time_ordered(self) -> None:
+        """Test that generated execution IDs are unique and sort by creation."""
+        ids = [next_execution_id() for _ in range(1000)]
+        assert len(set(ids)) == len(ids)
+        assert ToolExecution().id != ToolExecution().id
+
+        timestamps = [int(i.split("-")[0], 16) for i in ids]
+        assert timestamps == sorted(timestamps)
+
 
 class TestErrorHandling:
     """Tests for error handling in permission flow."""
@@ -9,11 +9,21 @@ take several seconds to run due to daemon startup time.
 
 from __future__ import annotations
 
+import asyncio
+import json
+import math
+
+import httpx
 import pytest
 
 from reachy_agent.simulation import SimulationAdapter
 from reachy_agent.simulation.adapter import create_simulation_adapter
-from reachy_agent.simulation.daemon_launcher import SimulationConfig, SimulationScene
+from reachy_agent.simulation.daemon_launcher import (
+    SimulationConfig,
+    SimulationDaemon,
+    SimulationScene,
+)
+from reachy_agent.simulation.reachy_client import ReachyMiniClient
 
 
 class TestSimulationConfig:
@@ -77,6 +87,438 @@ class TestSimulationAdapterUnit:
         with pytest.raises(RuntimeError, match="not started"):
             _ = adapter.client
 
+    @pytest.mark.asyncio
+    async def test_client_and_daemon_share_http_client(self, monkeypatch) -> None:
+        """Test the daemon and client share one pooled HTTP client."""
+
+        async def noop(self) -> None:
+            return None
+
+        monkeypatch.setattr(SimulationDaemon, "start", noop)
+        adapter = SimulationAdapter()
+
+        await adapter.start()
+        shared = adapter._daemon.http_client
+        assert shared is not None
+        assert adapter.client.http_client is shared
+        assert shared.headers["content-type"] == "application/json"
+
+        await adapter.stop()
+        assert shared.is_closed
+        assert adapter._daemon.http_client is None
+
+
+class TestSimulationDaemonUnit:
+    """Unit tests for SimulationDaemon (no daemon required)."""
+
+    @pytest.mark.asyncio
+    async def test_health_check_reuses_client(self) -> None:
+        """Test that repeated health checks share one HTTP client."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"state": "RUNNING"})
+
+        daemon = SimulationDaemon(config=SimulationConfig(port=9123))
+        daemon._http = httpx.AsyncClient(
+            base_url=daemon.base_url, transport=httpx.MockTransport(handler)
+        )
+        client = daemon._http
+
+        assert await daemon.health_check() == {"state": "RUNNING"}
+        assert await daemon.health_check() == {"state": "RUNNING"}
+
+        assert daemon._http is client
+        assert [str(r.url) for r in requests] == [
+            "http://127.0.0.1:9123/api/daemon/status"
+        ] * 2
+
+        await daemon.stop()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_wait_for_healthy_backs_off(self, monkeypatch) -> None:
+        """Test that startup polling backs off from a short initial delay."""
+        responses = iter([httpx.ConnectError("refused")] * 4 + [None])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            error = next(responses)
+            if error is not None:
+                raise error
+            return httpx.Response(200, json={"state": "READY"})
+
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr(
+            "reachy_agent.simulation.daemon_launcher.asyncio.sleep", fake_sleep
+        )
+
+        daemon = SimulationDaemon(
+            config=SimulationConfig(
+                health_check_initial_interval=0.1,
+                health_check_backoff=2.0,
+                health_check_interval=0.3,
+            )
+        )
+        daemon._http = httpx.AsyncClient(
+            base_url=daemon.base_url, transport=httpx.MockTransport(handler)
+        )
+
+        await daemon._wait_for_healthy()
+
+        assert len(sleeps) == 4
+        for actual, expected in zip(sleeps, [0.1, 0.2, 0.3, 0.3], strict=True):
+            assert expected * 0.8 <= actual <= expected * 1.2
+
+
+class TestReachyMiniClientUnit:
+    """Unit tests for ReachyMiniClient against a mock transport."""
+
+    @staticmethod
+    def _client(handler) -> ReachyMiniClient:
+        http = httpx.AsyncClient(
+            base_url="http://test", transport=httpx.MockTransport(handler)
+        )
+        return ReachyMiniClient(base_url="http://test", http_client=http)
+
+    @pytest.mark.asyncio
+    async def test_owned_client_is_pooled_and_reused(self) -> None:
+        """Test the client's own HTTP client is created once with pool limits."""
+        client = ReachyMiniClient(base_url="http://test")
+
+        http = await client._get_client()
+        assert await client._get_client() is http
+        pool = http._transport._pool
+        assert pool._max_keepalive_connections == 8
+        assert pool._max_connections == 16
+        assert pool._keepalive_expiry == 60.0
+        assert http.headers["accept"] == "application/json"
+        assert http.headers["content-type"] == "application/json"
+        assert http.headers["user-agent"].startswith("reachy-agent/")
+
+        await client.close()
+        assert http.is_closed
+
+    def test_endpoint_urls_are_absolute_and_cached(self) -> None:
+        """Test endpoint paths resolve once to absolute URLs."""
+        client = ReachyMiniClient(base_url="http://robot.local:8000/")
+
+        url = client._url("/api/state/full")
+
+        assert str(url) == "http://robot.local:8000/api/state/full"
+        assert client._url("/api/state/full") is url
+
+    def test_client_uses_slots(self) -> None:
+        """Test the client stores fields in slots rather than a __dict__."""
+        client = ReachyMiniClient()
+
+        assert not hasattr(client, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unknown = 1  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_degree_arguments_sent_as_radians(self) -> None:
+        """Test that degree inputs and defaults are converted to radians."""
+        bodies: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json={"uuid": "abc"})
+
+        client = self._client(handler)
+        await client.look_at(roll=10, pitch=-20, yaw=90)
+        await client.set_antenna_state(right_angle=60)
+        await client.rotate("right", degrees=45)
+
+        assert bodies[0]["head_pose"]["roll"] == pytest.approx(math.radians(10))
+        assert bodies[0]["head_pose"]["pitch"] == pytest.approx(math.radians(-20))
+        assert bodies[0]["head_pose"]["yaw"] == pytest.approx(math.pi / 2)
+        assert bodies[1]["antennas"] == pytest.approx(
+            [math.radians(45), math.radians(60)]
+        )
+        assert bodies[2]["body_yaw"] == pytest.approx(-math.pi / 4)
+
+    @pytest.mark.asyncio
+    async def test_move_head_poses(self) -> None:
+        """Test move_head maps each direction onto a fresh neutral pose."""
+        bodies: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json={"uuid": "abc"})
+
+        client = self._client(handler)
+        for direction in ("left", "right", "up", "down", "front", "sideways"):
+            await client.move_head(direction, speed="fast", degrees=20)
+
+        angle = math.radians(20)
+        poses = [b["head_pose"] for b in bodies]
+        assert [(p["yaw"], p["pitch"]) for p in poses] == pytest.approx(
+            [(angle, 0), (-angle, 0), (0, -angle), (0, angle), (0, 0), (0, 0)]
+        )
+        assert all(b["duration"] == 0.5 for b in bodies)
+        assert set(poses[0]) == {"x", "y", "z", "roll", "pitch", "yaw"}
+
+    @pytest.mark.asyncio
+    async def test_state_stream_serves_latest_frame(self) -> None:
+        """Test reads come from the WebSocket stream once it delivers a frame."""
+        websockets = pytest.importorskip("websockets", minversion="14.0")
+        paths: list[str] = []
+
+        async def stream(ws) -> None:
+            paths.append(ws.request.path)
+            await ws.send(json.dumps({"body_yaw": 0.5}))
+            await ws.wait_closed()
+
+        async with websockets.serve(stream, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            requests: list[httpx.Request] = []
+
+            def handler(request: httpx.Request) -> httpx.Response:
+                requests.append(request)
+                return httpx.Response(200, json={"body_yaw": 0.0})
+
+            http = httpx.AsyncClient(
+                base_url="http://test", transport=httpx.MockTransport(handler)
+            )
+            client = ReachyMiniClient(
+                base_url=f"http://127.0.0.1:{port}",
+                http_client=http,
+                stream_state=True,
+                state_ttl=0.0,
+            )
+
+            # Until the first frame arrives, reads fall back to HTTP.
+            assert await client.get_full_state() == {"body_yaw": 0.0}
+            for _ in range(100):
+                if client._latest_state is not None:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert await client.get_full_state() == {"body_yaw": 0.5}
+            assert len(requests) == 1
+            assert paths == ["/api/state/ws/full"]
+
+            task = client._stream_task
+            await client.close()
+            assert task is not None and task.cancelled()
+            assert client._stream_task is None
+
+    @pytest.mark.asyncio
+    async def test_state_stream_unavailable_falls_back_to_http(self) -> None:
+        """Test a failed stream connection disables streaming."""
+        pytest.importorskip("websockets")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"body_yaw": 0.0})
+
+        http = httpx.AsyncClient(
+            base_url="http://test", transport=httpx.MockTransport(handler)
+        )
+        # Port 9 (discard) is closed on test hosts, so the connect is refused.
+        client = ReachyMiniClient(
+            base_url="http://127.0.0.1:9", http_client=http, stream_state=True
+        )
+
+        assert await client.get_full_state() == {"body_yaw": 0.0}
+        task = client._stream_task
+        assert task is not None
+        await task
+
+        assert client.stream_state is False
+        assert client._stream_task is None
+
+    @pytest.mark.asyncio
+    async def test_rest_payload(self) -> None:
+        """Test rest sends the neutral pose with raised antennas."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"uuid": "abc"})
+
+        client = self._client(handler)
+        assert await client.rest() == {"uuid": "abc"}
+
+        assert requests[0].url.path == "/api/move/goto"
+        assert requests[0].headers["content-type"] == "application/json"
+        body = json.loads(requests[0].content)
+        assert body["head_pose"] == dict.fromkeys(
+            ("x", "y", "z", "roll", "pitch", "yaw"), 0.0
+        )
+        assert body["antennas"] == pytest.approx([math.pi / 4] * 2)
+        assert body["body_yaw"] == 0.0
+        assert body["duration"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_rotate_sign_and_duration(self) -> None:
+        """Test rotate maps direction to yaw sign and speed to duration."""
+        bodies: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json={"uuid": "abc"})
+
+        client = self._client(handler)
+        await client.rotate("left", degrees=30, speed="slow")
+        await client.rotate("right", degrees=30, speed="fast")
+        await client.rotate("spin", degrees=30, speed="warp")
+
+        assert [b["body_yaw"] for b in bodies] == pytest.approx(
+            [math.radians(30), -math.radians(30), math.radians(30)]
+        )
+        assert [b["duration"] for b in bodies] == [3.0, 1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_request_results(self) -> None:
+        """Test decoding of JSON, empty and error responses."""
+        responses = {
+            "/api/daemon/status": httpx.Response(200, json={"state": "running"}),
+            "/api/move/play/wake_up": httpx.Response(200),
+            "/api/move/play/goto_sleep": httpx.Response(503),
+        }
+
+        client = self._client(lambda request: responses[request.url.path])
+
+        assert await client.get_status() == {"state": "running"}
+        assert await client.wake_up() == {}
+        assert await client.sleep() == {
+            "error": "503 Service Unavailable for POST /api/move/play/goto_sleep",
+            "status_code": 503,
+        }
+
+    @pytest.mark.asyncio
+    async def test_full_state_cached_and_coalesced(self) -> None:
+        """Test state reads within the TTL share one request."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"body_yaw": 0.1})
+
+        client = self._client(handler)
+        client.state_ttl = 60.0
+
+        states = await asyncio.gather(*(client.get_sensor_data() for _ in range(5)))
+        assert all(s["body_yaw"] == 0.1 for s in states)
+        assert len(requests) == 1
+
+        await client.get_full_state()
+        assert len(requests) == 1
+
+        # Commands invalidate the cached state.
+        await client.rotate("left", degrees=10)
+        await client.get_full_state()
+        assert [r.url.path for r in requests].count("/api/state/full") == 2
+
+    @pytest.mark.asyncio
+    async def test_full_state_ttl_zero_disables_cache(self) -> None:
+        """Test that state_ttl=0 fetches on every call and errors are not cached."""
+        statuses = [500, 200, 200, 200]
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(statuses[len(requests) - 1], json={"body_yaw": 0.0})
+
+        client = self._client(handler)
+        client.state_ttl = 60.0
+        assert "error" in await client.get_full_state()
+        assert await client.get_full_state() == {"body_yaw": 0.0}
+        assert len(requests) == 2
+
+        client.state_ttl = 0.0
+        await client.get_full_state()
+        await client.get_full_state()
+        assert len(requests) == 4
+
+    @pytest.mark.asyncio
+    async def test_nod_uses_single_sequence_request(self) -> None:
+        """Test that a gesture is sent as one goto_sequence request."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"uuid": "abc"})
+
+        client = self._client(handler)
+        result = await client.nod(times=2)
+
+        assert result == {"status": "ok", "moves": 4}
+        assert [r.url.path for r in requests] == ["/api/move/goto_sequence"]
+        assert requests[0].headers["content-type"] == "application/json"
+        moves = json.loads(requests[0].content)["moves"]
+        assert [m["head_pose"]["pitch"] for m in moves] == [0.3, -0.1, 0.3, -0.1, 0.0]
+        assert all(m["duration"] == 0.25 for m in moves)
+
+    @pytest.mark.asyncio
+    async def test_goto_sequence_encodes_keyframes(self) -> None:
+        """Test goto_sequence posts caller keyframes as one JSON body."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"uuid": "abc"})
+
+        client = self._client(handler)
+        keyframes = [
+            {"duration": 0.5, "interpolation": "linear", "body_yaw": 0.2},
+            {"duration": 0.5, "interpolation": "minjerk", "antennas": [0.1, 0.2]},
+        ]
+
+        assert await client.goto_sequence(keyframes) == {"status": "ok", "moves": 2}
+        assert json.loads(requests[0].content) == {"moves": keyframes}
+
+    @pytest.mark.asyncio
+    async def test_shake_falls_back_to_ordered_gotos(self, monkeypatch) -> None:
+        """Test fallback to paced per-keyframe gotos when the endpoint is missing."""
+        requests: list[httpx.Request] = []
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr(
+            "reachy_agent.simulation.reachy_client.asyncio.sleep", fake_sleep
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.path == "/api/move/goto_sequence":
+                return httpx.Response(404)
+            return httpx.Response(200, json={"uuid": "abc"})
+
+        client = self._client(handler)
+        assert await client.shake(times=1) == {"status": "ok", "moves": 2}
+        assert await client.shake(times=1) == {"status": "ok", "moves": 2}
+
+        paths = [r.url.path for r in requests]
+        # The missing endpoint is probed only once per client.
+        assert paths.count("/api/move/goto_sequence") == 1
+        gotos = [r for r in requests if r.url.path == "/api/move/goto"]
+        yaws = [json.loads(r.content)["head_pose"]["yaw"] for r in gotos]
+        assert yaws == [0.3, -0.3, 0.0] * 2
+        # Later keyframes are scheduled at the end of the previous 0.25 s
+        # segment, less the measured round-trip. The fake sleep does not
+        # advance the clock, so the delays read as offsets from the start.
+        assert sleeps == pytest.approx([0.25, 0.5, 0.25, 0.5], abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_sequence_error_is_reported(self) -> None:
+        """Test that a daemon error on the sequence is surfaced."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500)
+
+        client = self._client(handler)
+        result = await client.nod(times=1)
+
+        assert result["status_code"] == 500
+
 
 # Mark integration tests that require MuJoCo daemon
 @pytest.mark.simulation
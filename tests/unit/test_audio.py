@@ -0,0 +1,1210 @@
+"""Tests for the microphone frame ring and AudioManager reads."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+import types
+from typing import Any
+
+import numpy as np
+import pytest
+
+from reachy_agent.voice.audio import (
+    AudioConfig,
+    AudioDeviceManager,
+    AudioManager,
+    FrameRing,
+    _set_rt_priority,
+    _sumsq_pcm16,
+)
+from reachy_agent.voice.errors import (
+    AudioInitializationError,
+    AudioStreamDisconnectedError,
+)
+
+
+class FakeStream:
+    """Records writes to, and scripts reads from, a fake PyAudio stream."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+        self.writes: list[bytes] = []
+        self.reads: list[bytes | Exception] = []
+        self.read_sizes: list[int] = []
+        self.closed = False
+
+    def write(self, data: bytes) -> None:
+        self.writes.append(bytes(data))
+
+    def read(self, num_frames: int, exception_on_overflow: bool = True) -> bytes:
+        self.read_sizes.append(num_frames)
+        if self.reads:
+            item = self.reads.pop(0)
+            if isinstance(item, Exception):
+                raise item
+            return item
+        time.sleep(0.001)  # Pace like a device with nothing scripted
+        return bytes(num_frames * 2)
+
+    def get_input_latency(self) -> float:
+        return 0.008
+
+    def get_output_latency(self) -> float:
+        return 0.016
+
+    def start_stream(self) -> None:
+        pass
+
+    def stop_stream(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakePyAudio:
+    """Minimal PyAudio stand-in with one duplex device at index 0."""
+
+    def __init__(self) -> None:
+        self.streams: list[FakeStream] = []
+        self.format_checks: list[dict[str, Any]] = []
+        self.device_count_calls = 0
+
+    def get_device_info_by_index(self, index: int) -> dict[str, Any]:
+        return {
+            "index": index,
+            "maxInputChannels": 2,
+            "maxOutputChannels": 2,
+            "defaultLowInputLatency": 0.00870,
+            "defaultLowOutputLatency": 0.05,
+        }
+
+    def get_default_input_device_info(self) -> dict[str, Any]:
+        return self.get_device_info_by_index(0)
+
+    def get_default_output_device_info(self) -> dict[str, Any]:
+        return self.get_device_info_by_index(0)
+
+    def is_format_supported(self, rate: int, **kwargs: Any) -> bool:
+        self.format_checks.append({"rate": rate, **kwargs})
+        return True
+
+    def get_device_count(self) -> int:
+        self.device_count_calls += 1
+        return 1
+
+    def open(self, **kwargs: Any) -> FakeStream:
+        stream = FakeStream(**kwargs)
+        self.streams.append(stream)
+        return stream
+
+    def terminate(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_pyaudio(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """Install a fake pyaudio module for AudioManager."""
+    module = types.ModuleType("pyaudio")
+    module.PyAudio = FakePyAudio  # type: ignore[attr-defined]
+    module.paInt8 = 16  # type: ignore[attr-defined]
+    module.paInt16 = 8  # type: ignore[attr-defined]
+    module.paInt24 = 4  # type: ignore[attr-defined]
+    module.paInt32 = 2  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "pyaudio", module)
+    return module
+
+
+class TestFrameRing:
+    """Test the SPSC audio frame ring."""
+
+    def test_rejects_non_power_of_two(self) -> None:
+        """Test capacity must be a power of two."""
+        with pytest.raises(ValueError, match="power of two"):
+            FrameRing(100)
+
+    def test_fifo_order(self) -> None:
+        """Test frames come out in the order they went in."""
+        ring = FrameRing(4)
+        for frame in (b"a", b"b", b"c"):
+            assert ring.push(frame)
+
+        assert len(ring) == 3
+        assert [ring.pop(), ring.pop(), ring.pop()] == [b"a", b"b", b"c"]
+        assert ring.pop() is None
+
+    def test_drops_when_full(self) -> None:
+        """Test push refuses new frames once the ring is full."""
+        ring = FrameRing(2)
+
+        assert ring.push(b"a")
+        assert ring.push(b"b")
+        assert not ring.push(b"c")
+        assert ring.pop() == b"a"
+        assert ring.push(b"c")
+        assert [ring.pop(), ring.pop()] == [b"b", b"c"]
+
+    def test_wraps_around(self) -> None:
+        """Test indices keep working past the capacity."""
+        ring = FrameRing(2)
+        for i in range(10):
+            assert ring.push(bytes([i]))
+            assert ring.pop() == bytes([i])
+
+        assert len(ring) == 0
+
+    def test_clear(self) -> None:
+        """Test clear discards buffered frames."""
+        ring = FrameRing(4)
+        ring.push(b"a")
+        ring.push(b"b")
+
+        ring.clear()
+
+        assert len(ring) == 0
+        assert ring.pop() is None
+        assert ring.push(b"c")
+        assert ring.pop() == b"c"
+
+    def test_threaded_producer(self) -> None:
+        """Test a producer thread and consumer lose nothing and keep order."""
+        ring = FrameRing(8)
+        frames = [i.to_bytes(2, "little") for i in range(5000)]
+
+        def produce() -> None:
+            for frame in frames:
+                while not ring.push(frame):
+                    time.sleep(0)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        received: list[bytes] = []
+        while len(received) < len(frames):
+            frame = ring.pop()
+            if frame is None:
+                time.sleep(0)
+            else:
+                received.append(frame)
+        producer.join()
+
+        assert received == frames
+
+
+class TestRingCapacity:
+    """Test the mic ring is sized from the latency budget."""
+
+    @pytest.mark.parametrize(
+        ("latency_ms", "expected"),
+        [(1000, 32), (200, 8), (32, 1), (1, 1), (4000, 128)],
+    )
+    def test_capacity_from_latency(self, latency_ms: int, expected: int) -> None:
+        """Test 512-sample chunks at 16 kHz round up to a power of two."""
+        config = AudioConfig(buffer_latency_ms=latency_ms)
+
+        assert config.ring_capacity == expected
+
+    def test_manager_uses_configured_capacity(self) -> None:
+        """Test AudioManager drops frames beyond the configured backlog."""
+        manager = AudioManager(config=AudioConfig(buffer_latency_ms=200))
+
+        pushed = [manager._push_frame(b"\x00\x00") for _ in range(9)]
+
+        assert pushed == [True] * 8 + [False]
+
+
+class TestAudioManagerRead:
+    """Test AudioManager.read_audio against the ring."""
+
+    @pytest.mark.asyncio
+    async def test_read_returns_buffered_frame(self) -> None:
+        """Test a buffered frame is returned immediately."""
+        manager = AudioManager()
+        manager._audio_ring.push(b"\x01\x00")
+
+        assert await manager.read_audio(timeout=0.1) == b"\x01\x00"
+
+    @pytest.mark.asyncio
+    async def test_read_returns_frame_without_copy(self) -> None:
+        """Test the bytes object from stream.read is handed through unchanged."""
+        manager = AudioManager(config=AudioConfig(input_warmup_chunks=0))
+        manager._is_recording = True
+        stream = FakeStream()
+        frame = bytes(1024)
+        stream.reads.append(frame)
+        reader = threading.Thread(target=manager._reader_loop, args=(stream,))
+        reader.start()
+        try:
+            assert await manager.read_audio(timeout=1.0) is frame
+        finally:
+            manager._is_recording = False
+            reader.join()
+
+    @pytest.mark.asyncio
+    async def test_read_times_out(self) -> None:
+        """Test an empty ring returns None after the timeout."""
+        manager = AudioManager()
+
+        assert await manager.read_audio(timeout=0.02) is None
+
+    @pytest.mark.asyncio
+    async def test_read_waits_for_late_frame(self) -> None:
+        """Test a frame pushed while waiting is picked up."""
+        manager = AudioManager()
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, manager._push_frame, b"late")
+
+        assert await manager.read_audio(timeout=1.0) == b"late"
+
+    def test_push_without_waiting_reader_skips_wakeup(self) -> None:
+        """Test frames pushed with no parked reader do not touch the loop."""
+        manager = AudioManager()
+        scheduled: list[object] = []
+
+        class RecordingLoop:
+            def call_soon_threadsafe(self, callback: object) -> None:
+                scheduled.append(callback)
+
+        manager._loop = RecordingLoop()  # type: ignore[assignment]
+        manager._push_frame(b"a")
+        manager._waiting_readers = 1
+        manager._push_frame(b"b")
+
+        assert scheduled == [manager._data_event.set]
+
+    @pytest.mark.asyncio
+    async def test_read_woken_by_record_thread(self) -> None:
+        """Test a frame pushed from another thread wakes the reader promptly."""
+        manager = AudioManager()
+        manager._loop = asyncio.get_running_loop()
+        timer = threading.Timer(0.02, manager._push_frame, args=(b"\x05\x00",))
+        timer.start()
+        try:
+            start = time.monotonic()
+            frame = await manager.read_audio(timeout=2.0)
+            elapsed = time.monotonic() - start
+        finally:
+            timer.join()
+
+        assert frame == b"\x05\x00"
+        assert elapsed < 1.0
+
+
+class TestCalculateAmplitude:
+    """Test RMS amplitude of int16 PCM chunks."""
+
+    def test_empty_chunk(self) -> None:
+        """Test an empty chunk is silent."""
+        assert AudioManager()._calculate_amplitude(b"") == 0.0
+
+    def test_matches_float_rms(self) -> None:
+        """Test the integer accumulation matches a float reference."""
+        samples = np.array([1000, -2000, 3000, -4000], dtype=np.int16)
+        expected = float(np.sqrt(np.mean(samples.astype(np.float64) ** 2)))
+
+        amplitude = AudioManager()._calculate_amplitude(samples.tobytes())
+
+        assert amplitude == pytest.approx(expected / 32767.0 * 3.0)
+
+    def test_batched_is_rms_of_combined_window(self) -> None:
+        """Test the batched amplitude equals the RMS of the joined chunks."""
+        manager = AudioManager()
+        quiet = np.full(256, 100, dtype=np.int16).tobytes()
+        loud = np.full(512, 3000, dtype=np.int16).tobytes()
+
+        joined = np.frombuffer(quiet + loud, dtype=np.int16).astype(np.float64)
+        expected = float(np.sqrt(np.mean(joined**2))) / 32767.0 * 3.0
+
+        batched = manager._calculate_amplitude_batched([quiet, loud])
+
+        assert batched == pytest.approx(expected)
+        assert manager._calculate_amplitude_batched([]) == 0.0
+
+    def test_large_chunk_is_subsampled(self) -> None:
+        """Test long chunks are read with a stride but keep their RMS."""
+        manager = AudioManager()
+        samples = np.tile(np.array([3000, -3000], dtype=np.int16), 2048)
+
+        amplitude = manager._calculate_amplitude(samples.tobytes())
+
+        assert amplitude == pytest.approx(3000 / 32767.0 * 3.0)
+        assert _sumsq_pcm16(samples.tobytes(), 32) == 128 * 3000**2
+
+    def test_sum_of_squares_kernel(self) -> None:
+        """Test the int16 kernel accumulates without wrapping."""
+        data = np.array([-32768, 32767, 3], dtype=np.int16).tobytes()
+
+        assert _sumsq_pcm16(data) == 32768**2 + 32767**2 + 9
+
+    @pytest.mark.parametrize(
+        ("bits", "dtype", "full_scale"),
+        [(8, np.int8, 127), (16, np.int16, 32767), (32, np.int32, 2147483647)],
+    )
+    def test_amplitude_per_bit_depth(
+        self, bits: int, dtype: type, full_scale: int
+    ) -> None:
+        """Test amplitude is scaled to each format's full range."""
+        manager = AudioManager(config=AudioConfig(format_bits=bits))
+        samples = np.array([full_scale // 10, -(full_scale // 10)] * 8, dtype=dtype)
+
+        amplitude = manager._calculate_amplitude(samples.tobytes())
+
+        assert amplitude == pytest.approx((full_scale // 10) / full_scale * 3.0)
+
+    def test_amplitude_int24(self) -> None:
+        """Test packed 24-bit samples are sign-extended and scaled."""
+        manager = AudioManager(config=AudioConfig(format_bits=24))
+        values = [838860, -838860, 8388607, -8388608]
+        data = b"".join(v.to_bytes(3, "little", signed=True) for v in values)
+        expected = float(np.sqrt(np.mean(np.square(values, dtype=np.float64))))
+
+        amplitude = manager._calculate_amplitude_batched([data[:6], data[6:]])
+
+        assert amplitude == pytest.approx(min(1.0, expected / 8388607 * 3.0))
+        assert manager._calculate_amplitude(data[:6]) == pytest.approx(0.3, rel=1e-6)
+
+    def test_silence_matches_sample_width(self) -> None:
+        """Test lead-in silence covers every channel at the sample width."""
+        manager = AudioManager(config=AudioConfig(format_bits=24, channels=2))
+
+        assert manager._generate_silence(10) == bytes(160 * 3 * 2)
+
+    def test_pure_python_fallback_without_numpy(self) -> None:
+        """Test amplitude still works when numpy is not installed."""
+        code = (
+            "import sys; sys.modules['numpy'] = None; sys.modules['numba'] = None\n"
+            "import struct\n"
+            "from reachy_agent.voice import audio\n"
+            "assert not audio.NUMPY_AVAILABLE\n"
+            "data = struct.pack('<3h', -32768, 32767, 3)\n"
+            "print(audio._sumsq_pcm16(data))\n"
+            "packed = b''.join(v.to_bytes(3, 'little', signed=True) for v in (-5, 7))\n"
+            "print(audio._sumsq_pcm24(packed), audio._sumsq_pcm8(b'\\xfe\\x03'))\n"
+            "mono = audio._downmix_int16(struct.pack('<4h', 1, 2, -3, -6), 2)\n"
+            "print(struct.unpack('<2h', mono))\n"
+            "print(len(audio.AudioManager()._generate_silence(10)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        lines = result.stdout.splitlines()  # init logs go to stdout too
+        assert lines[0] == str(32768**2 + 32767**2 + 9)
+        assert lines[1] == "74 13"
+        assert lines[2] == "(1, -5)"
+        assert lines[-1] == "320"
+
+    def test_loud_chunk_does_not_overflow(self) -> None:
+        """Test full-scale samples clip to 1.0 rather than wrapping."""
+        samples = np.full(4096, -32768, dtype=np.int16)
+
+        assert AudioManager()._calculate_amplitude(samples.tobytes()) == 1.0
+
+    @pytest.mark.asyncio
+    async def test_stop_ends_idle_stream_promptly(self) -> None:
+        """Test stop_recording wakes a stream that is waiting for data."""
+        manager = AudioManager()
+        manager._is_recording = True
+        received: list[bytes] = []
+
+        async def consume() -> None:
+            async for chunk in manager.read_audio_stream():
+                received.append(chunk)
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        assert not consumer.done()
+
+        await manager.stop_recording()
+        await asyncio.wait_for(consumer, 0.05)
+
+        assert received == []
+
+
+class TestPyAudioConstants:
+    """Test PyAudio constants are resolved once at init."""
+
+    def test_format_resolved_from_bit_depth(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test the configured bit depth maps to the PyAudio format."""
+        manager = AudioManager(config=AudioConfig(format_bits=24))
+
+        assert manager.pyaudio_format == fake_pyaudio.paInt24
+
+    def test_unknown_bit_depth_falls_back_to_int16(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test unsupported bit depths use paInt16."""
+        manager = AudioManager(config=AudioConfig(format_bits=12))
+
+        assert manager.pyaudio_format == fake_pyaudio.paInt16
+
+
+class TestOutputStream:
+    """Test the persistent speaker stream."""
+
+    @pytest.mark.asyncio
+    async def test_play_audio_reuses_stream(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test consecutive playbacks share one open stream."""
+        manager = AudioManager(config=AudioConfig(output_lead_in_ms=0))
+
+        await manager.play_audio(b"\x01\x00")
+        await manager.play_audio(b"\x02\x00")
+
+        streams = manager._pyaudio.streams
+        assert len(streams) == 1
+        assert streams[0].writes == [b"\x01\x00", b"\x02\x00"]
+        assert not streams[0].closed
+
+    @pytest.mark.asyncio
+    async def test_lead_in_silence_built_once(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test each playback writes lead-in and audio in one call."""
+        manager = AudioManager(config=AudioConfig(output_lead_in_ms=100))
+
+        await manager.play_audio(b"\x01\x00")
+        await manager.play_audio(b"\x02\x00")
+
+        silence = bytes(1600 * 2)
+        writes = manager._pyaudio.streams[0].writes
+        assert manager._lead_in_silence() is manager._lead_in_silence()
+        assert writes == [silence + b"\x01\x00", silence + b"\x02\x00"]
+
+    def test_lead_in_silence_follows_config(self) -> None:
+        """Test replacing the config rebuilds the silence."""
+        manager = AudioManager(config=AudioConfig(output_lead_in_ms=100))
+        assert len(manager._lead_in_silence()) == 3200
+
+        manager.config = AudioConfig(output_lead_in_ms=50)
+
+        assert len(manager._lead_in_silence()) == 1600
+
+    @pytest.mark.asyncio
+    async def test_play_audio_stream_shares_stream(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test streamed playback writes to the same stream as play_audio."""
+        manager = AudioManager(config=AudioConfig(output_lead_in_ms=0))
+        amplitudes: list[float] = []
+
+        async def chunks():
+            yield b"\x03\x00"
+            yield b"\x04\x00"
+
+        await manager.play_audio(b"\x01\x00")
+        await manager.play_audio_stream(chunks(), on_amplitude=amplitudes.append)
+
+        streams = manager._pyaudio.streams
+        assert len(streams) == 1
+        assert streams[0].writes == [b"\x01\x00", b"\x03\x00\x04\x00"]
+        assert len(amplitudes) == 2  # throttled update + reset
+        assert amplitudes[-1] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_play_audio_stream_coalesces_writes(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test small chunks are written in 8-chunk blocks plus a tail."""
+        config = AudioConfig(chunk_size=4, output_lead_in_ms=0)
+        manager = AudioManager(config=config)
+        chunk = b"\x01\x00" * config.chunk_size
+
+        async def chunks():
+            for _ in range(19):
+                yield chunk
+
+        await manager.play_audio_stream(chunks())
+
+        writes = manager._pyaudio.streams[0].writes
+        assert [len(w) for w in writes] == [
+            8 * len(chunk),
+            8 * len(chunk),
+            3 * len(chunk),
+        ]
+        assert b"".join(writes) == chunk * 19
+
+    @pytest.mark.asyncio
+    async def test_failed_write_reopens_stream(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test a broken stream is dropped and reopened on the next call."""
+        manager = AudioManager(config=AudioConfig(output_lead_in_ms=0))
+        broken = manager._ensure_output_stream()
+
+        def fail(data: bytes) -> None:
+            raise OSError("device unplugged")
+
+        broken.write = fail  # type: ignore[method-assign]
+        with pytest.raises(OSError):
+            await manager.play_audio(b"\x01\x00")
+        await manager.play_audio(b"\x02\x00")
+
+        first, second = manager._pyaudio.streams
+        assert first.closed
+        assert second.writes == [b"\x02\x00"]
+
+    @pytest.mark.asyncio
+    async def test_stream_writes_on_playback_thread(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test streamed blocks are written by the dedicated playback thread."""
+        manager = AudioManager(config=AudioConfig(output_lead_in_ms=0))
+        stream = manager._ensure_output_stream()
+        writer_threads: list[str] = []
+        original_write = stream.write
+
+        def write(data: bytes) -> None:
+            writer_threads.append(threading.current_thread().name)
+            original_write(data)
+
+        stream.write = write  # type: ignore[method-assign]
+
+        async def chunks():
+            yield b"\x01\x00"
+
+        await manager.play_audio_stream(chunks())
+        await manager.play_audio_stream(chunks())
+
+        assert writer_threads == ["reachy-audio-playback"] * 2
+        assert stream.writes == [b"\x01\x00", b"\x01\x00"]
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_write_reopens_stream(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test a playback thread write error surfaces from play_audio_stream."""
+        manager = AudioManager(config=AudioConfig(output_lead_in_ms=0))
+        broken = manager._ensure_output_stream()
+
+        def fail(data: bytes) -> None:
+            raise OSError("device unplugged")
+
+        broken.write = fail  # type: ignore[method-assign]
+
+        async def chunks():
+            yield b"\x01\x00"
+
+        with pytest.raises(OSError, match="unplugged"):
+            await manager.play_audio_stream(chunks())
+        await manager.play_audio_stream(chunks())
+
+        first, second = manager._pyaudio.streams
+        assert first.closed
+        assert second.writes == [b"\x01\x00"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_drops_unwritten_blocks(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test interrupting a stream does not play the blocks still queued."""
+        config = AudioConfig(chunk_size=4, output_lead_in_ms=0)
+        manager = AudioManager(config=config)
+        stream = manager._ensure_output_stream()
+        block = b"\x01\x00" * config.chunk_size * 8
+        write_started = threading.Event()
+        release = threading.Event()
+        original_write = stream.write
+
+        def write(data: bytes) -> None:
+            write_started.set()
+            release.wait(1.0)
+            original_write(data)
+
+        stream.write = write  # type: ignore[method-assign]
+
+        async def chunks():
+            for _ in range(10):
+                yield block
+
+        task = asyncio.create_task(manager.play_audio_stream(chunks()))
+        assert await asyncio.to_thread(write_started.wait, 1.0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        release.set()
+        await asyncio.to_thread(manager._write_queue.join)
+
+        assert stream.writes == [block]
+
+    @pytest.mark.asyncio
+    async def test_close_stops_playback_thread(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test close() shuts the playback thread down."""
+        manager = AudioManager(config=AudioConfig(output_lead_in_ms=0))
+
+        async def chunks():
+            yield b"\x01\x00"
+
+        await manager.play_audio_stream(chunks())
+        thread = manager._writer_thread
+
+        await manager.close()
+
+        assert thread is not None and not thread.is_alive()
+        assert manager._writer_thread is None
+
+    @pytest.mark.asyncio
+    async def test_close_closes_output_stream(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test close() releases the shared stream."""
+        manager = AudioManager(config=AudioConfig(output_lead_in_ms=0))
+        await manager.play_audio(b"\x01\x00")
+        stream = manager._pyaudio.streams[0]
+
+        await manager.close()
+
+        assert stream.closed
+        assert manager._output_stream is None
+
+    @pytest.mark.asyncio
+    async def test_amplitude_updates_are_throttled(
+        self, fake_pyaudio: types.ModuleType, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test on_amplitude fires at most once per display interval."""
+        manager = AudioManager(config=AudioConfig(output_lead_in_ms=0))
+        loop = asyncio.get_running_loop()
+        now = [loop.time()]
+        monkeypatch.setattr(loop, "time", lambda: now[0])
+        amplitudes: list[float] = []
+
+        async def chunks():
+            for step in (0.0, 0.01, 0.01, 0.02, 0.01):
+                now[0] += step
+                yield b"\xff\x7f"
+
+        await manager.play_audio_stream(chunks(), on_amplitude=amplitudes.append)
+
+        # Chunks at t=0, .01, .02, .04, .05: only t=0 and t=.04 emit,
+        # the second covering the three chunks since the first.
+        assert amplitudes == [1.0, 1.0, 0.0]
+
+
+class TestReadAudioStream:
+    """Test chunk coalescing in read_audio_stream."""
+
+    @pytest.mark.asyncio
+    async def test_default_yields_single_chunks(self) -> None:
+        """Test the default keeps exact chunk boundaries."""
+        manager = AudioManager()
+        manager._is_recording = True
+        for frame in (b"a", b"b", b"c"):
+            manager._push_frame(frame)
+
+        stream = manager.read_audio_stream()
+        chunks = [await anext(stream) for _ in range(3)]
+
+        assert chunks == [b"a", b"b", b"c"]
+        assert manager.queue_depth() == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesces_only_buffered_chunks(self) -> None:
+        """Test a backlog is joined up to the limit and a shallow ring is not."""
+        manager = AudioManager()
+        manager._is_recording = True
+        for frame in (b"a", b"b", b"c", b"d", b"e"):
+            manager._push_frame(frame)
+        stream = manager.read_audio_stream(coalesce=3)
+
+        assert manager.queue_depth() == 5
+        assert await anext(stream) == b"abc"
+        assert await anext(stream) == b"de"
+
+        asyncio.get_running_loop().call_later(0.01, manager._push_frame, b"f")
+        assert await anext(stream) == b"f"
+
+    @pytest.mark.asyncio
+    async def test_batched_waits_for_full_batch(self) -> None:
+        """Test batches fill up to ``frames`` and a partial one flushes late."""
+        manager = AudioManager()
+        manager._is_recording = True
+        for frame in (b"a", b"b", b"c"):
+            manager._push_frame(frame)
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, manager._push_frame, b"d")
+        loop.call_later(0.02, manager._push_frame, b"e")
+        stream = manager.read_audio_batched(frames=4, max_wait=0.05)
+
+        assert await anext(stream) == b"abcd"
+        start = loop.time()
+        assert await anext(stream) == b"e"
+        assert loop.time() - start >= 0.03
+
+    @pytest.mark.asyncio
+    async def test_batched_ends_on_stop(self) -> None:
+        """Test the batched reader finishes once recording stops."""
+        manager = AudioManager()
+        manager._is_recording = True
+
+        def stop() -> None:
+            manager._is_recording = False
+            manager._data_event.set()
+
+        asyncio.get_running_loop().call_later(0.01, stop)
+
+        assert [batch async for batch in manager.read_audio_batched()] == []
+
+    @pytest.mark.asyncio
+    async def test_amplitude_callback_runs_after_write_dispatch(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test on_amplitude is called off the write path, not before it."""
+        manager = AudioManager(config=AudioConfig(chunk_size=1, output_lead_in_ms=0))
+        stream = manager._ensure_output_stream()
+        write_started = threading.Event()
+        original_write = stream.write
+        writes_seen: list[bool] = []
+
+        def write(data: bytes) -> None:
+            write_started.set()
+            original_write(data)
+
+        def callback(amplitude: float) -> None:
+            # Inline before the write, this would time out and record False
+            writes_seen.append(write_started.wait(1.0))
+
+        stream.write = write  # type: ignore[method-assign]
+
+        async def chunks():
+            # One full output block, so it is written immediately
+            yield b"\xff\x7f" * 8
+
+        await manager.play_audio_stream(chunks(), on_amplitude=callback)
+
+        assert writes_seen == [True, True]  # update + reset
+
+    @pytest.mark.asyncio
+    async def test_amplitudes_generator_receives_updates(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test amplitudes() readers get updates and the final reset."""
+        manager = AudioManager(config=AudioConfig(output_lead_in_ms=0))
+        received: list[float] = []
+
+        async def read() -> None:
+            async for amplitude in manager.amplitudes():
+                received.append(amplitude)
+                if amplitude == 0.0:
+                    return
+
+        reader = asyncio.create_task(read())
+        await asyncio.sleep(0)
+
+        async def chunks():
+            yield b"\xff\x7f"
+
+        await manager.play_audio_stream(chunks())
+        await asyncio.wait_for(reader, 1.0)
+
+        assert received == [1.0, 0.0]
+        assert manager._amp_readers == 0
+
+
+class TestStreamPreflight:
+    """Test stream parameters are validated once and reused."""
+
+    @pytest.mark.asyncio
+    async def test_format_checked_once_at_init(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test both directions are checked at init and not on each open."""
+        manager = AudioManager(config=AudioConfig(output_lead_in_ms=0))
+        checks = manager._pyaudio.format_checks
+
+        await manager.play_audio(b"\x01\x00")
+        await manager.close()
+
+        assert checks == [
+            {
+                "rate": 16000,
+                "input_device": 0,
+                "input_channels": 1,
+                "input_format": fake_pyaudio.paInt16,
+            },
+            {
+                "rate": 16000,
+                "output_device": 0,
+                "output_channels": 1,
+                "output_format": fake_pyaudio.paInt16,
+            },
+        ]
+
+    def test_unsupported_format_raises_at_init(
+        self, fake_pyaudio: types.ModuleType, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a rejected format fails fast instead of at first open."""
+
+        def reject(self: FakePyAudio, rate: int, **kwargs: Any) -> bool:
+            raise ValueError("Invalid sample rate")
+
+        monkeypatch.setattr(FakePyAudio, "is_format_supported", reject)
+
+        with pytest.raises(AudioInitializationError, match="16000 Hz"):
+            AudioManager()
+
+    @pytest.mark.asyncio
+    async def test_failed_open_revalidates(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test a failed input open drops the cached parameters."""
+        manager = AudioManager()
+        assert manager._open_input_kwargs is not None
+
+        def fail(**kwargs: Any) -> FakeStream:
+            raise OSError("Device unavailable")
+
+        manager._pyaudio.open = fail  # type: ignore[method-assign]
+        with pytest.raises(AudioInitializationError):
+            await manager.start_recording()
+
+        assert manager._open_input_kwargs is None
+
+
+class TestDeviceEnumeration:
+    """Test device enumeration is cached per PyAudio instance."""
+
+    def test_devices_enumerated_once(self, fake_pyaudio: types.ModuleType) -> None:
+        """Test repeated listings reuse one enumeration."""
+        manager = AudioDeviceManager()
+
+        first = manager.list_devices()
+        second = manager.list_devices()
+
+        assert first == second
+        assert first[0]["index"] == 0
+        assert first is not second  # callers get their own list
+        assert manager._pyaudio.device_count_calls == 1
+
+    def test_validation_uses_cached_enumeration(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test validation and fallback lookups reuse the cache."""
+        manager = AudioDeviceManager()
+
+        assert manager.validate_device(0)
+        assert not manager.validate_device(5)
+        assert manager.get_fallback_device(for_input=False) == 0
+        assert manager.get_fallback_device(for_input=False) == 0
+
+        assert manager._pyaudio.device_count_calls == 1
+        assert manager._default_cache == {False: 0}
+
+    def test_cache_expires_after_ttl(
+        self, fake_pyaudio: types.ModuleType, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test devices are re-enumerated once the TTL passes."""
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        manager = AudioDeviceManager(cache_ttl_seconds=30.0)
+
+        manager.list_devices()
+        now[0] += 10
+        manager.list_devices()
+        now[0] += 31
+        manager.list_devices()
+
+        assert manager._pyaudio.device_count_calls == 2
+
+    def test_invalidate_devices(self, fake_pyaudio: types.ModuleType) -> None:
+        """Test an explicit invalidation forces a fresh enumeration."""
+        manager = AudioDeviceManager()
+        manager.list_devices()
+
+        manager.invalidate_devices()
+        manager.list_devices()
+
+        assert manager._pyaudio.device_count_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_invalidates_devices(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test a failed output write drops the device cache."""
+        config = AudioConfig(output_device_index=0, output_lead_in_ms=0)
+        manager = AudioManager(config=config)
+        stream = manager._ensure_output_stream()
+        assert manager._device_manager._device_cache is not None
+
+        def fail(data: bytes) -> None:
+            raise OSError("device unplugged")
+
+        stream.write = fail  # type: ignore[method-assign]
+        with pytest.raises(OSError):
+            await manager.play_audio(b"\x01\x00")
+
+        assert manager._device_manager._device_cache is None
+        assert manager._open_output_kwargs is None
+
+    def test_close_drops_cached_devices(self, fake_pyaudio: types.ModuleType) -> None:
+        """Test a closed manager reports no devices."""
+        manager = AudioDeviceManager()
+        assert manager.list_devices()
+
+        manager.close()
+
+        assert manager.list_devices() == []
+
+
+class TestCaptureThreadPriority:
+    """Test scheduling tweaks applied to the record thread."""
+
+    def test_requests_fifo_and_pins_core(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test SCHED_FIFO is requested and audio_cpu pins the thread."""
+        calls: list[tuple[str, object]] = []
+        monkeypatch.setattr(
+            "os.sched_setscheduler",
+            lambda pid, policy, param: calls.append(("fifo", pid)),
+            raising=False,
+        )
+        monkeypatch.setattr(
+            "os.sched_setaffinity",
+            lambda pid, cpus: calls.append(("affinity", cpus)),
+            raising=False,
+        )
+        manager = AudioManager(config=AudioConfig(audio_cpu=2))
+
+        manager._boost_capture_thread()
+
+        assert calls == [("fifo", 0), ("affinity", {2})]
+
+    def test_no_pinning_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test nothing is pinned without audio_cpu."""
+        calls: list[object] = []
+        monkeypatch.setattr(
+            "os.sched_setaffinity", lambda *args: calls.append(args), raising=False
+        )
+        manager = AudioManager()
+
+        manager._boost_capture_thread()
+
+        assert calls == []
+
+    def test_failures_are_ignored(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test missing privileges and invalid cores do not raise."""
+
+        def fail(*args: object) -> None:
+            raise PermissionError("Operation not permitted")
+
+        monkeypatch.setattr("os.sched_setscheduler", fail, raising=False)
+        monkeypatch.setattr("os.sched_setaffinity", fail, raising=False)
+        manager = AudioManager(config=AudioConfig(audio_cpu=999))
+
+        manager._boost_capture_thread()
+
+    def test_playback_thread_requests_priority(
+        self, fake_pyaudio: types.ModuleType, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the playback thread raises its own priority on start."""
+        threads: list[str] = []
+        monkeypatch.setattr(
+            "reachy_agent.voice.audio._set_rt_priority",
+            lambda: threads.append(threading.current_thread().name),
+        )
+        manager = AudioManager()
+
+        manager._ensure_writer_thread()
+        manager._write_queue.put(None)
+        manager._writer_thread.join(1.0)
+
+        assert threads == ["reachy-audio-playback"]
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="SCHED_FIFO is Linux-only")
+    def test_priority_failure_returns_false(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a refused real-time request is reported, not raised."""
+
+        def fail(*args: object) -> None:
+            raise PermissionError("Operation not permitted")
+
+        monkeypatch.setattr("os.sched_setscheduler", fail)
+
+        assert _set_rt_priority() is False
+
+
+class TestRecordingLifecycle:
+    """Test the blocking-read record thread."""
+
+    @pytest.mark.asyncio
+    async def test_record_thread_feeds_reads(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test frames read on the record thread reach read_audio."""
+        manager = AudioManager(config=AudioConfig(input_warmup_chunks=0))
+
+        await manager.start_recording()
+        stream = manager._pyaudio.streams[0]
+        thread = manager._record_thread
+        chunk = await manager.read_audio(timeout=1.0)
+        await manager.stop_recording()
+
+        assert chunk == bytes(1024)
+        assert "stream_callback" not in stream.kwargs
+        assert stream.kwargs["input"] is True
+        assert stream.closed
+        assert thread is not None and not thread.is_alive()
+        assert manager._record_thread is None
+
+    @pytest.mark.asyncio
+    async def test_warmup_discarded_in_one_read(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test warmup chunks are dropped by one read on the record thread."""
+        manager = AudioManager(config=AudioConfig(input_warmup_chunks=5))
+        manager._is_recording = True
+        stream = FakeStream()
+        stream.reads = [b"settling", b"speech"]
+        reader = threading.Thread(target=manager._reader_loop, args=(stream,))
+        reader.start()
+        try:
+            assert await manager.read_audio(timeout=1.0) == b"speech"
+        finally:
+            manager._is_recording = False
+            reader.join()
+
+        assert stream.read_sizes[:2] == [5 * 512, 512]
+
+    @pytest.mark.asyncio
+    async def test_multichannel_capture_is_downmixed(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test interleaved mic-array frames reach readers as mono."""
+        config = AudioConfig(
+            capture_channels=4, input_warmup_chunks=0, input_device_index=0
+        )
+        manager = AudioManager(config=config)
+        manager._is_recording = True
+        stream = FakeStream()
+        frames = np.array([[100, 200, 300, 400], [-1, -2, -3, -4]], dtype=np.int16)
+        stream.reads = [frames.tobytes()]
+        reader = threading.Thread(target=manager._reader_loop, args=(stream,))
+        reader.start()
+        try:
+            chunk = await manager.read_audio(timeout=1.0)
+        finally:
+            manager._is_recording = False
+            reader.join()
+
+        assert np.frombuffer(chunk, dtype=np.int16).tolist() == [250, -3]
+        assert manager._stream_kwargs(for_input=True)["channels"] == 4
+        assert manager._stream_kwargs(for_input=False)["channels"] == 1
+
+    def test_downmix_requires_mono_int16(self, fake_pyaudio: types.ModuleType) -> None:
+        """Test downmixing is refused for formats it does not handle."""
+        config = AudioConfig(capture_channels=4, format_bits=24)
+
+        with pytest.raises(AudioInitializationError, match="downmixes to mono"):
+            AudioManager(config=config)
+
+    @pytest.mark.asyncio
+    async def test_repeated_read_errors_report_disconnect(self) -> None:
+        """Test consecutive read failures surface through on_device_error."""
+        errors: list[Exception] = []
+        manager = AudioManager(
+            config=AudioConfig(max_consecutive_errors=2, input_warmup_chunks=0)
+        )
+        manager.on_device_error = errors.append
+        manager._loop = asyncio.get_running_loop()
+        manager._is_recording = True
+        stream = FakeStream()
+        stream.reads = [b"ok", OSError("Input overflowed"), OSError("gone")]
+
+        await asyncio.to_thread(manager._reader_loop, stream)
+        await asyncio.sleep(0)
+
+        assert manager._audio_ring.pop() == b"ok"
+        assert len(errors) == 1
+        assert isinstance(errors[0], AudioStreamDisconnectedError)
+
+
+class TestStreamBufferSize:
+    """Test host buffer sizing from the device's low-latency hint."""
+
+    def test_buffer_follows_low_latency_hint(
+        self, fake_pyaudio: types.ModuleType
+    ) -> None:
+        """Test the hint is rounded up to a power of two, capped at a chunk."""
+        manager = AudioManager(
+            config=AudioConfig(input_device_index=0, output_device_index=0)
+        )
+
+        # 8.7 ms @ 16 kHz = 140 frames -> 256; 50 ms = 800 frames -> capped
+        assert manager._stream_kwargs(for_input=True)["frames_per_buffer"] == 256
+        assert manager._stream_kwargs(for_input=False)["frames_per_buffer"] == 512
+
+    def test_missing_hint_uses_chunk_size(
+        self, fake_pyaudio: types.ModuleType, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test devices without latency info get one chunk per buffer."""
+        monkeypatch.setattr(
+            FakePyAudio, "get_device_info_by_index", lambda self, index: {}
+        )
+        manager = AudioManager()
+
+        assert manager._low_latency_frames(0, for_input=True) == 512
+
+
+class TestInitRetry:
+    """Test PyAudio init retries inside and outside the event loop."""
+
+    @pytest.fixture
+    def flaky_pyaudio(self, fake_pyaudio: types.ModuleType) -> list[int]:
+        """Make the first two PyAudio() constructions fail."""
+        attempts: list[int] = []
+
+        class FlakyPyAudio(FakePyAudio):
+            def __init__(self) -> None:
+                attempts.append(len(attempts))
+                if len(attempts) <= 2:
+                    raise OSError("ALSA busy")
+                super().__init__()
+
+        fake_pyaudio.PyAudio = FlakyPyAudio  # type: ignore[attr-defined]
+        return attempts
+
+    @pytest.mark.asyncio
+    async def test_retries_are_awaited_inside_loop(
+        self, flaky_pyaudio: list[int]
+    ) -> None:
+        """Test construction in a loop makes one attempt and defers retries."""
+        config = AudioConfig(retry_delay_seconds=0.01)
+        manager = AudioManager(config=config)
+
+        assert len(flaky_pyaudio) == 1
+        assert not manager.is_available
+
+        await manager.initialize()
+
+        assert len(flaky_pyaudio) == 3
+        assert manager.is_available
+
+    @pytest.mark.asyncio
+    async def test_initialize_raises_when_exhausted(
+        self, flaky_pyaudio: list[int]
+    ) -> None:
+        """Test initialize gives up after max_init_retries attempts."""
+        config = AudioConfig(max_init_retries=2, retry_delay_seconds=0.01)
+        manager = AudioManager(config=config)
+
+        with pytest.raises(AudioInitializationError, match="after 2 attempts"):
+            await manager.initialize()
+
+    def test_blocking_retry_outside_loop(
+        self, flaky_pyaudio: list[int], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test synchronous construction still retries with backoff."""
+        sleeps: list[float] = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+
+        manager = AudioManager(config=AudioConfig(retry_delay_seconds=0.5))
+
+        assert manager.is_available
+        assert sleeps == [0.5, 1.0]
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+import yaml
+
 from reachy_agent.utils.config import (
     AgentConfig,
     ClaudeModel,
@@ -128,6 +131,43 @@ perception:
         # Defaults should still apply for unspecified values
         assert config.memory.embedding_model == "all-MiniLM-L6-v2"
 
+    def test_from_yaml_returns_independent_copies(self, tmp_path: Path) -> None:
+        """Test cached loads don't share state between callers."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("agent:\n  name: Cached\n")
+
+        first = ReachyConfig.from_yaml(config_file)
+        first.agent.name = "Mutated"
+        second = ReachyConfig.from_yaml(config_file)
+
+        assert second.agent.name == "Cached"
+        assert second is not first
+
+    def test_from_yaml_reloads_changed_file(self, tmp_path: Path) -> None:
+        """Test a modified file is parsed again."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("agent:\n  name: Before\n")
+        assert ReachyConfig.from_yaml(config_file).agent.name == "Before"
+
+        config_file.write_text("agent:\n  name: AfterEdit\n")
+
+        assert ReachyConfig.from_yaml(config_file).agent.name == "AfterEdit"
+
+    def test_from_yaml_empty_file_uses_defaults(self, tmp_path: Path) -> None:
+        """Test that an empty YAML file yields the default configuration."""
+        config_file = tmp_path / "empty.yaml"
+        config_file.write_text("")
+
+        assert ReachyConfig.from_yaml(config_file) == ReachyConfig()
+
+    def test_from_yaml_rejects_python_tags(self, tmp_path: Path) -> None:
+        """Test that the loader stays safe and refuses arbitrary objects."""
+        config_file = tmp_path / "unsafe.yaml"
+        config_file.write_text("version: !!python/object/apply:os.getcwd []\n")
+
+        with pytest.raises(yaml.YAMLError):
+            ReachyConfig.from_yaml(config_file)
+
     def test_to_yaml(self, tmp_path: Path) -> None:
         """Test saving to YAML file."""
         config = ReachyConfig(
@@ -142,6 +182,22 @@ perception:
         assert loaded.agent.name == "TestBot"
         assert loaded.agent.max_tokens == 512
 
+    @pytest.mark.asyncio
+    async def test_to_yaml_async(self, tmp_path: Path) -> None:
+        """Test saving from a coroutine writes the same file as to_yaml."""
+        config = ReachyConfig()
+        config.agent.name = "AsyncReachy"
+
+        await config.to_yaml_async(tmp_path / "async.yaml")
+        config.to_yaml(tmp_path / "sync.yaml")
+
+        assert (tmp_path / "async.yaml").read_text() == (
+            tmp_path / "sync.yaml"
+        ).read_text()
+        assert (
+            ReachyConfig.from_yaml(tmp_path / "async.yaml").agent.name == "AsyncReachy"
+        )
+
     def test_nested_path_creation(self, tmp_path: Path) -> None:
         """Test that to_yaml creates parent directories."""
         config = ReachyConfig()
@@ -0,0 +1,84 @@
+"""Unit tests for logging configuration."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import structlog
+
+from reachy_agent.utils import logging as reachy_logging
+from reachy_agent.utils.logging import configure_logging, get_logger
+
+
+@pytest.fixture
+def restore_logging() -> Iterator[None]:
+    """Undo configure_logging side effects after a test."""
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    yield
+    for handler in root.handlers:
+        if handler not in handlers:
+            root.removeHandler(handler)
+            handler.close()
+    reachy_logging._configured_with = None
+    reachy_logging._file_handler = None
+    structlog.reset_defaults()
+
+
+def _file_handlers(directory: Path) -> list[logging.FileHandler]:
+    """File handlers on the root logger writing under ``directory``."""
+    return [
+        h
+        for h in logging.getLogger().handlers
+        if isinstance(h, logging.FileHandler)
+        and h.baseFilename.startswith(str(directory))
+    ]
+
+
+class TestGetLogger:
+    """Test get_logger."""
+
+    def test_same_name_returns_cached_logger(self) -> None:
+        """Test loggers are created once per name."""
+        assert get_logger("reachy.test") is get_logger("reachy.test")
+        assert get_logger(None) is get_logger()
+
+    def test_different_names_get_different_loggers(self) -> None:
+        """Test distinct names are not conflated by the cache."""
+        assert get_logger("reachy.test.a") is not get_logger("reachy.test.b")
+
+
+@pytest.mark.usefixtures("restore_logging")
+class TestConfigureLogging:
+    """Test configure_logging."""
+
+    def test_repeated_calls_add_one_file_handler(self, tmp_path: Path) -> None:
+        """Test reconfiguring with the same file does not stack handlers."""
+        log_file = tmp_path / "logs" / "agent.log"
+
+        configure_logging(level="debug", log_file=log_file)
+        configure_logging(level="debug", log_file=log_file)
+
+        handlers = _file_handlers(tmp_path)
+        assert len(handlers) == 1
+        assert handlers[0].level == logging.DEBUG
+        assert log_file.parent.is_dir()
+
+    def test_new_log_file_replaces_handler(self, tmp_path: Path) -> None:
+        """Test a different log file swaps out the previous handler."""
+        configure_logging(log_file=tmp_path / "a.log")
+        configure_logging(log_file=tmp_path / "b.log")
+
+        handlers = _file_handlers(tmp_path)
+        assert [Path(h.baseFilename).name for h in handlers] == ["b.log"]
+
+        configure_logging()
+        assert _file_handlers(tmp_path) == []
+
+    def test_unknown_level_raises(self) -> None:
+        """Test an unknown level name is rejected."""
+        with pytest.raises(ValueError, match="Unknown log level"):
+            configure_logging(level="LOUD")
@@ -0,0 +1,369 @@
+"""Tests for the OpenAI Realtime client's audio handling."""
+
+from __future__ import annotations
+
+import base64
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from reachy_agent.voice.openai_realtime import (
+    OpenAIRealtimeClient,
+    RealtimeConfig,
+    _PolyphaseResampler,
+)
+
+
+class FakeConnection:
+    """Realtime connection stand-in that replays scripted server events."""
+
+    def __init__(self, events: list[Any] | None = None) -> None:
+        self.events = events or []
+        self.input_audio_buffer = MagicMock()
+        self.input_audio_buffer.append = AsyncMock()
+        self.input_audio_buffer.commit = AsyncMock()
+
+    def __aiter__(self) -> FakeConnection:
+        return self
+
+    async def __anext__(self) -> Any:
+        if not self.events:
+            raise StopAsyncIteration
+        return self.events.pop(0)
+
+
+def make_client(**config: Any) -> OpenAIRealtimeClient:
+    """Build a client without touching the OpenAI SDK."""
+    with patch.object(OpenAIRealtimeClient, "_init_client", lambda self: None):
+        return OpenAIRealtimeClient(config=RealtimeConfig(**config))
+
+
+def appended_audio(connection: FakeConnection) -> list[bytes]:
+    """Decode every input_audio_buffer.append payload sent so far."""
+    return [
+        base64.b64decode(call.kwargs["audio"])
+        for call in connection.input_audio_buffer.append.await_args_list
+    ]
+
+
+class TestAudioEncoding:
+    """Test base64 framing of audio to and from the API."""
+
+    @pytest.mark.asyncio
+    async def test_send_audio_round_trips(self) -> None:
+        """Test sent PCM decodes back to the original bytes."""
+        client = make_client(input_sample_rate=24000)
+        client._connection = FakeConnection()
+        pcm = np.arange(-480, 480, dtype=np.int16).tobytes()
+
+        assert await client.send_audio(pcm)
+        assert await client.flush_audio()
+
+        assert appended_audio(client._connection) == [pcm]
+
+    @pytest.mark.asyncio
+    async def test_audio_delta_is_decoded(self) -> None:
+        """Test response audio deltas are yielded as raw PCM."""
+        pcm = np.full(240, 1000, dtype=np.int16).tobytes()
+        client = make_client()
+        client._connection = FakeConnection(
+            [
+                SimpleNamespace(
+                    type="response.audio.delta",
+                    delta=base64.b64encode(pcm).decode("ascii"),
+                ),
+                SimpleNamespace(type="response.done"),
+            ]
+        )
+
+        events = [event async for event in client.process_events()]
+
+        assert events == [("audio_delta", pcm), ("response_done", None)]
+        assert client.get_response_audio() == pcm
+
+    @pytest.mark.asyncio
+    async def test_response_audio_starts_fresh_per_response(self) -> None:
+        """Test collected audio covers only the latest response, in order."""
+
+        def delta(pcm: bytes) -> SimpleNamespace:
+            return SimpleNamespace(
+                type="response.audio.delta", delta=base64.b64encode(pcm).decode()
+            )
+
+        client = make_client()
+        client._connection = FakeConnection(
+            [delta(b"\x01\x00"), SimpleNamespace(type="response.done")]
+        )
+        _ = [event async for event in client.process_events()]
+        client._connection.events = [
+            delta(b"\x02\x00"),
+            delta(b"\x03\x00"),
+            SimpleNamespace(type="response.done"),
+        ]
+        _ = [event async for event in client.process_events()]
+
+        audio = client.get_response_audio()
+        assert audio == b"\x02\x00\x03\x00"
+        assert isinstance(audio, bytes)
+
+
+class TestTranscript:
+    """Test accumulation of response transcript deltas."""
+
+    @pytest.mark.asyncio
+    async def test_deltas_join_into_transcript(self) -> None:
+        """Test the done event carries every delta in order."""
+        client = make_client()
+        client._connection = FakeConnection(
+            [
+                SimpleNamespace(type="response.audio_transcript.delta", delta="Hel"),
+                SimpleNamespace(type="response.audio_transcript.delta", delta="lo"),
+                SimpleNamespace(type="response.audio_transcript.done"),
+                SimpleNamespace(type="response.done"),
+            ]
+        )
+
+        events = [event async for event in client.process_events()]
+
+        assert ("transcript_done", "Hello") in events
+        assert client.current_transcript == "Hello"
+
+    @pytest.mark.asyncio
+    async def test_transcript_starts_fresh_per_response(self) -> None:
+        """Test a new process_events call does not inherit old text."""
+        client = make_client()
+        client._transcript_parts.append("stale")
+        client._connection = FakeConnection([SimpleNamespace(type="response.done")])
+
+        _ = [event async for event in client.process_events()]
+
+        assert client.current_transcript == ""
+
+
+class TestSendBatching:
+    """Test coalescing of mic chunks into input_audio_buffer.append calls."""
+
+    @staticmethod
+    def chunk(index: int) -> bytes:
+        """20 ms of int16 audio at 24 kHz, filled with ``index``."""
+        return np.full(480, index, dtype=np.int16).tobytes()
+
+    @pytest.mark.asyncio
+    async def test_chunks_coalesce_into_batches(self) -> None:
+        """Test five 20 ms chunks become one 100 ms append."""
+        client = make_client(input_sample_rate=24000)
+        client._connection = FakeConnection()
+        chunks = [self.chunk(i) for i in range(7)]
+
+        for chunk in chunks:
+            assert await client.send_audio(chunk)
+
+        assert appended_audio(client._connection) == [b"".join(chunks[:5])]
+
+    @pytest.mark.asyncio
+    async def test_commit_flushes_partial_batch(self) -> None:
+        """Test the tail of a recording is sent before the commit."""
+        client = make_client(input_sample_rate=24000)
+        client._connection = FakeConnection()
+        order: list[str] = []
+        buffer = client._connection.input_audio_buffer
+        buffer.append.side_effect = lambda **_: order.append("append")
+        buffer.commit.side_effect = lambda: order.append("commit")
+
+        await client.send_audio(self.chunk(1))
+        assert await client.commit_audio()
+
+        assert appended_audio(client._connection) == [self.chunk(1)]
+        assert order == ["append", "commit"]
+
+    @pytest.mark.asyncio
+    async def test_clear_drops_pending_audio(self) -> None:
+        """Test audio batched before a clear never reaches the server."""
+        client = make_client(input_sample_rate=24000)
+        client._connection = FakeConnection()
+        client._connection.input_audio_buffer.clear = AsyncMock()
+
+        await client.send_audio(self.chunk(1))
+        await client.clear_audio_buffer()
+
+        assert await client.flush_audio()
+        assert appended_audio(client._connection) == []
+
+    @pytest.mark.asyncio
+    async def test_commit_fails_when_flush_fails(self) -> None:
+        """Test a dead socket during the final flush fails the commit."""
+        client = make_client(input_sample_rate=24000)
+        client._connection = connection = FakeConnection()
+        connection.input_audio_buffer.append.side_effect = RuntimeError(
+            "connection closed"
+        )
+
+        assert await client.send_audio(self.chunk(1))
+        assert not await client.commit_audio()
+
+        connection.input_audio_buffer.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_clear_resets_locally_when_server_clear_fails(self) -> None:
+        """Test stale batches and filter state never outlive a clear."""
+        client = make_client()
+        client._connection = FakeConnection()
+        client._connection.input_audio_buffer.clear = AsyncMock(
+            side_effect=RuntimeError("boom")
+        )
+        await client.send_audio(tone(1000)[:512].tobytes())
+
+        with patch.object(_PolyphaseResampler, "reset", autospec=True) as reset:
+            await client.clear_audio_buffer()
+
+        reset.assert_called_once_with(client._resampler)
+        assert not client._pending_audio
+
+    @pytest.mark.asyncio
+    async def test_connect_starts_a_clean_stream(self) -> None:
+        """Test a reconnect drops pending audio and resampler history."""
+        client = make_client()
+        connection = FakeConnection()
+        connection.session = MagicMock()
+        connection.session.update = AsyncMock()
+        client._client = MagicMock()
+        client._client.beta.realtime.connect.return_value.__aenter__ = AsyncMock(
+            return_value=connection
+        )
+        client._pending_audio += b"\x01\x00"
+
+        with patch.object(_PolyphaseResampler, "reset", autospec=True) as reset:
+            assert await client.connect()
+
+        reset.assert_called_once_with(client._resampler)
+        assert not client._pending_audio
+
+    @pytest.mark.asyncio
+    async def test_zero_batch_sends_every_chunk(self) -> None:
+        """Test send_batch_ms=0 keeps one append per chunk."""
+        client = make_client(input_sample_rate=24000, send_batch_ms=0)
+        client._connection = FakeConnection()
+
+        await client.send_audio(self.chunk(1))
+        await client.send_audio(self.chunk(2))
+
+        assert appended_audio(client._connection) == [self.chunk(1), self.chunk(2)]
+
+    @pytest.mark.asyncio
+    async def test_dead_connection_reported_on_flush(self) -> None:
+        """Test a closed socket surfaces as False from the batch send."""
+        client = make_client(input_sample_rate=24000, send_batch_ms=0)
+        client._connection = FakeConnection()
+        client._connection.input_audio_buffer.append.side_effect = RuntimeError(
+            "connection closed"
+        )
+
+        assert not await client.send_audio(self.chunk(1))
+        assert client._connection is None
+        assert not client._pending_audio
+
+
+class TestAmplitude:
+    """Test the RMS level reported to the HeadWobble callback."""
+
+    def test_matches_float_rms(self) -> None:
+        """Test integer accumulation agrees with a float64 reference."""
+        samples = (tone(440) // 8).astype(np.int16)
+        rms = np.sqrt(np.mean(samples.astype(np.float64) ** 2))
+
+        amplitude = make_client()._calculate_amplitude(samples.tobytes())
+
+        assert amplitude == pytest.approx(rms / 32767.0 * 3.0)
+
+    def test_full_scale_does_not_overflow(self) -> None:
+        """Test extreme samples clip to 1.0 instead of wrapping."""
+        samples = np.array([-32768, 32767] * 4800, dtype=np.int16)
+
+        assert make_client()._calculate_amplitude(samples.tobytes()) == 1.0
+        assert make_client()._calculate_amplitude(b"") == 0.0
+
+    def test_updates_are_rate_limited(self) -> None:
+        """Test deltas arriving faster than the servo can follow are skipped."""
+        levels: list[float] = []
+        client = make_client()
+        client.on_audio_amplitude = levels.append
+        chunk = tone(440)[:480].tobytes()
+
+        with patch(
+            "reachy_agent.voice.openai_realtime.time.monotonic",
+            side_effect=[100.0, 100.02, 100.04, 100.05, 100.08],
+        ):
+            for _ in range(5):
+                client._report_amplitude(chunk)
+
+        # 100.0 and 100.04 pass; 100.08 is 0.04 after the last update
+        assert len(levels) == 3
+        assert levels[0] > 0.0
+
+
+def tone(freq: float, rate: int = 16000, seconds: float = 1.0) -> np.ndarray:
+    """Int16 sine at 10000 peak."""
+    t = np.arange(int(rate * seconds)) / rate
+    return (10000 * np.sin(2 * np.pi * freq * t)).astype(np.int16)
+
+
+class TestResampler:
+    """Test the streaming polyphase resampler."""
+
+    def test_chunked_matches_one_shot(self) -> None:
+        """Test carrying filter state makes chunk boundaries seamless."""
+        x = tone(1000)
+        chunked = _PolyphaseResampler(16000, 24000)
+        whole = _PolyphaseResampler(16000, 24000)
+
+        out = b"".join(
+            chunked.process(x[i : i + 512].tobytes()) for i in range(0, len(x), 512)
+        )
+
+        assert out == whole.process(x.tobytes())
+        assert len(out) == 24000 * 2
+
+    def test_odd_chunks_keep_the_ratio(self) -> None:
+        """Test output length stays exact when chunks do not divide evenly."""
+        resampler = _PolyphaseResampler(16000, 24000)
+
+        sizes = [len(resampler.process(bytes(2 * n))) // 2 for n in (1, 1, 1, 5, 0)]
+
+        assert sizes == [2, 1, 2, 7, 0]
+
+    def test_suppresses_imaging(self) -> None:
+        """Test the upsampling image of a tone is filtered out."""
+        y = np.frombuffer(
+            _PolyphaseResampler(16000, 24000).process(tone(3000).tobytes()),
+            dtype=np.int16,
+        )
+
+        spectrum = np.abs(np.fft.rfft(y.astype(np.float64)))
+
+        # 3 kHz images to 13 kHz, which folds to 11 kHz at 24 kHz
+        assert spectrum[11000] < 1e-3 * spectrum[3000]
+
+    def test_resampler_built_once_when_rates_differ(self) -> None:
+        """Test the rate check happens at construction, not per chunk."""
+        assert make_client(input_sample_rate=24000)._resampler is None
+        assert make_client()._resampler.rates == (16000, 24000)
+
+    @pytest.mark.asyncio
+    async def test_clear_resets_filter_state(self) -> None:
+        """Test a new recording session does not inherit old samples."""
+        client = make_client()
+        client._connection = FakeConnection()
+        client._connection.input_audio_buffer.clear = AsyncMock()
+        chunk = tone(1000)[:512].tobytes()
+
+        await client.send_audio(chunk)
+        await client.flush_audio()
+        await client.clear_audio_buffer()
+        await client.send_audio(chunk)
+        await client.flush_audio()
+
+        first, second = appended_audio(client._connection)
+        assert first == second
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import dataclasses
+
+import pytest
+from pydantic import ValidationError
+
 from reachy_agent.permissions.tiers import (
     TIER_BEHAVIORS,
     PermissionConfig,
@@ -62,6 +67,7 @@ class TestPermissionRule:
         """Test converting tier int to enum."""
         rule = PermissionRule(pattern="test", tier=3, reason="test")
         assert rule.permission_tier == PermissionTier.CONFIRM
+        assert rule.behavior is TIER_BEHAVIORS[PermissionTier.CONFIRM]
 
 
 class TestPermissionEvaluator:
@@ -152,6 +158,119 @@ class TestPermissionEvaluator:
         # First rule matches, so tier 2
         assert decision.tier == PermissionTier.NOTIFY
 
+    def test_matches_linear_fnmatch_scan(
+        self, permission_evaluator: PermissionEvaluator
+    ) -> None:
+        """Compiled lookup should agree with a first-match fnmatch scan."""
+        tools = [
+            "Bash",
+            "Bashful",
+            "mcp__reachy__move_head",
+            "mcp__calendar__get_events",
+            "mcp__calendar__create_event",
+            "mcp__github__get_me",
+            "mcp__github__merge_pull_request",
+            "mcp__slack__send_message",
+            "mcp__slack__send_message_later",
+            "mcp__email__send",
+            "mcp__banking__transfer",
+            "mcp__unknown__tool",
+            "mcp",
+            "",
+        ]
+
+        for tool in tools:
+            expected = next(
+                (r for r in permission_evaluator.config.rules if r.matches(tool)),
+                None,
+            )
+            decision = permission_evaluator.evaluate(tool)
+            assert decision.matched_rule is expected, tool
+
+    def test_priority_across_prefix_depths(self) -> None:
+        """Rules indexed at different prefix depths keep list priority."""
+        config = PermissionConfig(
+            tiers=[],
+            rules=[
+                PermissionRule(pattern="mcp__*__delete_*", tier=4, reason="delete"),
+                PermissionRule(pattern="mcp__github__*", tier=1, reason="github"),
+                PermissionRule(pattern="*", tier=2, reason="catch-all"),
+            ],
+        )
+        evaluator = PermissionEvaluator(config=config)
+
+        assert evaluator.evaluate("mcp__github__delete_repo").reason == "delete"
+        assert evaluator.evaluate("mcp__github__get_me").reason == "github"
+        assert evaluator.evaluate("mcp__slack__post").reason == "catch-all"
+        assert evaluator.evaluate("Bash").reason == "catch-all"
+
+    def test_decisions_are_cached(
+        self, permission_evaluator: PermissionEvaluator
+    ) -> None:
+        """Repeat evaluations should reuse the cached decision."""
+        first = permission_evaluator.evaluate("mcp__reachy__nod")
+        assert permission_evaluator.evaluate("mcp__reachy__nod") is first
+
+        permission_evaluator.add_rule(
+            PermissionRule(pattern="mcp__reachy__nod", tier=2, reason="override")
+        )
+        assert permission_evaluator.evaluate("mcp__reachy__nod").reason == "override"
+
+    def test_evaluate_many(self, permission_evaluator: PermissionEvaluator) -> None:
+        """Batch evaluation should match per-tool evaluation, in order."""
+        tools = [
+            "mcp__reachy__nod",
+            "mcp__banking__transfer",
+            "mcp__reachy__nod",
+            "unknown__tool",
+        ]
+
+        decisions = permission_evaluator.evaluate_many(tools)
+
+        assert [d.tool_name for d in decisions] == tools
+        assert [d.tier for d in decisions] == [
+            PermissionTier.AUTONOMOUS,
+            PermissionTier.FORBIDDEN,
+            PermissionTier.AUTONOMOUS,
+            PermissionTier.CONFIRM,
+        ]
+        assert decisions[0] is decisions[2]
+        assert permission_evaluator.evaluate_many([]) == []
+
+    def test_default_config_is_shared_but_rules_are_not(self) -> None:
+        """Default evaluators share config without sharing rule edits."""
+        first = PermissionEvaluator()
+        second = PermissionEvaluator()
+        assert first.config is second.config
+
+        first.remove_rule("mcp__reachy__*")
+
+        assert first.evaluate("mcp__reachy__nod").tier == PermissionTier.CONFIRM
+        assert second.evaluate("mcp__reachy__nod").tier == PermissionTier.AUTONOMOUS
+        assert any(r.pattern == "mcp__reachy__*" for r in first.config.rules)
+
+    def test_empty_rules_use_default(self) -> None:
+        """An evaluator without rules should fall back to the default tier."""
+        evaluator = PermissionEvaluator(
+            config=PermissionConfig(tiers=[], rules=[]),
+            default_tier=PermissionTier.NOTIFY,
+        )
+        assert evaluator.evaluate("mcp__reachy__nod").tier == PermissionTier.NOTIFY
+
+    def test_literal_rule_before_wildcard_wins(self) -> None:
+        """An exact-name rule listed first should beat a later wildcard."""
+        config = PermissionConfig(
+            tiers=[],
+            rules=[
+                PermissionRule(pattern="test__specific", tier=1, reason="specific"),
+                PermissionRule(pattern="test__*", tier=2, reason="broad"),
+            ],
+        )
+        evaluator = PermissionEvaluator(config=config)
+
+        assert evaluator.evaluate("test__specific").tier == PermissionTier.AUTONOMOUS
+        assert evaluator.evaluate("test__other").tier == PermissionTier.NOTIFY
+
     def test_add_rule(self, permission_evaluator: PermissionEvaluator) -> None:
         """Test adding a new rule."""
         new_rule = PermissionRule(
@@ -178,6 +297,25 @@ class TestPermissionEvaluator:
         decision = permission_evaluator.evaluate("mcp__reachy__move_head")
         assert decision.tier == PermissionTier.CONFIRM  # Default tier
 
+    def test_remove_rule_duplicates_and_missing(self) -> None:
+        """Removing a pattern drops every copy; unknown patterns are a no-op."""
+        config = PermissionConfig(
+            tiers=[],
+            rules=[
+                PermissionRule(pattern="a__*", tier=1, reason="first"),
+                PermissionRule(pattern="b", tier=2, reason="b"),
+                PermissionRule(pattern="a__*", tier=4, reason="second"),
+            ],
+        )
+        evaluator = PermissionEvaluator(config=config)
+
+        assert not evaluator.remove_rule("missing")
+        assert evaluator.remove_rule("a__*")
+        assert not evaluator.remove_rule("a__*")
+
+        assert evaluator.evaluate("a__x").matched_rule is None
+        assert evaluator.evaluate("b").reason == "b"
+
 
 class TestPermissionDecision:
     """Tests for PermissionDecision."""
@@ -234,6 +372,20 @@ class TestPermissionDecision:
         assert not decision.needs_confirmation
         assert decision.should_notify
 
+    def test_decision_is_immutable(self) -> None:
+        """Cached decisions and tier behaviors must not be mutable."""
+        decision = PermissionDecision(
+            tool_name="test",
+            tier=PermissionTier.AUTONOMOUS,
+            behavior=TIER_BEHAVIORS[PermissionTier.AUTONOMOUS],
+            reason="test",
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            decision.tier = PermissionTier.FORBIDDEN  # type: ignore[misc]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            decision.behavior.execute = False  # type: ignore[misc]
+
 
 class TestPermissionConfig:
     """Tests for PermissionConfig loading."""
@@ -276,3 +428,21 @@ rules:
         assert len(config.tiers) == 1
         assert len(config.rules) == 1
         assert config.rules[0].pattern == "test__*"
+
+    def test_from_yaml_rejects_invalid_tier(self, tmp_path) -> None:
+        """Out-of-range tiers should fail validation when loading."""
+        config_path = tmp_path / "permissions.yaml"
+        config_path.write_text("""
+rules:
+  - pattern: "test__*"
+    tier: 5
+    reason: "Bad tier"
+""")
+
+        with pytest.raises(ValidationError, match="tier must be between 1 and 4"):
+            PermissionConfig.from_yaml(config_path)
+
+    def test_rule_rejects_invalid_tier(self) -> None:
+        """Directly constructed rules should validate their tier."""
+        with pytest.raises(ValueError, match="tier must be between 1 and 4"):
+            PermissionRule(pattern="test", tier=0, reason="bad")
@@ -9,6 +9,8 @@ Tests cover:
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
 
 from reachy_agent.voice.persona import (
@@ -187,6 +189,19 @@ class TestPersonaConfig:
         persona_set = {config1}
         assert config2 in persona_set
 
+    def test_frozen(self) -> None:
+        """Test that a persona cannot be modified after validation."""
+        config = PersonaConfig(
+            name="motoko",
+            wake_word_model="hey_motoko",
+            voice="nova",
+            display_name="Major Kusanagi",
+            prompt_path="prompts/personas/motoko.md",
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.voice = "not-a-voice"  # type: ignore[misc]
+
 
 class TestPersonaConfigFromDict:
     """Tests for PersonaConfig.from_dict factory method."""
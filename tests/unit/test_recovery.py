@@ -9,6 +9,7 @@ Tests:
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 from unittest.mock import MagicMock
 
 import pytest
@@ -353,3 +354,11 @@ class TestDegradedModeConfig:
 
         assert config.skip_wake_word_on_failure is False
         assert config.use_energy_vad_fallback is False
+
+    def test_frozen_and_hashable(self) -> None:
+        """Config is immutable and usable as a dict key."""
+        config = DegradedModeConfig()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.skip_stt_on_failure = False  # type: ignore[misc]
+        assert {config: "default"}[DegradedModeConfig()] == "default"
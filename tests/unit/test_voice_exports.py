@@ -0,0 +1,42 @@
+"""Tests for the lazily-resolved reachy_agent.voice package exports."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import reachy_agent.voice as voice
+
+
+class TestVoiceExports:
+    """Test PEP 562 lazy exports of the voice package."""
+
+    @pytest.mark.parametrize("name", voice.__all__)
+    def test_all_exports_resolve(self, name: str) -> None:
+        """Test every name in __all__ resolves to its submodule object."""
+        value = getattr(voice, name)
+
+        assert value is not None
+        assert name in vars(voice)
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'Nope'"):
+            _ = voice.Nope
+
+    def test_light_submodule_does_not_load_backends(self) -> None:
+        """Test importing persona does not import the audio stack."""
+        code = (
+            "import sys, reachy_agent.voice.persona; "
+            "print('reachy_agent.voice.audio' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "False"